@@ -5,9 +5,10 @@ import warnings
 USE_NUMBA = True
 
 try:
-    from numba import njit
+    from numba import njit, prange
 except ImportError:
     USE_NUMBA = False
+    prange = range  # type: ignore[assignment,misc]
 
     # https://stackoverflow.com/a/73275170/9967707
     def njit(f=None, *args, **kwargs):
@@ -0,0 +1,69 @@
+"""
+Command line tool to convert pridb, tradb and trfdb files to Parquet or Feather datasets.
+
+Usage: ``python -m vallenae.convert --help``
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .io import convert_to_dataset
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m vallenae.convert",
+        description=(
+            "Convert pridb, tradb and trfdb files to Parquet or Feather datasets. "
+            "Repeated conversions resume after the last converted SetID/TRAI."
+        ),
+    )
+    parser.add_argument("database", nargs="+", type=Path, help="pridb, tradb or trfdb files")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path(),
+        help="output directory, each database is converted to <output>/<name>_<type>",
+    )
+    parser.add_argument("--format", choices=("parquet", "feather"), default="parquet")
+    parser.add_argument(
+        "--time-bucket",
+        type=float,
+        default=3600,
+        help="time span of time bucket partitions in seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None, help="number of SetIDs/TRAIs read at once"
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=100_000,
+        help="maximum number of rows per row group (default: %(default)s)",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="hide progress bars")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO)
+    for database in args.database:
+        output = args.output / f"{database.stem}_{database.suffix.lstrip('.')}"
+        result = convert_to_dataset(
+            database,
+            output,
+            file_format=args.format,
+            time_bucket=args.time_bucket,
+            chunk_size=args.chunk_size,
+            row_group_size=args.row_group_size,
+            show_progress=not args.quiet,
+        )
+        if not args.quiet:
+            print(f"{database} -> {output}: {result.records} (last index: {result.last_index})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,46 @@ Acoustic Emission
     counts
     rms
 
+All features can be computed at once (in a single pass) with:
+
+.. autosummary::
+    :toctree: features
+    :nosignatures:
+
+    compute_all
+    HitFeatures
+
+Batch processing
+----------------
+
+Compute features of multiple signals at once, e.g. of the zero-padded (N, samples) matrix of
+`vallenae.io.TraBatch` returned by `vallenae.io.TraDatabase.iread_batches`.
+
+.. autosummary::
+    :toctree: features
+
+    peak_amplitude_batch
+    peak_amplitude_index_batch
+    first_threshold_crossing_batch
+    rise_time_batch
+    energy_batch
+    signal_strength_batch
+    counts_batch
+    rms_batch
+
+Feature extraction
+------------------
+
+Compute features of all transient data records of a tradb with multiple processes
+and write them to a trfdb.
+
+.. autosummary::
+    :toctree: features
+    :nosignatures:
+
+    extract_features
+    FeatureExtractionResult
+
 Conversion
 ----------
 
@@ -31,6 +71,8 @@ Conversion
 # flake8: noqa
 
 from .acoustic_emission import *
+from .batch import *
 from .conversion import *
+from .extraction import FeatureExtractionResult, extract_features
 
 __all__ = [_ for _ in dir() if not _.startswith("_")]
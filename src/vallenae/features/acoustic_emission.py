@@ -1,7 +1,10 @@
-from typing import Optional
+import math
+from typing import NamedTuple, Optional
 
 import numpy as np
 
+from .._numba import USE_NUMBA, njit
+
 
 def peak_amplitude(data: np.ndarray) -> float:
     """
@@ -155,3 +158,100 @@ def rms(data: np.ndarray) -> float:
         https://en.wikipedia.org/wiki/Root_mean_square
     """
     return np.sqrt(np.mean(data**2))
+
+
+class HitFeatures(NamedTuple):
+    """Acoustic emission features of a hit computed by `compute_all`."""
+
+    peak_amplitude: float  #: Peak amplitude
+    peak_amplitude_index: int  #: Index of peak amplitude
+    first_threshold_crossing: Optional[int]  #: Index of first threshold crossing
+    rise_time: float  #: Rise time in seconds
+    energy: float  #: Energy in eu (1e-14 V²s)
+    signal_strength: float  #: Signal strength in nVs
+    counts: int  #: Number of positive threshold crossings
+    rms: float  #: Root mean square (RMS)
+
+
+@njit
+def _compute_all_numba(data: np.ndarray, threshold: float, samplerate: int):
+    peak = -1.0
+    index_peak = 0
+    first_crossing = -1
+    squaresum = 0.0
+    abssum = 0.0
+    counts_ = 0
+    previous_above = True  # ignore if first sample is above threshold
+    for i in range(len(data)):
+        value = float(data[i])
+        value_abs = abs(value)
+        if value_abs > peak:
+            peak = value_abs
+            index_peak = i
+        if first_crossing < 0 and value_abs >= threshold:
+            first_crossing = i
+        above = value >= threshold
+        if above and not previous_above:
+            counts_ += 1
+        previous_above = above
+        squaresum += value * value
+        abssum += value_abs
+
+    rise_time_ = (index_peak - first_crossing) / samplerate if first_crossing >= 0 else 0.0
+    return (
+        peak,
+        index_peak,
+        first_crossing,
+        rise_time_,
+        squaresum * 1e14 / samplerate,
+        abssum * 1e9 / samplerate,
+        counts_,
+        math.sqrt(squaresum / len(data)),
+    )
+
+
+def _compute_all_numpy(data: np.ndarray, threshold: float, samplerate: int):
+    data_abs = np.abs(data)
+    index_peak = int(np.argmax(data_abs))
+    first_crossing = first_threshold_crossing(data, threshold)
+    squaresum = np.sum(np.square(data, dtype=np.float64))
+    return (
+        float(data_abs[index_peak]),
+        index_peak,
+        -1 if first_crossing is None else int(first_crossing),
+        rise_time(data, threshold, samplerate, first_crossing, index_peak),
+        squaresum * 1e14 / samplerate,
+        np.sum(data_abs, dtype=np.float64) * 1e9 / samplerate,
+        int(counts(data, threshold)),
+        math.sqrt(squaresum / len(data)),
+    )
+
+
+def compute_all(data: np.ndarray, threshold: float, samplerate: int) -> HitFeatures:
+    """
+    Compute all acoustic emission features of a hit at once.
+
+    Features are computed in a single pass over the input array if Numba is available
+    (instead of separate passes for each feature).
+
+    Args:
+        data: Input array (hit)
+        threshold: Threshold amplitude (in volts)
+        samplerate: Sample rate of the input array in Hz
+
+    Returns:
+        Acoustic emission features
+
+    Raises:
+        ValueError: If the input array is empty
+    """
+    if len(data) == 0:
+        raise ValueError("Input array must not be empty")
+    if USE_NUMBA:
+        result = _compute_all_numba(data, threshold, samplerate)
+    else:
+        result = _compute_all_numpy(data, threshold, samplerate)
+    features = HitFeatures(*result)
+    if result[2] < 0:  # threshold not exceeded
+        return features._replace(first_threshold_crossing=None)
+    return features
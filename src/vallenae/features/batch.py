@@ -0,0 +1,272 @@
+from typing import Optional, Union
+
+import numpy as np
+
+from .._numba import USE_NUMBA, njit, prange
+
+_ArrayOrScalar = Union[np.ndarray, float]
+
+
+def _column(value: _ArrayOrScalar) -> Union[np.ndarray, float]:
+    """Convert per-row values to column vector for broadcasting with (N, samples) matrices."""
+    if np.ndim(value) == 0:
+        return value
+    return np.asarray(value)[:, np.newaxis]
+
+
+def _valid_mask(data: np.ndarray, lengths: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """Mask of valid samples (N, samples) or None if all samples are valid."""
+    if data.ndim != 2:
+        raise ValueError(f"Input must be a 2D array (N, samples), got {data.ndim}D array")
+    if lengths is None:
+        return None
+    lengths = np.asarray(lengths)
+    if lengths.shape != (data.shape[0],):
+        raise ValueError(f"Lengths must be of shape ({data.shape[0]},), got {lengths.shape}")
+    return np.arange(data.shape[1]) < lengths[:, np.newaxis]
+
+
+def _masked(values: np.ndarray, valid: Optional[np.ndarray], fill_value=0) -> np.ndarray:
+    if valid is None:
+        return values
+    return np.where(valid, values, fill_value)
+
+
+def _row_lengths(data: np.ndarray, lengths: Optional[np.ndarray]) -> np.ndarray:
+    """Validate input matrix and return number of valid samples per row."""
+    if data.ndim != 2:
+        raise ValueError(f"Input must be a 2D array (N, samples), got {data.ndim}D array")
+    if lengths is None:
+        return np.full(data.shape[0], data.shape[1], dtype=np.intp)
+    lengths = np.asarray(lengths, dtype=np.intp)
+    if lengths.shape != (data.shape[0],):
+        raise ValueError(f"Lengths must be of shape ({data.shape[0]},), got {lengths.shape}")
+    if np.any(lengths < 0) or np.any(lengths > data.shape[1]):
+        raise ValueError(f"Lengths must be within [0, {data.shape[1]}]")
+    return lengths
+
+
+@njit(parallel=True)
+def _squaresum_batch_numba(data: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    result = np.zeros(data.shape[0])
+    for i in prange(data.shape[0]):  # pylint: disable=not-an-iterable
+        squaresum = 0.0
+        for j in range(lengths[i]):
+            value = float(data[i, j])
+            squaresum += value * value
+        result[i] = squaresum
+    return result
+
+
+@njit(parallel=True)
+def _abssum_batch_numba(data: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    result = np.zeros(data.shape[0])
+    for i in prange(data.shape[0]):  # pylint: disable=not-an-iterable
+        abssum = 0.0
+        for j in range(lengths[i]):
+            abssum += abs(float(data[i, j]))
+        result[i] = abssum
+    return result
+
+
+def _squaresum_batch(data: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Sum of squared valid samples per row, computed in float64 (no overflow of int16 input)."""
+    if USE_NUMBA:
+        return _squaresum_batch_numba(data, lengths)
+    squares = np.square(data, dtype=np.float64)
+    return np.sum(_masked(squares, _valid_mask(data, lengths)), axis=1)
+
+
+def _abssum_batch(data: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Sum of absolute valid samples per row, computed in float64."""
+    if USE_NUMBA:
+        return _abssum_batch_numba(data, lengths)
+    absolutes = np.abs(data, dtype=np.float64)
+    return np.sum(_masked(absolutes, _valid_mask(data, lengths)), axis=1)
+
+
+def peak_amplitude_batch(data: np.ndarray, lengths: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute maximum absolute amplitudes of multiple signals.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+
+    Returns:
+        Peak amplitudes (N,)
+    """
+    valid = _valid_mask(data, lengths)
+    if data.shape[1] == 0:
+        return np.zeros(data.shape[0], dtype=data.dtype)
+    return np.max(_masked(np.abs(data), valid), axis=1)
+
+
+def peak_amplitude_index_batch(
+    data: np.ndarray, lengths: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Compute indexes of peak amplitudes of multiple signals.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+
+    Returns:
+        Indexes of peak amplitudes (N,)
+    """
+    valid = _valid_mask(data, lengths)
+    if data.shape[1] == 0:
+        return np.zeros(data.shape[0], dtype=np.intp)
+    return np.argmax(_masked(np.abs(data), valid, -1), axis=1)
+
+
+def first_threshold_crossing_batch(
+    data: np.ndarray,
+    threshold: _ArrayOrScalar,
+    lengths: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute indexes of first threshold crossings of multiple signals.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        threshold: Threshold amplitude, scalar or per row (N,), e.g. `TraBatch.threshold`
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+
+    Returns:
+        Indexes of first threshold crossings (N,). -1 if threshold was not exceeded
+    """
+    valid = _valid_mask(data, lengths)
+    if data.shape[1] == 0:
+        return np.full(data.shape[0], -1, dtype=np.intp)
+    above_threshold = _masked(np.abs(data) >= _column(threshold), valid, False)
+    index = np.argmax(above_threshold, axis=1)
+    return np.where(np.any(above_threshold, axis=1), index, -1)
+
+
+def rise_time_batch(
+    data: np.ndarray,
+    threshold: _ArrayOrScalar,
+    samplerate: _ArrayOrScalar,
+    lengths: Optional[np.ndarray] = None,
+    *,
+    first_crossing: Optional[np.ndarray] = None,
+    index_peak: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute the rise times of multiple signals.
+
+    The rise time is the time between the first threshold crossing and the peak amplitude.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        threshold: Threshold amplitude (in volts), scalar or per row (N,)
+        samplerate: Sample rate in Hz, scalar or per row (N,)
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+        first_crossing: Precomputed indexes of first threshold crossing to save computation time
+        index_peak: Precomputed indexes of peak amplitude to save computation time
+
+    Returns:
+        Rise times in seconds (N,). 0 if threshold was not exceeded
+    """
+    if first_crossing is None:
+        first_crossing = first_threshold_crossing_batch(data, threshold, lengths)
+    if index_peak is None:
+        index_peak = peak_amplitude_index_batch(data, lengths)
+    return np.where(first_crossing >= 0, (index_peak - first_crossing) / samplerate, 0.0)
+
+
+def energy_batch(
+    data: np.ndarray,
+    samplerate: _ArrayOrScalar,
+    lengths: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute the energies of multiple signals (hits).
+
+    Energy is the integral of the squared AE-signal over time (EN 1330-9).
+    The unit of energy is eu. 1 eu corresponds to 1e-14 V²s.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        samplerate: Sample rate in Hz, scalar or per row (N,)
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+
+    Returns:
+        Energies (N,)
+    """
+    squaresum = _squaresum_batch(data, _row_lengths(data, lengths))
+    return np.divide(squaresum * 1e14, samplerate)
+
+
+def signal_strength_batch(
+    data: np.ndarray,
+    samplerate: _ArrayOrScalar,
+    lengths: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute the signal strengths of multiple signals (hits).
+
+    Signal strength is the integral of the rectified AE-signal over time.
+    The unit of Signal Strength is nVs (1e-9 Vs).
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        samplerate: Sample rate in Hz, scalar or per row (N,)
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+
+    Returns:
+        Signal strengths (N,)
+    """
+    abssum = _abssum_batch(data, _row_lengths(data, lengths))
+    return np.divide(abssum * 1e9, samplerate)
+
+
+def counts_batch(
+    data: np.ndarray,
+    threshold: _ArrayOrScalar,
+    lengths: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute the number of positive threshold crossings of multiple signals (hits).
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        threshold: Threshold amplitude, scalar or per row (N,), e.g. `TraBatch.threshold`
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+
+    Returns:
+        Number of positive threshold crossings (N,)
+    """
+    valid = _valid_mask(data, lengths)
+    above_positive_threshold = _masked(data >= _column(threshold), valid, False)
+    return np.count_nonzero(
+        ~above_positive_threshold[:, :-1] & above_positive_threshold[:, 1:],
+        axis=1,
+    )
+
+
+def rms_batch(data: np.ndarray, lengths: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute the root mean square (RMS) of multiple signals.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+
+    Returns:
+        RMS values (N,). NaN for empty rows
+    """
+    lengths = _row_lengths(data, lengths)
+    squaresum = _squaresum_batch(data, lengths)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.sqrt(squaresum / lengths)
@@ -0,0 +1,178 @@
+import logging
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from tqdm import tqdm
+
+from ..io import FeatureRecord, TraDatabase, TraRecord, TrfDatabase
+
+logger = logging.getLogger(__name__)
+
+FeatureFunction = Callable[[TraRecord], Dict[str, float]]
+
+
+class FeatureExtractionResult(NamedTuple):
+    """Summary of `extract_features`."""
+
+    records: int  #: Number of processed transient data records
+    seconds: float  #: Elapsed time in seconds
+    workers: int  #: Number of worker processes
+
+    @property
+    def records_per_second(self) -> float:
+        """Throughput in records per second."""
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+
+# state of worker processes (initialized by _init_worker)
+_worker_tradb: Optional[TraDatabase] = None
+_worker_functions: Sequence[FeatureFunction] = ()
+_worker_query_filter: Optional[str] = None
+
+
+def _init_worker(
+    tradb_path: str,
+    functions: Sequence[FeatureFunction],
+    query_filter: Optional[str],
+):
+    """Open read-only tradb connection once per worker."""
+    global _worker_tradb, _worker_functions, _worker_query_filter  # noqa: PLW0603
+    _worker_tradb = TraDatabase(tradb_path)
+    _worker_functions = functions
+    _worker_query_filter = query_filter
+
+
+def _extract_features(
+    tradb: TraDatabase,
+    functions: Sequence[FeatureFunction],
+    query_filter: Optional[str],
+    trai_range: Tuple[int, int],
+) -> List[FeatureRecord]:
+    """Read transient data records of TRAI range [start, stop) and compute features."""
+    trai_start, trai_stop = trai_range
+    query_filter_range = f"TRAI >= {trai_start} AND TRAI < {trai_stop}"
+    if query_filter:
+        query_filter_range = f"{query_filter_range} AND ({query_filter})"
+
+    results = []
+    for tra in tradb.iread(query_filter=query_filter_range):
+        assert tra.trai is not None
+        features: Dict[str, float] = {}
+        for function in functions:
+            features.update(function(tra))
+        results.append(FeatureRecord(trai=tra.trai, features=features))
+    return results
+
+
+def _extract_range(trai_range: Tuple[int, int]) -> List[FeatureRecord]:
+    """Compute features of TRAI range [start, stop) in worker process."""
+    assert _worker_tradb is not None
+    return _extract_features(_worker_tradb, _worker_functions, _worker_query_filter, trai_range)
+
+
+def _trai_ranges(tradb: TraDatabase, chunk_size: int) -> List[Tuple[int, int]]:
+    """Split TRAI range of tradb into chunks [start, stop)."""
+    trai_min, trai_max = (
+        tradb.connection()
+        .execute("SELECT MIN(TRAI), MAX(TRAI) FROM tr_data WHERE TRAI > 0")
+        .fetchone()
+    )
+    if trai_min is None:
+        return []
+    return [
+        (start, min(start + chunk_size, trai_max + 1))
+        for start in range(trai_min, trai_max + 1, chunk_size)
+    ]
+
+
+def extract_features(
+    tradb: Union[str, Path],
+    trfdb: Union[str, Path],
+    functions: Sequence[FeatureFunction],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    query_filter: Optional[str] = None,
+    show_progress: bool = True,
+) -> FeatureExtractionResult:
+    """
+    Compute features of all transient data records in a tradb and write them to a trfdb.
+
+    The TRAI range of the tradb is split into chunks that are processed by multiple worker
+    processes. Each worker opens its own read-only connection to the tradb, so only the
+    computed features are sent between processes. The features are written by the main
+    process in bulk (one transaction per chunk).
+
+    Example:
+        >>> def peak_amplitude(tra: vae.io.TraRecord) -> Dict[str, float]:
+        ...     return {"PeakAmp": vae.features.peak_amplitude(tra.data)}
+        ...
+        >>> result = vae.features.extract_features("data.tradb", "data.trfdb", [peak_amplitude])
+        >>> print(f"{result.records_per_second:.0f} records/s")
+
+    Args:
+        tradb: Path to tradb
+        trfdb: Path to trfdb, the database will be created if it does not exist
+        functions: Feature functions that take a `TraRecord` and return a dict of features
+            (feature name -> value). The functions must be picklable (defined at module level)
+            if multiple workers are used
+        workers: Number of worker processes. Use number of CPUs if `None`.
+            Compute in the main process if 0 or 1
+        chunk_size: Number of TRAIs per chunk (task of a worker)
+        query_filter: Optional query filter provided as SQL clause,
+            e.g. "Chan == 1 AND Samples >= 1024"
+        show_progress: Show progress bar. Default: `True`
+
+    Returns:
+        Summary with number of processed records and throughput
+    """
+    if not functions:
+        raise ValueError("At least one feature function is required")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be greater than 0")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    tradb_path = str(tradb)
+    with TraDatabase(tradb_path) as tradb_:
+        trai_ranges = _trai_ranges(tradb_, chunk_size)
+
+    time_start = time.perf_counter()
+    records = 0
+
+    progress = tqdm(total=len(trai_ranges), desc="Chunks", disable=not show_progress)
+    with TrfDatabase(str(trfdb), mode="rwc") as trfdb_, progress:
+        if workers <= 1:
+            with TraDatabase(tradb_path) as tradb_:
+                for trai_range in trai_ranges:
+                    feature_records = _extract_features(tradb_, functions, query_filter, trai_range)
+                    records += trfdb_.write_many(feature_records)
+                    progress.update()
+        else:
+            # spawn workers (default on Windows): forking is unsafe with threads of the parent
+            # process, e.g. SQLite connections or the Numba threading layer
+            with multiprocessing.get_context("spawn").Pool(
+                workers,
+                initializer=_init_worker,
+                initargs=(tradb_path, functions, query_filter),
+            ) as pool:
+                for feature_records in pool.imap_unordered(_extract_range, trai_ranges):
+                    records += trfdb_.write_many(feature_records)
+                    progress.update()
+
+    result = FeatureExtractionResult(
+        records=records,
+        seconds=time.perf_counter() - time_start,
+        workers=max(workers, 1),
+    )
+    logger.info(
+        "Extracted features of %d records in %.2f s (%.0f records/s, %d workers)",
+        result.records,
+        result.seconds,
+        result.records_per_second,
+        result.workers,
+    )
+    return result
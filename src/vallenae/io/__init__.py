@@ -16,6 +16,10 @@ Classes to read/write pridb, tradb and trfdb database files.
     PriDatabase
     TraDatabase
     TrfDatabase
+    BackgroundWriter
+    TimeIndex
+    IndexReport
+    listen_joined
 
 All database classes implement two different interfaces to access data:
 
@@ -52,6 +56,17 @@ All database classes implement two different interfaces to access data:
     >>> type(hit)
     <class 'vallenae.io.datatypes.HitRecord'>
 
+**Arrow** ``read_*_arrow``
+
+    Read data to `pyarrow.Table` (requires the optional dependency pyarrow),
+    e.g. with `PriDatabase.read_hits_arrow`.
+    The data is read in record batches and missing values are stored as nulls.
+    Arrow tables can be passed to pandas or polars without copying:
+
+    >>> table = pridb.read_hits_arrow()
+    >>> df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    >>> df = polars.from_arrow(table)
+
 
 .. _datatypes:
 
@@ -71,12 +86,30 @@ row dictionary (column name: value).
     StatusRecord
     ParametricRecord
     TraRecord
+    TraBatch
+    ContinuousWaveChunk
+    TimeAxis
     FeatureRecord
+    JoinedRecord
 
     SetType
     HitFlags
     StatusFlags
 
+Conversion
+----------
+
+Convert databases to Parquet or Feather datasets for analytics tools
+(requires the optional dependency pyarrow).
+Also available as command line tool: ``python -m vallenae.convert --help``
+
+.. autosummary::
+    :toctree: io
+    :nosignatures:
+
+    convert_to_dataset
+    ConversionResult
+
 Compression
 -----------
 
@@ -100,5 +133,10 @@ from .pridb import *
 from .tradb import *
 from .trfdb import *
 from .types import *
+from ._writer import BackgroundWriter
+from ._listen import listen_joined
+from ._convert import ConversionResult, convert_to_dataset
+from ._timeindex import TimeIndex
+from ._database import IndexReport
 
 __all__ = [_ for _ in dir() if not _.startswith("_")]
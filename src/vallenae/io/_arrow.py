@@ -0,0 +1,150 @@
+"""Optional Apache Arrow (pyarrow) support."""
+
+import sqlite3
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from tqdm import tqdm
+
+from ._dataframe import ColumnSpec
+from ._sql import ColumnIndex, count_sql_results, sql_column_values
+from .compression import decode_data_blob
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def import_pyarrow():
+    """
+    Import pyarrow (optional dependency).
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+    except ImportError:
+        raise ImportError("Arrow support requires pyarrow (pip install pyarrow)") from None
+    return pa
+
+
+def _arrow_type(spec: ColumnSpec) -> "pa.DataType":
+    pa = import_pyarrow()
+    return pa.int64() if spec.integer else pa.float64()
+
+
+def empty_arrow_table(columns: Sequence[ColumnSpec]) -> "pa.Table":
+    """Create empty Arrow table with given columns."""
+    pa = import_pyarrow()
+    return pa.table({spec.field: pa.array([], type=_arrow_type(spec)) for spec in columns})
+
+
+def _to_arrow_array(values: Sequence[Any], spec: ColumnSpec) -> "pa.Array":
+    """Convert column values of a batch to Arrow array, `None` values are masked as nulls."""
+    pa = import_pyarrow()
+    array = pa.array(values, type=_arrow_type(spec))
+    if spec.divisor is not None:
+        import pyarrow.compute as pc  # noqa: PLC0415
+
+        array = pc.divide(array, pa.scalar(spec.divisor, type=pa.float64()))
+    return array
+
+
+def blobs_to_arrow_array(
+    data_blobs: Sequence[Optional[bytes]],
+    data_formats: Sequence[int],
+    factors_millivolts: Sequence[float],
+    *,
+    raw: bool = False,
+) -> "pa.Array":
+    """
+    Decode data BLOBs of a batch to Arrow list array (`large_list<float32>` or `int16` if raw).
+
+    The signals are stored in a single contiguous buffer with offsets.
+    Missing BLOBs are represented as empty lists.
+    """
+    pa = import_pyarrow()
+    dtype = np.int16 if raw else np.float32
+    signals = [
+        decode_data_blob(data_blob, data_formats[i], factors_millivolts[i], raw=raw)
+        if data_blob is not None
+        else np.empty(0, dtype=dtype)
+        for i, data_blob in enumerate(data_blobs)
+    ]
+    offsets = np.zeros(len(signals) + 1, dtype=np.int64)
+    np.cumsum([len(signal) for signal in signals], out=offsets[1:])
+    values = np.concatenate(signals) if signals else np.empty(0, dtype=dtype)
+    return pa.LargeListArray.from_arrays(pa.array(offsets), pa.array(values))
+
+
+#: Function to create additional Arrow columns (name -> array) of a batch of rows
+BatchColumns = Callable[[List[Tuple]], Dict[str, "pa.Array"]]
+
+
+def query_to_arrow(
+    connection: sqlite3.Connection,
+    query: str,
+    columns: Sequence[ColumnSpec],
+    *,
+    extra_columns: Optional[Callable[[ColumnIndex], BatchColumns]] = None,
+    show_progress: bool = True,
+    desc: str = "",
+    arraysize: int = 10_000,
+) -> "pa.Table":
+    """
+    Read SQL query results column-wise to `pyarrow.Table`.
+
+    Rows are fetched in batches and converted to Arrow record batches.
+    `NULL` values are stored as validity bitmaps (no nullable dtype conversions).
+    Columns of the resulting table are named and converted like the columns of
+    `query_to_dataframe`, empty columns are dropped.
+
+    Args:
+        connection: SQLite connection
+        query: SELECT query
+        columns: Column specifications, defines order and conversion of the output columns.
+            Columns missing in the result set are skipped
+        extra_columns: Function that takes the column indexes of the result set and returns a
+            function to create additional columns for each batch of rows (e.g. decoded BLOBs)
+        show_progress: Show progress bar. Default: `True`
+        desc: Description shown left to the progress bar
+        arraysize: Number of rows fetched per batch (rows per record batch)
+
+    Returns:
+        Arrow table
+    """
+    pa = import_pyarrow()
+    rows_expected = count_sql_results(connection, query) if show_progress else None
+    cur = connection.execute(query)
+    result_columns = {column[0]: index for index, column in enumerate(cur.description)}
+    specs = [
+        (result_columns[spec.sql_column], spec)
+        for spec in columns
+        if spec.sql_column in result_columns
+    ]
+    create_extra_columns = extra_columns(result_columns) if extra_columns else None
+
+    batches = []
+    with tqdm(total=rows_expected, desc=desc, disable=not show_progress) as progress:
+        while True:
+            rows = cur.fetchmany(arraysize)
+            if not rows:
+                break
+            names = [spec.field for _, spec in specs]
+            arrays = [
+                _to_arrow_array(sql_column_values(rows, index), spec) for index, spec in specs
+            ]
+            if create_extra_columns:
+                for name, array in create_extra_columns(rows).items():
+                    names.append(name)
+                    arrays.append(array)
+            batches.append(pa.RecordBatch.from_arrays(arrays, names=names))
+            progress.update(len(rows))
+
+    if not batches:
+        return empty_arrow_table([spec for _, spec in specs])
+    table = pa.Table.from_batches(batches)
+    # drop empty columns (same as DataFrame readers)
+    return table.select(
+        [name for name in table.column_names if table[name].null_count < table.num_rows]
+    )
@@ -0,0 +1,268 @@
+import base64
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from tqdm import tqdm
+
+from ._arrow import import_pyarrow
+from ._database import Database
+from .pridb import PriDatabase
+from .tradb import TraDatabase
+from .trfdb import TrfDatabase
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+_STATE_FILENAME = "_vallenae_convert.json"  # ignored by pyarrow dataset discovery (prefix _)
+_FILE_FORMATS = {"parquet": "parquet", "feather": "feather"}  # file format -> extension
+
+
+class ConversionResult(NamedTuple):
+    """Summary of `convert_to_dataset`."""
+
+    records: Dict[str, int]  #: Number of converted records per dataset (e.g. "hits")
+    last_index: Optional[int]  #: Last converted SetID (pridb) or TRAI (tradb, trfdb)
+
+
+class _Dataset(NamedTuple):
+    """Dataset of a database, read by query filter."""
+
+    name: str
+    read: Callable[[str], "pa.Table"]
+    partitioned: bool  #: Partition by channel and time bucket
+
+
+def _open_database(filename: Path) -> Database:
+    databases = {".pridb": PriDatabase, ".tradb": TraDatabase, ".trfdb": TrfDatabase}
+    try:
+        database_type = databases[filename.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown database type of '{filename}', use: {list(databases)}") from None
+    return database_type(filename)
+
+
+def _datasets(database: Database) -> List[_Dataset]:
+    if isinstance(database, PriDatabase):
+        return [
+            _Dataset(
+                "hits",
+                lambda query_filter: database.read_hits_arrow(
+                    query_filter=query_filter, show_progress=False
+                ),
+                partitioned=True,
+            ),
+            _Dataset(
+                "status",
+                lambda query_filter: database.read_status_arrow(
+                    query_filter=query_filter, show_progress=False
+                ),
+                partitioned=True,
+            ),
+        ]
+    if isinstance(database, TraDatabase):
+        return [
+            _Dataset(
+                "tra",
+                lambda query_filter: database.read_arrow(
+                    query_filter=query_filter, raw=True, show_progress=False
+                ),
+                partitioned=True,
+            )
+        ]
+    if isinstance(database, TrfDatabase):
+        return [
+            _Dataset(
+                "features",
+                lambda query_filter: database.read_arrow(
+                    query_filter=query_filter, show_progress=False
+                ),
+                partitioned=False,  # no channel and time information
+            )
+        ]
+    raise ValueError(f"Unsupported database type {type(database)}")
+
+
+def _serialize_schema(schema: "pa.Schema") -> str:
+    return base64.b64encode(schema.serialize().to_pybytes()).decode("ascii")
+
+
+def _deserialize_schema(value: str) -> "pa.Schema":
+    pa = import_pyarrow()
+    return pa.ipc.read_schema(pa.py_buffer(base64.b64decode(value)))
+
+
+def _read_state(path: Path, source: Path) -> Tuple[Optional[int], Dict[str, "pa.Schema"]]:
+    """Read last converted index and dataset schemas of previous conversions."""
+    if not path.exists():
+        return None, {}
+    state = json.loads(path.read_text("utf-8"))
+    if state["source"] != source.name:
+        raise ValueError(
+            f"Output directory contains a conversion of another database ({state['source']})"
+        )
+    schemas = {
+        name: _deserialize_schema(value) for name, value in state.get("schemas", {}).items()
+    }
+    return state["last_index"], schemas
+
+
+def _write_state(
+    path: Path,
+    source: Path,
+    index_column: str,
+    last_index: int,
+    schemas: Dict[str, "pa.Schema"],
+):
+    state = {
+        "source": source.name,
+        "index_column": index_column,
+        "last_index": last_index,
+        "schemas": {name: _serialize_schema(schema) for name, schema in schemas.items()},
+    }
+    path_tmp = path.with_suffix(".tmp")
+    path_tmp.write_text(json.dumps(state, indent=2), "utf-8")
+    path_tmp.replace(path)  # atomic
+
+
+def _conform_to_schema(
+    table: "pa.Table", schema: "pa.Schema"
+) -> Tuple["pa.Table", "pa.Schema"]:
+    """
+    Cast table of a chunk to the dataset schema.
+
+    The readers drop empty columns, so missing columns are added as nulls.
+    New columns (e.g. new features of a trfdb) are appended to the schema.
+    """
+    pa = import_pyarrow()
+    for field in table.schema:
+        if field.name not in schema.names:
+            schema = schema.append(field)
+    arrays = [
+        (
+            table[field.name].cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+        )
+        for field in schema
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema), schema
+
+
+def convert_to_dataset(
+    database: Union[str, Path],
+    output: Union[str, Path],
+    *,
+    file_format: str = "parquet",
+    time_bucket: float = 3600,
+    chunk_size: Optional[int] = None,
+    row_group_size: int = 100_000,
+    show_progress: bool = True,
+) -> ConversionResult:
+    """
+    Convert pridb, tradb or trfdb to Parquet or Feather datasets (requires pyarrow).
+
+    The records are read in chunks of SetIDs (pridb) or TRAIs (tradb, trfdb) and written to
+    datasets in the output directory:
+
+    - pridb: `hits` and `status`
+    - tradb: `tra` with transient signals as int16 ADC values (column `data`) and the
+      conversion factor to millivolts (column `factor_millivolts`)
+    - trfdb: `features`
+
+    The datasets of pridb and tradb are partitioned by channel and time bucket
+    (hive partitioning, e.g. `hits/channel=1/time_bucket=0/part-1-0.parquet`).
+    All files of a dataset share the same schema, columns without values in a chunk are
+    written as nulls.
+    The last converted SetID/TRAI and the schemas are stored in the output directory.
+    Following conversions resume after this index, so growing databases of running
+    acquisitions can be converted incrementally.
+
+    Example:
+        >>> vae.io.convert_to_dataset("data.pridb", "data_pridb")
+        >>> pyarrow.dataset.dataset("data_pridb/hits", partitioning="hive").to_table()
+
+    Args:
+        database: Path to pridb, tradb or trfdb (type by file extension)
+        output: Output directory
+        file_format: File format, "parquet" or "feather". Default: "parquet"
+        time_bucket: Time span of the time bucket partitions in seconds. Default: 3600
+        chunk_size: Number of SetIDs/TRAIs read and written at once.
+            Default: 1000 for tradb, 100000 otherwise
+        row_group_size: Maximum number of rows per row group
+        show_progress: Show progress bar. Default: `True`
+
+    Returns:
+        Summary with number of converted records and last converted SetID/TRAI
+    """
+    pa = import_pyarrow()
+    import pyarrow.compute as pc  # noqa: PLC0415
+    import pyarrow.dataset as ds  # noqa: PLC0415
+
+    if file_format not in _FILE_FORMATS:
+        raise ValueError(f"Invalid file format '{file_format}', use: {list(_FILE_FORMATS)}")
+    if time_bucket <= 0:
+        raise ValueError("Time bucket must be greater than 0")
+    if row_group_size < 1:
+        raise ValueError("Row group size must be greater than 0")
+
+    source = Path(database)
+    output = Path(output)
+    with _open_database(source) as database_:
+        index_column = "SetID" if isinstance(database_, PriDatabase) else "TRAI"
+        if chunk_size is None:
+            chunk_size = 1000 if isinstance(database_, TraDatabase) else 100_000
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be greater than 0")
+
+        output.mkdir(parents=True, exist_ok=True)
+        state_path = output / _STATE_FILENAME
+        last_index, schemas = _read_state(state_path, source)
+        # pylint: disable=protected-access
+        index_max = (
+            database_.connection()
+            .execute(f"SELECT MAX({index_column}) FROM {database_._table_main}")
+            .fetchone()[0]
+        )
+
+        datasets = _datasets(database_)
+        records = {dataset.name: 0 for dataset in datasets}
+        for dataset in datasets:
+            if dataset.name not in schemas:
+                # schema of all columns (empty result, no columns dropped)
+                schemas[dataset.name] = dataset.read(f"{index_column} < 0").schema
+        index_start = (last_index or 0) + 1
+        chunk_starts = range(index_start, (index_max or 0) + 1, chunk_size)
+        for chunk_start in tqdm(chunk_starts, desc="Chunks", disable=not show_progress):
+            chunk_stop = min(chunk_start + chunk_size - 1, index_max)
+            query_filter = f"{index_column} >= {chunk_start} AND {index_column} <= {chunk_stop}"
+            for dataset in datasets:
+                table = dataset.read(query_filter)
+                if table.num_rows == 0:
+                    continue
+                table, schemas[dataset.name] = _conform_to_schema(table, schemas[dataset.name])
+                partitioning = None
+                if dataset.partitioned:
+                    buckets = pc.floor(pc.divide(table["time"], float(time_bucket)))
+                    table = table.append_column("time_bucket", pc.cast(buckets, pa.int64()))
+                    partitioning = ["channel", "time_bucket"]
+                ds.write_dataset(
+                    table,
+                    output / dataset.name,
+                    format=file_format,
+                    partitioning=partitioning,
+                    partitioning_flavor="hive" if partitioning else None,
+                    # unique file names per chunk, rewritten if a conversion was interrupted
+                    basename_template=f"part-{chunk_start}-{{i}}.{_FILE_FORMATS[file_format]}",
+                    max_rows_per_group=row_group_size,
+                    existing_data_behavior="overwrite_or_ignore",
+                )
+                records[dataset.name] += table.num_rows
+            last_index = chunk_stop
+            _write_state(state_path, source, index_column, last_index, schemas)
+
+    logger.info("Converted %s to %s: %s", source, output, records)
+    return ConversionResult(records=records, last_index=last_index)
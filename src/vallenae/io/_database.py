@@ -1,11 +1,47 @@
+import asyncio
+import logging
 import sqlite3
 from abc import ABCMeta, abstractmethod
 from ast import literal_eval
 from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence, Set, Tuple, Union
-
-from ._sql import ConnectionWrapper, insert_from_dict, read_sql_generator, update_from_dict
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ._sql import (
+    ChangeDetector,
+    ColumnIndex,
+    ConnectionWrapper,
+    insert_from_dict,
+    read_sql_generator,
+    read_sql_rows,
+    sql_binary_search,
+    update_from_dict,
+)
+from ._timeindex import TimeIndex
+from ._writer import BackgroundWriter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# create function to convert rows (tuples) of a cursor with given columns to records (or None)
+ListenRowFactory = Callable[[ColumnIndex], Callable[[Tuple], Optional[T]]]
+
+_INDEX_PREFIX = "idx_vallenae_"  # prefix of indexes created by `Database.ensure_indexes`
 
 
 def require_write_access(func):
@@ -20,11 +56,27 @@ def require_write_access(func):
     return wrapper
 
 
+class IndexReport(NamedTuple):
+    """Query plans of an index created by `Database.ensure_indexes`."""
+
+    name: str  #: Index name
+    columns: Tuple[str, ...]  #: Indexed columns of the data table
+    created: bool  #: `False` if the index already existed
+    query: str  #: Query to compare the query plans (filter/sort by the indexed columns)
+    plan_before: List[str]  #: Query plan (EXPLAIN QUERY PLAN) before the index was created
+    plan_after: List[str]  #: Query plan (EXPLAIN QUERY PLAN) after the index was created
+
+
 class Database:
     """Database base class for pridb, tradb and trfdb."""
 
     __metaclass__ = ABCMeta
 
+    #: Index column of the monotonic increasing Time column (`None` if no Time column)
+    _time_index_column: Optional[str] = None
+    #: Default secondary indexes of `ensure_indexes` (columns of the data table)
+    _default_indexes: Sequence[Tuple[str, ...]] = ()
+
     def __init__(
         self,
         filename: str,
@@ -60,6 +112,8 @@ class Database:
 
         # cached results
         self._parameter_table_cached: Dict[int, Dict[str, Any]] = {}
+        self._time_index: Optional[TimeIndex] = None
+        self._time_index_state: Optional[Tuple[int, Optional[int]]] = None
 
     @staticmethod
     @abstractmethod
@@ -122,6 +176,100 @@ class Database:
                 if column not in columns_exist:
                     con.execute(f"ALTER TABLE {table} ADD COLUMN {column} {dtype}")
 
+    def _query_plan(self, query: str, params: Sequence[Any] = ()) -> List[str]:
+        """Get query plan details (EXPLAIN QUERY PLAN)."""
+        cur = self.connection().execute(f"EXPLAIN QUERY PLAN {query}", params)
+        return [row[-1] for row in cur.fetchall()]
+
+    def indexes(self) -> Set[str]:
+        """Get index names of data table."""
+        con = self.connection()
+        cur = con.execute(
+            "SELECT name FROM sqlite_master WHERE type == 'index' AND tbl_name == ?",
+            (self._table_main,),
+        )
+        return {result[0] for result in cur.fetchall()}
+
+    @require_write_access
+    def ensure_indexes(
+        self, indexes: Optional[Sequence[Sequence[str]]] = None
+    ) -> List[IndexReport]:
+        """
+        Create secondary indexes on the data table if they do not exist.
+
+        The shipped database schemas only index the primary keys (and TRAI of the tradb).
+        Filters like `channel` or the lookup of previous records of a channel scan the whole
+        data table. Indexes speed up those queries and are used automatically by the reads
+        once they exist (SQLite query planner), but enlarge the database file.
+        Only create indexes on analysis copies that may be modified;
+        use `drop_indexes` to remove them.
+
+        Default indexes:
+
+        - pridb: (Chan, SetID)
+        - tradb: (Chan, TRAI)
+
+        Args:
+            indexes: List of indexes, each index defined by a sequence of column names,
+                e.g. `[("Chan", "SetID")]`. Use default indexes if `None`
+
+        Returns:
+            Query plans of a query filtered/sorted by the indexed columns before and after the
+            index was created (`EXPLAIN QUERY PLAN`)
+        """
+        if indexes is None:
+            indexes = self._default_indexes
+        columns_exist = self.columns()
+        for columns in indexes:
+            if not columns:
+                raise ValueError("Index requires at least one column")
+            for column in columns:
+                if column not in columns_exist:
+                    raise ValueError(f"Column {column} not found in {self._table_main}")
+
+        reports = []
+        for columns in indexes:
+            name = _INDEX_PREFIX + "_".join(columns)
+            columns_equal = columns[:-1] if len(columns) > 1 else columns
+            query = f'SELECT "{columns[-1]}" FROM {self._table_main} WHERE ' + " AND ".join(
+                f'"{column}" == ?' for column in columns_equal
+            )
+            if len(columns) > 1:
+                query += f' ORDER BY "{columns[-1]}"'
+            params = [None] * len(columns_equal)
+
+            created = name not in self.indexes()
+            plan_before = self._query_plan(query, params)
+            if created:
+                with self.connection() as con:  # commit/rollback transaction
+                    columns_sql = ", ".join(f'"{column}"' for column in columns)
+                    con.execute(f'CREATE INDEX "{name}" ON {self._table_main} ({columns_sql})')
+            reports.append(
+                IndexReport(
+                    name=name,
+                    columns=tuple(columns),
+                    created=created,
+                    query=query,
+                    plan_before=plan_before,
+                    plan_after=self._query_plan(query, params),
+                )
+            )
+        return reports
+
+    @require_write_access
+    def drop_indexes(self) -> List[str]:
+        """
+        Drop secondary indexes created by `ensure_indexes`.
+
+        Returns:
+            Names of dropped indexes
+        """
+        names = sorted(name for name in self.indexes() if name.startswith(_INDEX_PREFIX))
+        with self.connection() as con:  # commit/rollback transaction
+            for name in names:
+                con.execute(f'DROP INDEX "{name}"')
+        return names
+
     def tables(self) -> Set[str]:
         """Get table names."""
         con = self.connection()
@@ -203,15 +351,114 @@ class Database:
                     """.format(prefix=self._table_prefix)
                 )
 
-    def _file_status(self) -> int:
+    def _file_status(self, connection: Optional[sqlite3.Connection] = None) -> int:
         """Get file status (0: offline, 1: suspended, 2: active)."""
-        result = (
-            self.connection()
-            .execute(f"SELECT Value FROM {self._table_globalinfo} WHERE Key == 'FileStatus'")
-            .fetchone()
-        )
+        if connection is None:
+            connection = self.connection()
+        result = connection.execute(
+            f"SELECT Value FROM {self._table_globalinfo} WHERE Key == 'FileStatus'"
+        ).fetchone()
         return int(result[0]) if result else 0
 
+    def _listen_records(
+        self,
+        query: str,
+        index_column: str,
+        last_index: int,
+        row_factory: ListenRowFactory[T],
+        *,
+        buffer_size: int,
+        wait: bool,
+        min_interval: float,
+        max_interval: float,
+    ) -> Iterator[T]:
+        """
+        Listen to database changes and return new records (used by the listen methods).
+
+        The query is only executed again if the database changed (checked with cheap
+        `PRAGMA data_version` and WAL file stats). The polling interval adapts between
+        `min_interval` and `max_interval` (exponential backoff).
+
+        Args:
+            query: Query with a single parameter for the last index and LIMIT `buffer_size`
+            index_column: Index column of returned rows, e.g. "SetID"
+            last_index: Last index, only rows with a greater index are returned
+            row_factory: Create function to convert a row to a record, see `sql_row_factory`.
+                Rows converted to `None` are skipped
+            buffer_size: Maximum number of rows returned by the query (LIMIT)
+            wait: Wait for new rows even if no acquisition (writer) is active
+            min_interval: Minimum polling interval in seconds
+            max_interval: Maximum polling interval in seconds
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Polling intervals must satisfy 0 < min_interval <= max_interval")
+
+        detector = ChangeDetector(self.connection(), self.filename)
+        while True:
+            detector.reset()  # track changes during and after the query
+            columns, rows_iterator = read_sql_rows(self.connection(), query, last_index)
+            # buffer rows to allow in-between write transactions
+            rows = list(rows_iterator)
+            convert = row_factory(columns)
+            index = columns[index_column]
+            for row in rows:
+                last_index = row[index]
+                record = convert(row)
+                if record is not None:
+                    yield record
+            if len(rows) < buffer_size:  # all rows read, wait for changes
+                if not wait and self._file_status() == 0:  # no writer active
+                    break
+                detector.wait(min_interval, max_interval)
+
+    async def _alisten_records(
+        self,
+        query: str,
+        index_column: str,
+        last_index: int,
+        row_factory: ListenRowFactory[T],
+        *,
+        buffer_size: int,
+        wait: bool,
+        min_interval: float,
+        max_interval: float,
+    ) -> AsyncIterator[T]:
+        """
+        Async version of `_listen_records` (used by the alisten methods).
+
+        Queries and the conversion of rows to records are executed on worker threads
+        with a read-only connection, the event loop is only blocked by the polling interval.
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Polling intervals must satisfy 0 < min_interval <= max_interval")
+
+        loop = asyncio.get_running_loop()
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        con = connection_wrapper.connection()
+        detector = await loop.run_in_executor(None, ChangeDetector, con, self.filename)
+
+        def fetch(last_index: int) -> Tuple[List[T], int, int]:
+            detector.reset()  # track changes during and after the query
+            columns, rows_iterator = read_sql_rows(con, query, last_index)
+            rows = list(rows_iterator)
+            if rows:
+                last_index = rows[-1][columns[index_column]]
+            convert = row_factory(columns)
+            records = [record for record in map(convert, rows) if record is not None]
+            return records, len(rows), last_index
+
+        while True:
+            records, count, last_index = await loop.run_in_executor(None, fetch, last_index)
+            for record in records:
+                yield record
+            if count < buffer_size:  # all rows read, wait for changes
+                if not wait and await loop.run_in_executor(None, self._file_status, con) == 0:
+                    break
+                interval = min_interval
+                while not await loop.run_in_executor(None, detector.changed):
+                    await asyncio.sleep(interval)
+                    interval = min(interval * 2, max_interval)
+
     def _main_index_range(self) -> Tuple[int, int]:
         """Get range of main data table index (SetID for pridb/tradb or TRAI for trfdb)."""
         return (
@@ -220,6 +467,99 @@ class Database:
             .fetchone()
         )
 
+    def create_time_index(self, step: int = 1000) -> TimeIndex:
+        """
+        Build or update the sidecar time index (``<filename>.vaeidx``).
+
+        The time index stores sampled checkpoints of the Time column to speed up reads of
+        time ranges (arguments `time_start` and `time_stop`).
+        Once created, the index is used and updated automatically by all reads.
+        The database itself is not modified (also works for read-only databases).
+
+        Args:
+            step: Sample every n-th record as checkpoint
+
+        Returns:
+            Time index
+
+        Raises:
+            ValueError: If the database has no Time column or the Time column is not sorted
+        """
+        if self._time_index_column is None:
+            raise ValueError(f"Time index not supported for {type(self).__name__}")
+        if self._time_index is None or self._time_index.step != step:
+            self._time_index = TimeIndex(self._table_main, self._time_index_column, step)
+        state = self._get_time_index_state()
+        self._time_index.update(self.connection(), state[1])
+        self._time_index.save(TimeIndex.path(self.filename))
+        self._time_index_state = state
+        return self._time_index
+
+    def _get_time_index_state(self) -> Tuple[int, Optional[int]]:
+        """Get cheap database state (data version, valid sets) to detect new records."""
+        con = self.connection()
+        data_version = con.execute("PRAGMA data_version").fetchone()[0]
+        result = con.execute(
+            f"SELECT Value FROM {self._table_globalinfo} WHERE Key == 'ValidSets'"
+        ).fetchone()
+        valid_sets = None if result is None or result[0] is None else int(result[0])
+        return data_version, valid_sets
+
+    def _get_time_index(self) -> Optional[TimeIndex]:
+        """Get (updated) sidecar time index if it exists."""
+        # data version: commits of other connections, valid sets: commits of this connection
+        state = self._get_time_index_state()
+        if state == self._time_index_state:
+            return self._time_index
+        if self._time_index is None:
+            path = TimeIndex.path(self.filename)
+            if not path.exists():
+                self._time_index_state = state
+                return None
+            try:
+                self._time_index = TimeIndex.load(path)
+            except ValueError as e:
+                logger.warning("Ignore time index: %s", e)
+                self._time_index_state = state
+                return None
+        if self._time_index.update(self.connection(), state[1]):
+            try:
+                self._time_index.save(TimeIndex.path(self.filename))
+            except OSError as e:  # e.g. no write access, keep index in memory only
+                logger.debug("Could not save time index: %s", e)
+        self._time_index_state = state
+        return self._time_index
+
+    def _search_time(self, value: float, *, lower_bound: bool) -> Optional[int]:
+        """
+        Find index boundary of a time condition on the (raw) Time column.
+
+        Use the sidecar time index if available, otherwise a binary search.
+
+        Args:
+            value: Raw time value (time in seconds * timebase)
+            lower_bound: Return first index with `Time >= value` if `True`,
+                otherwise last index with `Time < value`
+
+        Returns:
+            Index or `None` if condition is false for all records
+        """
+        assert self._time_index_column is not None
+        con = self.connection()
+        time_index = self._get_time_index()
+        if time_index is not None:
+            if lower_bound:
+                return time_index.find_first(con, value)
+            return time_index.find_last(con, value)
+        return sql_binary_search(
+            connection=con,
+            table=self._table_main,
+            column_value="Time",
+            column_index=self._time_index_column,
+            fun_compare=(lambda t: t >= value) if lower_bound else (lambda t: t < value),
+            lower_bound=lower_bound,  # return lower/upper index of true conditions
+        )
+
     def _parameter_table(self) -> Dict[int, Dict[str, Any]]:
         """Read *_params table to dict."""
 
@@ -242,6 +582,57 @@ class Database:
         except KeyError:
             raise ValueError(f"Parameter ID {param_id} not found in {self._table_params}") from None
 
+    def _open_writer_database(self) -> "Database":
+        """Open new instance of the database for a writer thread."""
+        # child classes provide the table prefix
+        return type(self)(self.filename, mode="rw")  # type: ignore[call-arg]
+
+    def _write_batch(self, records: Sequence[Any]):
+        """
+        Write batch of records within a single transaction (used by `BackgroundWriter`).
+
+        Method has to be implemented by child classes.
+        """
+        raise NotImplementedError("Batch writes not implemented")
+
+    @require_write_access
+    def background_writer(
+        self,
+        *,
+        batch_size: int = 1000,
+        flush_interval: float = 0.1,
+        queue_size: int = 10_000,
+    ) -> BackgroundWriter:
+        """
+        Create background writer to write records asynchronously.
+
+        Records are put into a bounded queue and written by a dedicated thread in batches
+        (one transaction per batch). The producer is not blocked by SQLite commits unless
+        the queue is full.
+
+        Args:
+            batch_size: Maximum number of records written within a single transaction
+            flush_interval: Maximum time in seconds records are buffered before written
+            queue_size: Maximum number of queued records.
+                `BackgroundWriter.write` blocks if the queue is full (backpressure).
+
+        Returns:
+            Background writer, use `BackgroundWriter.close` (or a with statement) to write all
+            queued records and stop the writer thread
+
+        Example:
+            >>> with pridb.background_writer(batch_size=500) as writer:
+            ...     for hit in hits:
+            ...         writer.write(hit)
+        """
+        self.connection().commit()  # writer thread uses its own connection
+        return BackgroundWriter(
+            self,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            queue_size=queue_size,
+        )
+
     def close(self):
         """Close database connection."""
         if not hasattr(self, "_connection_wrapper"):
@@ -1,8 +1,11 @@
-from typing import Optional, Tuple
+import sqlite3
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Type, TypeVar
 
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from ._sql import count_sql_results, sql_column_values
 from .types import SizedIterable
 
 
@@ -48,3 +51,149 @@ def iter_to_dataframe(
         if index_column is not None:
             df = df.set_index(index_column)
     return _convert_to_nullable_types(df)
+
+
+T = TypeVar("T")
+
+
+def iter_from_dataframe(df: pd.DataFrame, record_type: Type[T]) -> Iterator[T]:
+    """
+    Helper function to convert Pandas DataFrame rows to records (`NamedTuple`).
+
+    Inverse of `iter_to_dataframe`. Columns (and index) are matched with the record fields by name,
+    other columns are ignored. Missing values are converted to `None`.
+
+    Args:
+        df: Pandas DataFrame
+        record_type: `NamedTuple` type to create
+
+    Yields:
+        Records of given type
+    """
+    fields = record_type._fields  # type: ignore
+    if df.index.name in fields:
+        df = df.reset_index()
+    columns = [column for column in df.columns if column in fields]
+    df_objects = df[columns].astype(object)  # Python scalars, nullable types to object
+    df_objects = df_objects.where(df[columns].notna(), None)
+    for values in df_objects.itertuples(index=False, name=None):
+        kwargs: Dict[str, Any] = {column: values[i] for i, column in enumerate(columns)}
+        yield record_type(**kwargs)
+
+
+class ColumnSpec(NamedTuple):
+    """Mapping of a record field to a SQL column for columnar reads."""
+
+    field: str  #: Field name of the record / column name of the DataFrame
+    sql_column: str  #: Column name in the SQL result set
+    integer: bool = False  #: Column holds integer values
+    divisor: Optional[float] = None  #: Scale values, e.g. 1e6 to convert µV to V
+
+
+class _ColumnBuffer:
+    """Preallocated column array, filled batch by batch."""
+
+    def __init__(self, spec: ColumnSpec, size: int):
+        self.spec = spec
+        self.values = np.empty(size, dtype=np.int64 if spec.integer else np.float64)
+        self.null = np.zeros(size, dtype=bool) if spec.integer else None
+        self.has_null = False
+
+    def resize(self, size: int):
+        self.values = np.resize(self.values, size)
+        if self.null is not None:
+            self.null = np.resize(self.null, size)
+
+    def assign(self, start: int, values: Sequence[Any]):
+        stop = start + len(values)
+        if self.null is None:
+            self.values[start:stop] = values  # None is converted to NaN
+        elif None in values:
+            self.has_null = True
+            self.null[start:stop] = [v is None for v in values]
+            self.values[start:stop] = [0 if v is None else v for v in values]
+        else:
+            self.values[start:stop] = values
+
+    def finalize(self, size: int) -> np.ndarray:
+        values: np.ndarray = self.values[:size]
+        if self.has_null:
+            assert self.null is not None
+            # same dtype as inferred by pandas for integers with missing values
+            values = values.astype(np.float64)
+            values[self.null[:size]] = np.nan
+        if self.spec.divisor is not None:
+            values = values / self.spec.divisor
+        return values
+
+
+def query_to_dataframe(
+    connection: sqlite3.Connection,
+    query: str,
+    columns: Sequence[ColumnSpec],
+    *,
+    show_progress: bool = True,
+    desc: str = "",
+    index_column: Optional[str] = None,
+    arraysize: int = 10_000,
+) -> pd.DataFrame:
+    """
+    Read SQL query results column-wise to Pandas DataFrame.
+
+    Rows are fetched in batches and written directly to preallocated NumPy arrays.
+    Compared to `iter_to_dataframe`, no intermediate record objects are created.
+    The resulting DataFrame is equal to the DataFrame of `iter_to_dataframe` for the
+    corresponding records.
+
+    Args:
+        connection: SQLite connection
+        query: SELECT query
+        columns: Column specifications, defines order and conversion of the output columns.
+            Columns missing in the result set are treated as empty
+        show_progress: Show progress bar. Default: `True`
+        desc: Description shown left to the progress bar
+        index_column: Set column as index. Default: `None`
+        arraysize: Number of rows fetched per batch
+
+    Returns:
+        Pandas DataFrame
+    """
+    rows_expected = count_sql_results(connection, query)
+    cur = connection.execute(query)
+    result_columns: Dict[str, int] = {
+        column[0]: index for index, column in enumerate(cur.description)
+    }
+    buffers = [
+        (result_columns[spec.sql_column], _ColumnBuffer(spec, rows_expected))
+        for spec in columns
+        if spec.sql_column in result_columns
+    ]
+
+    size = rows_expected
+    rows = 0
+    with tqdm(total=rows_expected, desc=desc, disable=not show_progress) as progress:
+        while True:
+            batch = cur.fetchmany(arraysize)
+            if not batch:
+                break
+            rows_batch = len(batch)
+            if rows + rows_batch > size:  # rows added since count query
+                size = max(2 * size, rows + rows_batch)
+                for _, buffer in buffers:
+                    buffer.resize(size)
+            for index, buffer in buffers:
+                buffer.assign(rows, sql_column_values(batch, index))
+            rows += rows_batch
+            progress.update(rows_batch)
+
+    if rows == 0:
+        return _convert_to_nullable_types(pd.DataFrame())
+
+    df = pd.DataFrame(
+        {buffer.spec.field: buffer.finalize(rows) for _, buffer in buffers},
+        columns=[buffer.spec.field for _, buffer in buffers],
+    )
+    df = df.dropna(axis="columns", how="all")  # drop empty columns
+    if index_column is not None:
+        df = df.set_index(index_column)
+    return _convert_to_nullable_types(df)
@@ -0,0 +1,283 @@
+import logging
+from collections import OrderedDict
+from functools import partial
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from ._database import Database
+from ._sql import ChangeDetector, ColumnIndex, read_sql_rows
+from .datatypes import FeatureRecord, HitRecord, JoinedRecord, TraRecord
+from .pridb import PriDatabase
+from .tradb import TraDatabase
+from .trfdb import TrfDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class _Source:
+    """Incremental reader of new rows of a single database."""
+
+    def __init__(
+        self,
+        database: Database,
+        query: str,
+        index_column: str,
+        row_factory: Callable[[ColumnIndex], Callable[[Tuple], Any]],
+        *,
+        buffer_size: int,
+        existing: bool,
+    ):
+        self.database = database
+        self._query = query
+        self._index_column = index_column
+        self._row_factory = row_factory
+        self._buffer_size = buffer_size
+        self._last_index = 0 if existing else database._main_index_range()[1] or 0
+        self._detector = ChangeDetector(database.connection(), database.filename)
+        self.position = 0  #: Last read TRAI
+
+    def fetch(self) -> Tuple[List[Any], bool]:
+        """
+        Read next batch of new records (at most `buffer_size`).
+
+        Returns:
+            Records and `True` if more records might be available (full batch)
+        """
+        self._detector.reset()  # track changes during and after the query
+        columns, rows_iterator = read_sql_rows(
+            self.database.connection(), self._query, self._last_index
+        )
+        rows = list(rows_iterator)
+        convert = self._row_factory(columns)
+        index = columns[self._index_column]
+        records = []
+        for row in rows:
+            self._last_index = row[index]
+            records.append(convert(row))
+            if records[-1].trai:
+                self.position = records[-1].trai
+        return records, len(rows) >= self._buffer_size
+
+    def changed(self) -> bool:
+        return self._detector.changed()
+
+
+class _PendingRecord:
+    __slots__ = ("features", "hit", "since", "tra")
+
+    def __init__(self, since: float):
+        self.since = since
+        self.hit: Optional[HitRecord] = None
+        self.tra: Optional[TraRecord] = None
+        self.features: Optional[FeatureRecord] = None
+
+    def joined(self) -> JoinedRecord:
+        assert self.hit is not None
+        return JoinedRecord(hit=self.hit, tra=self.tra, features=self.features)
+
+
+class _Joiner:
+    """Join records of the sources by TRAI with bounded buffer of pending records."""
+
+    def __init__(self, kinds: Sequence[str], *, timeout: float, max_pending: int):
+        self._kinds = kinds  # required parts
+        self._timeout = timeout
+        self._max_pending = max_pending
+        self._pending: "OrderedDict[int, _PendingRecord]" = OrderedDict()  # by first arrival
+
+    def _is_complete(self, entry: _PendingRecord) -> bool:
+        return all(getattr(entry, kind) is not None for kind in self._kinds)
+
+    def add(self, kind: str, record: Any) -> Iterator[JoinedRecord]:
+        """Add record, yield joined record if complete."""
+        if kind == "hit" and not record.trai:  # no transient data
+            yield JoinedRecord(hit=record)
+            return
+        entry = self._pending.get(record.trai)
+        if entry is None:
+            entry = self._pending[record.trai] = _PendingRecord(monotonic())
+        setattr(entry, kind, record)
+        if self._is_complete(entry):
+            del self._pending[record.trai]
+            yield entry.joined()
+
+    def expire(self, force: bool = False) -> Iterator[JoinedRecord]:
+        """Yield timed out records and oldest records exceeding `max_pending`."""
+        now = monotonic()
+        while self._pending:
+            entry = next(iter(self._pending.values()))
+            if (
+                not force
+                and len(self._pending) <= self._max_pending
+                and now < entry.since + self._timeout
+            ):
+                break
+            trai, entry = self._pending.popitem(last=False)
+            if entry.hit is not None:
+                yield entry.joined()
+            else:
+                logger.debug("Discard transient data/features without hit (TRAI %d)", trai)
+
+    def deadline(self) -> Optional[float]:
+        """Timeout of the oldest pending record."""
+        if not self._pending:
+            return None
+        return next(iter(self._pending.values())).since + self._timeout
+
+
+def _create_sources(
+    pridb: PriDatabase,
+    tradb: Optional[TraDatabase],
+    trfdb: Optional[TrfDatabase],
+    *,
+    existing: bool,
+    raw: bool,
+    max_batch_size: int,
+) -> Dict[str, _Source]:
+    """Create sources by name of `JoinedRecord` field."""
+    # pylint: disable=protected-access
+    hit_batch_size = min(1000, max_batch_size)
+    sources = {
+        "hit": _Source(
+            pridb,
+            pridb._listen_query("SetType == 2", hit_batch_size),
+            "SetID",
+            HitRecord.sql_row_factory,
+            buffer_size=hit_batch_size,
+            existing=existing,
+        )
+    }
+    if tradb is not None:
+        tra_batch_size = min(100, max_batch_size)
+        sources["tra"] = _Source(
+            tradb,
+            tradb._listen_query(None, tra_batch_size),
+            "SetID",
+            partial(TraRecord.sql_row_factory, raw=raw),
+            buffer_size=tra_batch_size,
+            existing=existing,
+        )
+    if trfdb is not None:
+        features_batch_size = min(1000, max_batch_size)
+        sources["features"] = _Source(
+            trfdb,
+            trfdb._listen_query(None, features_batch_size),
+            "rowid",
+            TrfDatabase._listen_row_factory,
+            buffer_size=features_batch_size,
+            existing=existing,
+        )
+    return sources
+
+
+def _wait_for_changes(
+    sources: List[_Source],
+    deadline: Optional[float],
+    min_interval: float,
+    max_interval: float,
+):
+    """Wait until any source changed or the deadline is reached (adaptive polling interval)."""
+    interval = min_interval
+    while True:
+        changed = [source.changed() for source in sources]  # update state of all detectors
+        if any(changed):
+            return
+        if deadline is not None:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return
+            interval = min(interval, remaining)
+        sleep(interval)
+        interval = min(interval * 2, max_interval)
+
+
+def listen_joined(  # pylint: disable=too-many-locals
+    pridb: PriDatabase,
+    tradb: Optional[TraDatabase] = None,
+    trfdb: Optional[TrfDatabase] = None,
+    *,
+    existing: bool = False,
+    wait: bool = False,
+    raw: bool = False,
+    timeout: float = 10.0,
+    max_pending: int = 10_000,
+    min_interval: float = 0.01,
+    max_interval: float = 0.1,
+) -> Iterator[JoinedRecord]:
+    """
+    Listen to changes of pridb, tradb and trfdb and return hits joined with their transient data
+    and features (by TRAI).
+
+    The joined records are returned as soon as all parts exist. Hits without TRAI are returned
+    immediately. Hits with missing parts are returned (with missing parts set to `None`) if the
+    parts are not available within the `timeout` or if more than `max_pending` records are
+    buffered. Transient data and features without hits are discarded.
+    Other pridb records (markers, status and parametric data) are ignored.
+
+    Example:
+        >>> for record in vae.io.listen_joined(pridb, tradb, trfdb, wait=True):
+        ...     print(record.hit.amplitude, record.tra.samples, record.features["FFT_CoG"])
+
+    Args:
+        pridb: pridb to listen to
+        tradb: Optional tradb to listen to
+        trfdb: Optional trfdb to listen to
+        existing: Return already existing records
+        wait: Wait for new records even if no acquisition (writer) is active.
+            Otherwise the function returns after all records are read.
+        raw: Return transient data as ADC values (int16). Default: `False`
+        timeout: Maximum time in seconds to wait for missing parts of a record
+        max_pending: Maximum number of buffered records with missing parts.
+            The databases are read in batches of at most `max_pending` records
+        min_interval: Minimum polling interval in seconds.
+            The databases are only queried again if changes were detected.
+        max_interval: Maximum polling interval in seconds (adaptive backoff)
+
+    Yields:
+        Joined records
+    """
+    # pylint: disable=protected-access
+    if tradb is None and trfdb is None:
+        raise ValueError("At least one tradb or trfdb is required")
+    if timeout < 0 or max_pending < 0:
+        raise ValueError("Timeout and maximum number of pending records must not be negative")
+    if min_interval <= 0 or max_interval < min_interval:
+        raise ValueError("Polling intervals must satisfy 0 < min_interval <= max_interval")
+
+    # batches must not exceed max_pending, otherwise records would expire before their parts
+    # are read
+    sources = _create_sources(
+        pridb, tradb, trfdb, existing=existing, raw=raw, max_batch_size=max(max_pending, 1)
+    )
+
+    joiner = _Joiner(kinds=list(sources), timeout=timeout, max_pending=max_pending)
+
+    exhausted: Set[str] = set()  # sources without new records
+    received = False
+    while True:
+        active = [kind for kind in sources if kind not in exhausted]
+        if active:
+            # read batch by batch from the source that is behind (lowest TRAI) to keep the
+            # number of pending records low
+            kind = min(active, key=lambda name: sources[name].position)
+            records, more = sources[kind].fetch()
+            if not more:
+                exhausted.add(kind)
+            received = received or bool(records)
+            for record in records:
+                yield from joiner.add(kind, record)
+            yield from joiner.expire()
+            continue
+
+        exhausted.clear()
+        if received:  # check all sources again for new records
+            received = False
+            continue
+
+        if not wait and all(source.database._file_status() == 0 for source in sources.values()):
+            yield from joiner.expire(force=True)  # no writer active
+            break
+
+        # wait for changes or next timeout
+        deadline = joiner.deadline()
+        _wait_for_changes(list(sources.values()), deadline, min_interval, max_interval)
@@ -1,15 +1,40 @@
+import asyncio
 import collections.abc
 import contextlib
 import logging
 import sqlite3
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, TypeVar, Union
+from time import monotonic, sleep
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .types import SizedIterable
 
 logger = logging.getLogger(__name__)
 
+#: Column names and their indexes in the row tuples of a query result set
+ColumnIndex = Dict[str, int]
+
 
 def create_uri(filename: Union[str, Path], *, mode: str = "ro") -> str:
     """Create SQLite URI (https://www.sqlite.org/uri.html)."""
@@ -116,25 +141,108 @@ class ConnectionWrapper:
 
 
 T = TypeVar("T")
+S = TypeVar("S")
+
+
+def map_threaded(
+    func: Callable[[S], T],
+    iterable: Iterable[S],
+    workers: int,
+    prefetch: Optional[int] = None,
+    batch_size: int = 100,
+) -> Iterator[T]:
+    """
+    Map function over iterable with a thread pool and keep the order of the results.
+
+    The iterable is consumed in the calling thread, while `func` is executed by the workers.
+    Items are submitted in batches (one task per batch) to keep the overhead of the tasks
+    small compared to `func`.
+    This only pays off if `func` releases the GIL, e.g. for FLAC decoding with libsndfile.
+
+    Args:
+        func: Function to apply to every item
+        iterable: Input items
+        workers: Number of worker threads
+        prefetch: Maximum number of pending tasks (batches). Default: 2 * workers
+        batch_size: Number of items per task
+
+    Yields:
+        Results of `func` in order of the input items
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be greater than 0")
+    if prefetch is None:
+        prefetch = 2 * workers
+
+    def map_batch(batch: List[S]) -> List[T]:
+        return [func(item) for item in batch]
+
+    iterator = iter(iterable)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            pending.append(executor.submit(map_batch, batch))
+            if len(pending) >= prefetch:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+async def aiter_threaded(iterable: Iterable[T], batch_size: int = 1000) -> AsyncIterator[T]:
+    """
+    Iterate asynchronously over a (blocking) iterable.
+
+    Items are fetched in batches on a worker thread without blocking the event loop.
+
+    Args:
+        iterable: Iterable, e.g. `QueryIterable`
+        batch_size: Number of items fetched by the worker thread at once
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be greater than 0")
+
+    loop = asyncio.get_running_loop()
+    iterator = await loop.run_in_executor(None, iter, iterable)
+    while True:
+        batch = await loop.run_in_executor(None, lambda: list(islice(iterator, batch_size)))
+        for item in batch:
+            yield item
+        if len(batch) < batch_size:
+            break
 
 
 class QueryIterable(SizedIterable[T]):
     """
-    Sized iterable to query results from SQLite as dictionaries.
+    Sized iterable to query results from SQLite.
 
     SQLite connection is stored in picklable ConnectionWrapper to be used with multiprocessing.
+    Rows are fetched in batches as tuples and converted by the function of `row_factory`,
+    created once per query with the column indexes of the result set.
+    Alternatively, rows are passed as dictionaries to `dict_to_type` (slower).
+    Rows are converted in the iterating thread or with a thread pool of `workers` threads
+    (fetching stays in the iterating thread, order is kept).
     """
 
     def __init__(
         self,
         connection_wrapper: ConnectionWrapper,
         query: str,
-        dict_to_type: Callable[[Dict[str, Any]], T],
+        dict_to_type: Optional[Callable[[Dict[str, Any]], T]] = None,
+        *,
+        row_factory: Optional[Callable[[ColumnIndex], Callable[[Tuple], T]]] = None,
+        workers: Optional[int] = None,
     ):
         super().__init__()
+        if (dict_to_type is None) == (row_factory is None):
+            raise ValueError("Either dict_to_type or row_factory is required")
         self._connection_wrapper = connection_wrapper
         self._query = query
         self._dict_to_type = dict_to_type
+        self._row_factory = row_factory
+        self._workers = workers
         self._count_result: Optional[int] = None  # cache result of __len__
 
     def __len__(self) -> int:
@@ -148,8 +256,19 @@ class QueryIterable(SizedIterable[T]):
         if self.__len__() == 0:
             logger.debug("Empty SQLite query")
 
-        for row in read_sql_generator(self._connection_wrapper.connection(), self._query):
-            yield self._dict_to_type(row)
+        connection = self._connection_wrapper.connection()
+        if self._row_factory is not None:
+            columns, rows = read_sql_rows(connection, self._query)
+            yield from self._map(self._row_factory(columns), rows)
+        else:
+            assert self._dict_to_type is not None
+            yield from self._map(self._dict_to_type, read_sql_generator(connection, self._query))
+
+    def _map(self, convert: Callable[[S], T], rows: Iterator[S]) -> Iterator[T]:
+        """Convert rows to records, on worker threads if `workers` is set."""
+        if self._workers:
+            return map_threaded(convert, rows, self._workers)
+        return map(convert, rows)
 
 
 TIsIn = Dict[str, Union[float, Sequence[float], None]]
@@ -202,6 +321,75 @@ def query_conditions(
     return "WHERE " + " AND ".join(cond) if cond else ""
 
 
+def query_select(
+    field_columns: Mapping[str, Sequence[str]],
+    fields: Optional[Sequence[str]] = None,
+    *,
+    required: Sequence[str] = (),
+) -> str:
+    """
+    Build column list of a SELECT statement for given record fields.
+
+    Columns of not selected fields are returned as `NULL` to keep the layout of the records.
+    SQLite skips the evaluation of the (view) expressions of those columns.
+
+    Args:
+        field_columns: Mapping of record fields to SQL columns
+        fields: Selected record fields. Select all columns (`*`) if `None`
+        required: Record fields that are selected in any case
+
+    Returns:
+        Comma separated list of SQL columns
+
+    Raises:
+        ValueError: If selected fields are unknown
+    """
+    if fields is None:
+        return "*"
+    invalid_fields = [field for field in fields if field not in field_columns]
+    if invalid_fields:
+        raise ValueError(f"Invalid field(s) {invalid_fields}, use: {list(field_columns)}")
+    fields_selected = {*fields, *required}
+    return ", ".join(
+        column if field in fields_selected else f"NULL AS {column}"
+        for field, columns in field_columns.items()
+        for column in columns
+    )
+
+
+def read_sql_rows(
+    connection: sqlite3.Connection,
+    query: str,
+    *parameter,
+    arraysize: int = 1000,
+) -> Tuple[ColumnIndex, Iterator[Tuple]]:
+    """
+    Query data from a SQLite connection as tuples.
+
+    The query is executed immediately, the rows are fetched lazily in batches of `arraysize`.
+
+    Args:
+        connection: SQLite3 connection object
+        query: SELECT Query
+        arraysize: Number of rows fetched per batch
+
+    Returns:
+        Column indexes of the result set and iterator of rows (tuples)
+    """
+    cur = connection.execute(query, parameter)
+    # same as dict(zip(...)) of read_sql_generator: duplicate column names refer to the last one
+    columns = {column[0]: index for index, column in enumerate(cur.description)}
+
+    def rows():
+        while True:
+            batch = cur.fetchmany(arraysize)
+            if not batch:
+                break
+            yield from batch
+
+    return columns, rows()
+
+
 def read_sql_generator(
     connection: sqlite3.Connection,
     query: str,
@@ -210,21 +398,67 @@ def read_sql_generator(
     """
     Generator to query data from a SQLite connection as a dictionary.
 
+    Prefer `read_sql_rows` for large result sets.
+
     Args:
         connection: SQLite3 connection object
         query: SELECT Query
 
     Yields:
-        Row of the query result set as namedtuple
+        Row of the query result set as dict
     """
     cur = connection.execute(query, parameter)
     columns = [column[0] for column in cur.description]
 
     while True:
-        values = cur.fetchone()
-        if values is None:
+        batch = cur.fetchmany()
+        if not batch:
             break
-        yield dict(zip(columns, values))
+        for values in batch:
+            yield dict(zip(columns, values))
+
+
+def sql_column_values(rows: Sequence[Tuple], index: int) -> List[Any]:
+    """Get values of a single column (by index) from multiple rows."""
+    return list(map(itemgetter(index), rows))
+
+
+def sql_row_getter(
+    columns: ColumnIndex,
+    names: Sequence[str],
+    *,
+    optional: Collection[str] = (),
+) -> Callable[[Tuple], Tuple]:
+    """
+    Create getter of column values from rows of `read_sql_rows`.
+
+    The column indexes are resolved once, the getter returns the values of all given columns
+    with a single call of `operator.itemgetter`.
+
+    Args:
+        columns: Column indexes of the result set
+        names: Column names of the returned values
+        optional: Column names that might be missing in the result set, values are `None`
+
+    Returns:
+        Function that returns a tuple of the values of `names` for a row
+
+    Raises:
+        KeyError: If a required column is missing in the result set
+    """
+    index_none = max(columns.values(), default=-1) + 1  # index of appended None value
+    indexes = []
+    for name in names:
+        if name not in columns and name not in optional:
+            raise KeyError(f"Column '{name}' missing in result set")
+        indexes.append(columns.get(name, index_none))
+
+    if len(indexes) < 2:  # itemgetter only returns tuples for multiple items
+        return lambda row: tuple((*row, None)[index] for index in indexes)
+    getter = itemgetter(*indexes)
+    if index_none in indexes:
+        return lambda row: getter((*row, None))
+    return getter
 
 
 def count_sql_results(connection: sqlite3.Connection, query: str) -> int:
@@ -250,7 +484,8 @@ def sql_binary_search(
 
     Because the Time column is monotonic increasing, a fast binary search can be applied.
     The Time column is not *stricly* monotonic increasing; different channels might share the same
-    timestamp. To find the lower/upper bound of same values, a subsequent linear search is applied.
+    timestamp. The lower/upper bound of same values is found with a subsequent range query
+    (single query instead of one query per row).
 
     Args:
         connection: SQLite connection
@@ -298,16 +533,39 @@ def sql_binary_search(
             else:
                 i_max = i_mid
 
-    def bound_same_value(start: int):
-        """Find lower/upper bound of same values with linear search."""
+    def bound_same_value(start: int) -> int:
+        """Find lower/upper bound of same values with a single range query."""
         v_start = get_value(start)
-        inc = -1 if lower_bound else 1
-        i = start
-        while i_min_total < i < i_max_total:
-            i += inc
-            if get_value(i) != v_start:
-                return i - inc
-        return i
+        # next index with a different value (scan of the index column from start), `IS NOT` to
+        # handle NULL values
+        if lower_bound:
+            query = f"""
+            SELECT MIN({column_index}) FROM {table}
+            WHERE {column_index} <= :start AND {column_index} > IFNULL(
+                (
+                    SELECT {column_index} FROM {table}
+                    WHERE {column_index} < :start AND {column_value} IS NOT :value
+                    ORDER BY {column_index} DESC LIMIT 1
+                ),
+                :limit
+            )
+            """
+            limit = i_min_total - 1
+        else:
+            query = f"""
+            SELECT MAX({column_index}) FROM {table}
+            WHERE {column_index} >= :start AND {column_index} < IFNULL(
+                (
+                    SELECT {column_index} FROM {table}
+                    WHERE {column_index} > :start AND {column_value} IS NOT :value
+                    ORDER BY {column_index} ASC LIMIT 1
+                ),
+                :limit
+            )
+            """
+            limit = i_max_total + 1
+        cur = connection.execute(query, {"start": start, "value": v_start, "limit": limit})
+        return cur.fetchone()[0]
 
     i = binary_search()
     if i is not None:
@@ -315,6 +573,69 @@ def sql_binary_search(
     return i
 
 
+class ChangeDetector:
+    """
+    Detect committed changes of other connections to a SQLite database.
+
+    Cheap checks of `PRAGMA data_version` and the size and modification time of the WAL file
+    instead of repeated (expensive) queries.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, filename: str):
+        self._connection = connection
+        self._wal_path = Path(f"{filename}-wal")
+        self._state = self._get_state()
+
+    def _get_state(self) -> Tuple[int, Optional[Tuple[int, int]]]:
+        data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+        try:
+            stat = self._wal_path.stat()
+            wal_state: Optional[Tuple[int, int]] = (stat.st_size, stat.st_mtime_ns)
+        except OSError:  # no WAL file
+            wal_state = None
+        return data_version, wal_state
+
+    def reset(self):
+        """Save current state, `changed` compares with this state."""
+        self._state = self._get_state()
+
+    def changed(self) -> bool:
+        """Check if database changed since last call (or `reset`)."""
+        state = self._get_state()
+        changed = state != self._state
+        self._state = state
+        return changed
+
+    def wait(
+        self,
+        min_interval: float,
+        max_interval: float,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait for database changes with adaptive polling interval (exponential backoff).
+
+        Args:
+            min_interval: Initial polling interval in seconds
+            max_interval: Maximum polling interval in seconds
+            timeout: Maximum time to wait in seconds. Wait infinitely if `None`
+
+        Returns:
+            `True` if database changed, `False` if timeout exceeded
+        """
+        interval = min_interval
+        deadline = None if timeout is None else monotonic() + timeout
+        while not self.changed():
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+                interval = min(interval, remaining)
+            sleep(interval)
+            interval = min(interval * 2, max_interval)
+        return True
+
+
 def create_new_database(filename: str, schema: str):
     if Path(filename).resolve().exists():
         raise ValueError("Can not create new database. File already exists")
@@ -362,6 +683,28 @@ def insert_from_dict(
     return cur.lastrowid or 0
 
 
+def insert_many_from_dicts(
+    connection: sqlite3.Connection,
+    table: str,
+    rows: Iterable[Dict[str, Any]],
+) -> int:
+    """
+    INSERT multiple rows in SQLite table with a single prepared statement (executemany).
+
+    All row dicts must share the same keys (column names), values can be `None`.
+
+    Returns:
+        Number of inserted rows
+    """
+    iterator = iter(rows)
+    first_row = next(iterator, None)
+    if first_row is None:
+        return 0
+    query = generate_insert_query(table, tuple(first_row.keys()))
+    cur = connection.executemany(query, chain([first_row], iterator))
+    return cur.rowcount
+
+
 @lru_cache(maxsize=128, typed=True)
 def generate_update_query(table: str, columns: Tuple[str, ...], key_column: str) -> str:
     """
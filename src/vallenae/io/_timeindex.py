@@ -0,0 +1,240 @@
+import json
+import logging
+import sqlite3
+import zipfile
+from bisect import bisect_left
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_VERSION = 2
+
+
+class TimeIndex:
+    """
+    Sidecar time index of a pridb or tradb (file ``<filename>.vaeidx``).
+
+    The Time column of the pridb/tradb is monotonic increasing but not indexed.
+    The time index stores sampled checkpoints (Time, SetID/TRAI, Chan) of every n-th record.
+    Lookups of time boundaries are an in-memory bisection of the checkpoints plus one small
+    range query between two checkpoints instead of a binary search with many single-row
+    queries (slow on cold caches and network filesystems).
+
+    The index is updated incrementally if records were appended to the database and rebuilt
+    if records were removed (checked with the number of valid sets, key ValidSets of the
+    globalinfo table).
+    """
+
+    def __init__(self, table: str, column_index: str, step: int):
+        """
+        Create empty time index, use `build` or `load` instead.
+
+        Args:
+            table: Table name, e.g. ae_data
+            column_index: Name of the indexed column, e.g. SetID
+            step: Sample every n-th record as checkpoint
+        """
+        if step < 1:
+            raise ValueError("Step must be greater than 0")
+        self._table = table
+        self._column_index = column_index
+        self._step = step
+        self._reset()
+
+    def _reset(self):
+        self._times: List[float] = []
+        self._indexes: List[int] = []
+        self._channels: List[int] = []
+        self._last_index: Optional[int] = None  # last scanned record
+        self._last_time: Optional[float] = None
+        self._rows_since_checkpoint = 0
+        self._valid_sets: Optional[int] = None  # last scanned rowid
+
+    @staticmethod
+    def path(filename: Union[str, Path]) -> Path:
+        """Path of the sidecar index file of a database."""
+        return Path(f"{filename}.vaeidx")
+
+    @property
+    def step(self) -> int:
+        """Sampling step of checkpoints (records)."""
+        return self._step
+
+    def __len__(self) -> int:
+        """Number of checkpoints."""
+        return len(self._indexes)
+
+    @classmethod
+    def build(
+        cls,
+        connection: sqlite3.Connection,
+        table: str,
+        column_index: str,
+        *,
+        step: int = 1000,
+        valid_sets: Optional[int] = None,
+    ) -> "TimeIndex":
+        """
+        Build time index of a database table.
+
+        Args:
+            connection: SQLite connection
+            table: Table name, e.g. ae_data
+            column_index: Name of the indexed column, e.g. SetID
+            step: Sample every n-th record as checkpoint
+            valid_sets: Number of valid sets (last valid rowid), `None` for all records
+
+        Raises:
+            ValueError: If the Time column is not sorted
+        """
+        index = cls(table, column_index, step)
+        index.update(connection, valid_sets)
+        return index
+
+    def update(self, connection: sqlite3.Connection, valid_sets: Optional[int] = None) -> bool:
+        """
+        Append checkpoints of new records or rebuild if records were removed.
+
+        Args:
+            connection: SQLite connection
+            valid_sets: Number of valid sets (last valid rowid), `None` for all records
+
+        Returns:
+            `True` if checkpoints were appended or the index was rebuilt
+
+        Raises:
+            ValueError: If the Time column is not sorted
+        """
+        if valid_sets is None:
+            valid_sets = connection.execute(f"SELECT MAX(rowid) FROM {self._table}").fetchone()[0]
+            valid_sets = 0 if valid_sets is None else valid_sets
+        if valid_sets == self._valid_sets:
+            return False
+        changed = False
+        if self._valid_sets is not None and valid_sets < self._valid_sets:
+            logger.info("Records of table %s removed, rebuild time index", self._table)
+            self._reset()
+            changed = True
+
+        cur = connection.execute(
+            f"SELECT {self._column_index}, Time, Chan FROM {self._table} "
+            f"WHERE {self._column_index} > ? AND rowid <= ? ORDER BY {self._column_index}",
+            (-1 if self._last_index is None else self._last_index, valid_sets),
+        )
+        last_time = self._last_time
+        for index, time, channel in cur:
+            if time is None:
+                continue
+            if last_time is not None and time < last_time:
+                raise ValueError("Value column Time not sorted")
+            if self._last_index is None or self._rows_since_checkpoint >= self._step:
+                self._times.append(time)
+                self._indexes.append(index)
+                self._channels.append(0 if channel is None else channel)
+                self._rows_since_checkpoint = 0
+                changed = True
+            self._rows_since_checkpoint += 1
+            self._last_index = index
+            last_time = time
+        self._last_time = last_time
+        self._valid_sets = valid_sets
+        return changed
+
+    def find_first(self, connection: sqlite3.Connection, value: float) -> Optional[int]:
+        """
+        Find first index (SetID/TRAI) with `Time >= value`.
+
+        Records appended after the last update are included in the search.
+
+        Returns:
+            Index or `None` if all records are before the given value
+        """
+        i = bisect_left(self._times, value)  # first checkpoint >= value
+        conditions = ["Time >= ?"]
+        params = [value]
+        if i > 0:
+            conditions.append(f"{self._column_index} > ?")
+            params.append(self._indexes[i - 1])
+        if i < len(self._indexes):
+            conditions.append(f"{self._column_index} <= ?")
+            params.append(self._indexes[i])
+        return connection.execute(
+            f"SELECT MIN({self._column_index}) FROM {self._table} WHERE {' AND '.join(conditions)}",
+            params,
+        ).fetchone()[0]
+
+    def find_last(self, connection: sqlite3.Connection, value: float) -> Optional[int]:
+        """
+        Find last index (SetID/TRAI) with `Time < value`.
+
+        Records appended after the last update are included in the search.
+
+        Returns:
+            Index or `None` if all records are after the given value
+        """
+        i = bisect_left(self._times, value)  # first checkpoint >= value
+        conditions = ["Time < ?"]
+        params = [value]
+        if i > 0:
+            conditions.append(f"{self._column_index} >= ?")
+            params.append(self._indexes[i - 1])
+        if i < len(self._indexes):
+            conditions.append(f"{self._column_index} < ?")
+            params.append(self._indexes[i])
+        return connection.execute(
+            f"SELECT MAX({self._column_index}) FROM {self._table} WHERE {' AND '.join(conditions)}",
+            params,
+        ).fetchone()[0]
+
+    def save(self, path: Union[str, Path]):
+        """Save time index to file (NumPy npz format)."""
+        path = Path(path)
+        meta = {
+            "version": _VERSION,
+            "table": self._table,
+            "column_index": self._column_index,
+            "step": self._step,
+            "last_index": self._last_index,
+            "last_time": self._last_time,
+            "rows_since_checkpoint": self._rows_since_checkpoint,
+            "valid_sets": self._valid_sets,
+        }
+        path_tmp = path.with_name(f"{path.name}.tmp")
+        with open(path_tmp, "wb") as file:
+            np.savez(
+                file,
+                meta=np.array(json.dumps(meta)),
+                times=np.array(self._times, dtype=np.float64),
+                indexes=np.array(self._indexes, dtype=np.int64),
+                channels=np.array(self._channels, dtype=np.int32),
+            )
+        path_tmp.replace(path)  # atomic
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TimeIndex":
+        """
+        Load time index from file.
+
+        Raises:
+            ValueError: If the file is not a valid time index
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                arrays = {key: data[key].tolist() for key in ("times", "indexes", "channels")}
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            raise ValueError(f"Invalid time index file {path}: {e}") from None
+        if meta.get("version") != _VERSION:
+            raise ValueError(f"Unsupported time index version {meta.get('version')}")
+        index = cls(meta["table"], meta["column_index"], meta["step"])
+        index._times = arrays["times"]
+        index._indexes = arrays["indexes"]
+        index._channels = arrays["channels"]
+        index._last_index = meta["last_index"]
+        index._last_time = meta["last_time"]
+        index._rows_since_checkpoint = meta["rows_since_checkpoint"]
+        index._valid_sets = meta["valid_sets"]
+        return index
@@ -0,0 +1,171 @@
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, List, Optional
+
+if TYPE_CHECKING:
+    from ._database import Database  # pragma: no cover
+
+logger = logging.getLogger(__name__)
+
+_FLUSH = object()
+_STOP = object()
+
+
+def _stop_thread(items: queue.Queue, thread: threading.Thread):
+    """Write all queued records and stop the writer thread (called once by finalizer)."""
+    items.put(_STOP)
+    thread.join()
+
+
+class BackgroundWriter:
+    """
+    Write records asynchronously with a dedicated writer thread.
+
+    Records are put into a bounded queue and written in batches by a writer thread
+    (group commit: one transaction per batch).
+    The writer thread opens its own connection to the database file.
+    Use `Database.background_writer` to create a writer.
+
+    If the writer thread fails, the error is raised by all following calls of `write`, `flush`
+    and `close`. Records queued after the error are discarded.
+
+    Queued records are written at interpreter exit if the writer is not closed explicitly.
+    Nevertheless, always `close` the writer (or use a with statement) to get write errors.
+    """
+
+    def __init__(
+        self,
+        database: "Database",
+        *,
+        batch_size: int = 1000,
+        flush_interval: float = 0.1,
+        queue_size: int = 10_000,
+    ):
+        """
+        Start background writer.
+
+        Args:
+            database: Database (opened in write mode) to write records to
+            batch_size: Maximum number of records written within a single transaction
+            flush_interval: Maximum time in seconds records are buffered before written
+            queue_size: Maximum number of queued records.
+                `write` blocks if the queue is full (backpressure).
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be greater than 0")
+        if flush_interval < 0:
+            raise ValueError("Flush interval must not be negative")
+
+        self._database = database
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 0))
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._written = 0
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"BackgroundWriter({database.filename})",
+            daemon=True,
+        )
+        self._thread.start()
+        # the writer thread is a daemon thread and would be killed at interpreter exit
+        self._finalizer = weakref.finalize(self, _stop_thread, self._queue, self._thread)
+
+    @property
+    def written(self) -> int:
+        """Number of written records."""
+        return self._written
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued records (not yet written)."""
+        return self._queue.qsize()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError("Background writer failed") from self._error
+
+    def write(self, record: Any, timeout: Optional[float] = None):
+        """
+        Put record into the write queue.
+
+        Blocks if the queue is full until a free slot is available (backpressure).
+
+        Args:
+            record: Record to write, e.g. `HitRecord` for a pridb
+            timeout: Maximum time in seconds to wait for a free slot. Wait infinitely if `None`
+
+        Raises:
+            RuntimeError: If the writer is closed or failed
+            queue.Full: If no free slot is available within the timeout
+        """
+        if self._closed:
+            raise RuntimeError("Background writer is closed")
+        self._raise_error()
+        self._queue.put(record, timeout=timeout)
+
+    def flush(self):
+        """Write all queued records and wait until finished."""
+        if not self._closed:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Write all queued records, wait until finished and stop the writer thread."""
+        if not self._closed:
+            self._closed = True
+            self._finalizer()
+        self._raise_error()
+
+    def _next_batch(self) -> List[Any]:
+        """Get next batch of items (records and control items) from the queue."""
+        items = [self._queue.get()]  # wait for first item
+        deadline = time.monotonic() + self._flush_interval
+        while items[-1] is not _FLUSH and items[-1] is not _STOP:
+            if len(items) >= self._batch_size:
+                break
+            timeout = deadline - time.monotonic()
+            try:
+                items.append(self._queue.get(timeout=max(timeout, 0)))
+            except queue.Empty:
+                break
+        return items
+
+    def _run(self):
+        # pylint: disable=protected-access
+        database: Optional["Database"] = None
+        try:
+            database = self._database._open_writer_database()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.exception("Background writer failed to open %s", self._database.filename)
+            self._error = e
+
+        stop = False
+        while not stop:
+            items = self._next_batch()
+            stop = items[-1] is _STOP
+            records = [item for item in items if item is not _FLUSH and item is not _STOP]
+            try:
+                if records and database is not None and self._error is None:
+                    database._write_batch(records)
+                    self._written += len(records)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.exception("Background writer failed to write %d records", len(records))
+                self._error = e
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+        if database is not None:
+            database.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
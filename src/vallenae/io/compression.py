@@ -1,4 +1,5 @@
 import io
+from typing import Optional
 
 import numpy as np
 
@@ -16,7 +17,12 @@ def _check_flac_codec():
 
 
 def decode_data_blob(
-    data_blob: bytes, data_format: int, factor_millivolts: float, *, raw: bool = False
+    data_blob: bytes,
+    data_format: int,
+    factor_millivolts: float,
+    *,
+    raw: bool = False,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Decodes (compressed) 16-bit ADC values from BLOB to array of voltage values.
@@ -29,9 +35,13 @@ def decode_data_blob(
         factor_millivolts: Factor from int16 representation to millivolts.
             Stored in tradb -> tr_params as 'TR_mV'
         raw: Return data as ADC values (`np.int16`), `factor_millivolts` will be ignored
+        out: Optional output array to decode the data into (avoids allocation).
+            The decoded values are written to the beginning of the array,
+            which must be large enough to hold all samples
 
     Returns:
-        Array of voltage values or ADC values if `raw` is `True`
+        Array of voltage values or ADC values if `raw` is `True`.
+        View of the first samples of `out` if provided
     """
 
     def get_data_int16():
@@ -43,6 +53,13 @@ def decode_data_blob(
         raise ValueError("Data format not supported")
 
     data_int16 = get_data_int16()
+    if out is not None:
+        out_view = out[: len(data_int16)]
+        if raw:
+            out_view[:] = data_int16
+        else:
+            np.multiply(data_int16, 1e-3 * factor_millivolts, out=out_view, dtype=np.float32)
+        return out_view
     if raw:
         return data_int16
     return np.multiply(data_int16, 1e-3 * factor_millivolts, dtype=np.float32)
@@ -1,10 +1,11 @@
 # ruff: noqa: E501
 
 from enum import IntEnum, IntFlag
-from typing import Any, Dict, NamedTuple, Optional
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union, cast
 
 import numpy as np
 
+from ._sql import ColumnIndex, sql_row_getter
 from .compression import decode_data_blob
 
 
@@ -120,6 +121,83 @@ class HitRecord(NamedTuple):
             cascade_signal_strength=row.get("CSS"),  # optional
         )
 
+    @classmethod
+    def sql_row_factory(cls, columns: ColumnIndex) -> Callable[[Tuple], "HitRecord"]:
+        """
+        Create function to convert SQL rows (tuples) to `HitRecord`.
+
+        Args:
+            columns: Dict of column names and indexes in the rows
+        """
+        getter = sql_row_getter(
+            columns,
+            (
+                "SetID",
+                "Time",
+                "Chan",
+                "Status",
+                "ParamID",
+                "Thr",
+                "Amp",
+                "RiseT",
+                "Dur",
+                "Eny",
+                "SS",
+                "RMS",
+                "Counts",
+                "TRAI",
+                "CHits",
+                "CCnt",
+                "CEny",
+                "CSS",
+            ),
+            optional=("Thr", "RiseT", "SS", "Counts", "TRAI", "CHits", "CCnt", "CEny", "CSS"),
+        )
+
+        def create(row: Tuple) -> "HitRecord":
+            (
+                set_id,
+                time,
+                chan,
+                status,
+                param_id,
+                thr,
+                amp,
+                rise_t,
+                dur,
+                eny,
+                ss,
+                rms,
+                counts,
+                trai,
+                chits,
+                ccnt,
+                ceny,
+                css,
+            ) = getter(row)
+            return cls(
+                set_id=set_id,
+                time=time,
+                channel=chan,
+                status=status,
+                param_id=param_id,
+                threshold=_to_volts(thr),  # optional
+                amplitude=_to_volts(amp),
+                rise_time=_to_seconds(rise_t),  # optional
+                duration=_to_seconds(dur),
+                energy=eny,
+                signal_strength=ss,  # optional for spotWave
+                rms=_to_volts(rms),
+                counts=counts,  # optional
+                trai=trai,  # optional
+                cascade_hits=chits,  # optional
+                cascade_counts=ccnt,  # optional
+                cascade_energy=ceny,  # optional
+                cascade_signal_strength=css,  # optional
+            )
+
+        return create
+
 
 class MarkerRecord(NamedTuple):
     """
@@ -149,6 +227,22 @@ class MarkerRecord(NamedTuple):
             data=row["Data"],
         )
 
+    @classmethod
+    def sql_row_factory(cls, columns: ColumnIndex) -> Callable[[Tuple], "MarkerRecord"]:
+        """
+        Create function to convert SQL rows (tuples) to `MarkerRecord`.
+
+        Args:
+            columns: Dict of column names and indexes in the rows
+        """
+        getter = sql_row_getter(columns, ("SetID", "Time", "SetType", "Number", "Data"))
+
+        def create(row: Tuple) -> "MarkerRecord":
+            set_id, time, set_type, number, data = getter(row)
+            return cls(set_id=set_id, time=time, set_type=set_type, number=number, data=data)
+
+        return create
+
 
 class StatusRecord(NamedTuple):
     """
@@ -186,6 +280,36 @@ class StatusRecord(NamedTuple):
             rms=_to_volts(row["RMS"]),  # optional
         )
 
+    @classmethod
+    def sql_row_factory(cls, columns: ColumnIndex) -> Callable[[Tuple], "StatusRecord"]:
+        """
+        Create function to convert SQL rows (tuples) to `StatusRecord`.
+
+        Args:
+            columns: Dict of column names and indexes in the rows
+        """
+        getter = sql_row_getter(
+            columns,
+            ("SetID", "Time", "Chan", "Status", "ParamID", "Thr", "Eny", "SS", "RMS"),
+            optional=("Thr", "SS"),
+        )
+
+        def create(row: Tuple) -> "StatusRecord":
+            set_id, time, chan, status, param_id, thr, eny, ss, rms = getter(row)
+            return cls(
+                set_id=set_id,
+                time=time,
+                channel=chan,
+                status=status,
+                param_id=param_id,
+                threshold=_to_volts(thr),  # optional
+                energy=eny,
+                signal_strength=ss,  # optional for spotWave
+                rms=_to_volts(rms),  # optional
+            )
+
+        return create
+
 
 class ParametricRecord(NamedTuple):
     """
@@ -233,10 +357,44 @@ class ParametricRecord(NamedTuple):
             pa7=row.get("PA7"),  # optional
         )
 
+    @classmethod
+    def sql_row_factory(cls, columns: ColumnIndex) -> Callable[[Tuple], "ParametricRecord"]:
+        """
+        Create function to convert SQL rows (tuples) to `ParametricRecord`.
 
-class TraRecord(NamedTuple):
-    """Transient data record in tradb."""
+        Args:
+            columns: Dict of column names and indexes in the rows
+        """
+        optional = ("PCTD", "PCTA", "PA0", "PA1", "PA2", "PA3", "PA4", "PA5", "PA6", "PA7")
+        getter = sql_row_getter(
+            columns, ("SetID", "Time", "Status", "ParamID", *optional), optional=optional
+        )
 
+        def create(row: Tuple) -> "ParametricRecord":
+            set_id, time, status, param_id, pctd, pcta, pa0, pa1, pa2, pa3, pa4, pa5, pa6, pa7 = (
+                getter(row)
+            )
+            return cls(
+                set_id=set_id,
+                time=time,
+                status=status,
+                param_id=param_id,
+                pctd=pctd,  # optional
+                pcta=pcta,  # optional
+                pa0=pa0,  # optional
+                pa1=pa1,  # optional
+                pa2=pa2,  # optional
+                pa3=pa3,  # optional
+                pa4=pa4,  # optional
+                pa5=pa5,  # optional
+                pa6=pa6,  # optional
+                pa7=pa7,  # optional
+            )
+
+        return create
+
+
+class _TraRecord(NamedTuple):
     time: float  #: Time in seconds
     channel: int  #: Channel number
     param_id: int  #: Parameter ID of table tr_params for ADC value conversion
@@ -252,6 +410,114 @@ class TraRecord(NamedTuple):
     # optional
     raw: bool = False  #: `data` is stored as ADC values (int16)
 
+
+class TraRecord(_TraRecord):
+    """
+    Transient data record in tradb.
+
+    Records read from the tradb store the ADC values (int16) and the conversion factor
+    `factor_millivolts`. The signal is converted to volts on first access of `data`
+    (or `data_volts`) and cached.
+    """
+
+    _DATA_INDEX = _TraRecord._fields.index("data")
+
+    # stored in the instance dict, not part of the tuple (positional unpacking unchanged)
+    _factor_millivolts: Optional[float] = None
+    _adc: Optional[np.ndarray] = None  # ADC values of records with `raw` = `False`
+    _volts: Optional[np.ndarray] = None  # cached conversion to volts
+
+    def __new__(cls, *args, factor_millivolts: Optional[float] = None, **kwargs):
+        record = super().__new__(cls, *args, **kwargs)
+        record._factor_millivolts = factor_millivolts
+        return record
+
+    @classmethod
+    def _from_adc(
+        cls, data: np.ndarray, factor_millivolts: Optional[float], *, raw: bool, **kwargs
+    ) -> "TraRecord":
+        """Create record from ADC values, the conversion to volts is deferred if not `raw`."""
+        record = cls(data=data, raw=raw, factor_millivolts=factor_millivolts, **kwargs)
+        if not raw:
+            record._adc = data
+        return record
+
+    @property
+    def factor_millivolts(self) -> Optional[float]:
+        """Factor to convert ADC values to millivolts."""
+        return self._factor_millivolts
+
+    @property
+    def _stored_data(self) -> np.ndarray:
+        return super().data
+
+    @property
+    def data(self) -> np.ndarray:  # type: ignore[override]
+        """Transient signal in volts or ADC values if `raw` = `True`."""
+        if self.raw or self._adc is None:
+            return self._stored_data
+        return self.data_volts
+
+    @property
+    def raw_data(self) -> np.ndarray:
+        """
+        Transient signal as ADC values (int16).
+
+        Records read from the tradb return the stored ADC values without any conversion.
+        Otherwise the signal is converted back from volts with `factor_millivolts`:
+        The values are rounded to the nearest ADC value and clipped to the int16 range.
+        """
+        if self.raw:
+            return self._stored_data
+        if self._adc is not None:
+            return self._adc
+        data = self._stored_data
+        if data is None:
+            return data
+        if self.factor_millivolts is None:
+            raise ValueError("Conversion factor unknown, can not convert data to ADC values")
+        data = np.rint(data / (1e-3 * self.factor_millivolts))
+        return np.clip(data, -32768, 32767).astype(np.int16)
+
+    @property
+    def data_volts(self) -> np.ndarray:
+        """
+        Transient signal in volts.
+
+        The ADC values are converted with `factor_millivolts` on first access and cached.
+        """
+        if self._volts is not None:
+            return self._volts
+        if not self.raw and self._adc is None:
+            return self._stored_data
+        data = self.raw_data
+        if data is None:
+            return data
+        if self.factor_millivolts is None:
+            raise ValueError("Conversion factor unknown, can not convert data to volts")
+        self._volts = np.multiply(data, 1e-3 * self.factor_millivolts, dtype=np.float32)
+        return self._volts
+
+    def __iter__(self):
+        values = list(super().__iter__())
+        values[self._DATA_INDEX] = self.data
+        return iter(values)
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._asdict().items())
+        return f"{type(self).__name__}({fields})"
+
+    def _replace(self, **kwargs) -> "TraRecord":
+        record = super()._replace(**kwargs)
+        if "data" in kwargs or "raw" in kwargs:
+            record._factor_millivolts = self._factor_millivolts
+        else:
+            record.__dict__.update(self.__dict__)  # keep ADC values and cached conversion
+        return record
+
     @classmethod
     def from_sql(cls, row: Dict[str, Any], *, raw: bool = False) -> "TraRecord":
         """
@@ -261,7 +527,7 @@ class TraRecord(NamedTuple):
             row: Dict of column names and values
             raw: Provide `data` as ADC values (int16)
         """
-        return TraRecord(
+        return cls._from_adc(
             time=row["Time"],
             channel=row["Chan"],
             status=row["Status"],
@@ -270,11 +536,150 @@ class TraRecord(NamedTuple):
             threshold=_to_volts(row["Thr"]),
             samplerate=row["SampleRate"],
             samples=row["Samples"],
-            data=decode_data_blob(row["Data"], row["DataFormat"], row["TR_mV"], raw=raw),
+            data=decode_data_blob(row["Data"], row["DataFormat"], row["TR_mV"], raw=True),
+            factor_millivolts=row["TR_mV"],
             trai=row["TRAI"],
             raw=raw,
         )
 
+    @classmethod
+    def sql_row_factory(
+        cls, columns: ColumnIndex, *, raw: bool = False
+    ) -> Callable[[Tuple], "TraRecord"]:
+        """
+        Create function to convert SQL rows (tuples) to `TraRecord`.
+
+        Args:
+            columns: Dict of column names and indexes in the rows
+            raw: Provide `data` as ADC values (int16)
+        """
+        getter = sql_row_getter(
+            columns,
+            (
+                "Time",
+                "Chan",
+                "Status",
+                "ParamID",
+                "Pretrigger",
+                "Thr",
+                "SampleRate",
+                "Samples",
+                "DataFormat",
+                "Data",
+                "TR_mV",
+                "TRAI",
+            ),
+        )
+
+        def create(row: Tuple) -> "TraRecord":
+            (
+                time,
+                chan,
+                status,
+                param_id,
+                pretrigger,
+                thr,
+                samplerate,
+                samples,
+                data_format,
+                data_blob,
+                tr_mv,
+                trai,
+            ) = getter(row)
+            return cls._from_adc(
+                time=time,
+                channel=chan,
+                status=status,
+                param_id=param_id,
+                pretrigger=pretrigger,
+                threshold=_to_volts(thr),
+                samplerate=samplerate,
+                samples=samples,
+                data=(
+                    decode_data_blob(data_blob, data_format, tr_mv, raw=True)
+                    if data_blob is not None
+                    else cast(np.ndarray, None)  # column Data not selected
+                ),
+                factor_millivolts=tr_mv,
+                trai=trai,
+                raw=raw,
+            )
+
+        return create
+
+
+class TraBatch(NamedTuple):
+    """
+    Batch of transient data records in tradb.
+
+    The transient signals are stored row-wise in a single, zero-padded matrix.
+    Metadata is stored in arrays with one element per record.
+    """
+
+    # fmt: off
+    time: np.ndarray  #: Time in seconds
+    channel: np.ndarray  #: Channel number
+    param_id: np.ndarray  #: Parameter ID of table tr_params for ADC value conversion
+    pretrigger: np.ndarray  #: Pretrigger samples
+    threshold: np.ndarray  #: Threshold amplitude in volts
+    samplerate: np.ndarray  #: Samplerate in Hz
+    samples: np.ndarray  #: Number of samples (valid length of the rows of `data`)
+    data: np.ndarray  #: Zero-padded matrix (records x samples) of transient signals in volts or ADC values if `raw` = `True`
+    status: np.ndarray  #: Status flags
+    trai: np.ndarray  #: Transient recorder index (foreign key between pridb and tradb)
+    raw: bool = False  #: `data` is stored as ADC values (int16)
+    # fmt: on
+
+
+class ContinuousWaveChunk(NamedTuple):
+    """
+    Chunk of a continuous transient signal, see `TraDatabase.iread_continuous_wave`.
+    """
+
+    time: float  #: Time of the first sample in seconds
+    samplerate: int  #: Samplerate in Hz
+    data: np.ndarray  #: Transient signal in volts or ADC values if `raw` = `True`
+
+
+class TimeAxis:
+    """
+    Lazy time axis of an evenly sampled signal, see `TraDatabase.read_continuous_wave`.
+
+    Time values are computed on access (indexing, slicing) instead of being stored.
+    Use `np.asarray` to create the full array.
+    """
+
+    __slots__ = ("samplerate", "samples", "start")
+
+    def __init__(self, start: float, samplerate: int, samples: int):
+        """
+        Args:
+            start: Time of the first sample in seconds
+            samplerate: Samplerate in Hz
+            samples: Number of samples
+        """
+        self.start = start
+        self.samplerate = samplerate
+        self.samples = samples
+
+    def __len__(self) -> int:
+        return self.samples
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, np.ndarray]:
+        indices = range(self.samples)[index]
+        if isinstance(indices, int):
+            return float(np.float32(indices) / self.samplerate + self.start)
+        return (
+            np.arange(indices.start, indices.stop, indices.step, dtype=np.float32) / self.samplerate
+            + self.start
+        )
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self[:], dtype=dtype)
+
+    def __repr__(self):
+        return f"TimeAxis(start={self.start}, samplerate={self.samplerate}, samples={self.samples})"
+
 
 class FeatureRecord(NamedTuple):
     """
@@ -296,3 +701,35 @@ class FeatureRecord(NamedTuple):
             trai=row.pop("TRAI"),
             features=row,
         )
+
+    @classmethod
+    def sql_row_factory(cls, columns: ColumnIndex) -> Callable[[Tuple], "FeatureRecord"]:
+        """
+        Create function to convert SQL rows (tuples) to `FeatureRecord`.
+
+        Args:
+            columns: Dict of column names and indexes in the rows
+        """
+        index_trai = columns["TRAI"]
+        features = [(name, index) for name, index in columns.items() if name != "TRAI"]
+
+        def create(row: Tuple) -> "FeatureRecord":
+            return cls(
+                trai=row[index_trai],
+                features={name: row[index] for name, index in features},
+            )
+
+        return create
+
+
+class JoinedRecord(NamedTuple):
+    """
+    Hit record joined with its transient data and features by TRAI.
+
+    Missing parts are `None`, e.g. if the hit has no transient data or parts were not available
+    within the timeout of `listen_joined`.
+    """
+
+    hit: HitRecord  #: Hit record of pridb
+    tra: Optional[TraRecord] = None  #: Transient data record of tradb
+    features: Optional[FeatureRecord] = None  #: Feature record of trfdb
@@ -1,44 +1,110 @@
 from functools import wraps
+from itertools import groupby
 from pathlib import Path
-from time import sleep
-from typing import Iterable, Optional, Sequence, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pandas as pd
 
+from ._arrow import query_to_arrow
 from ._database import Database, require_write_access
-from ._dataframe import iter_to_dataframe
+from ._dataframe import ColumnSpec, iter_from_dataframe, iter_to_dataframe, query_to_dataframe
 from ._sql import (
+    ColumnIndex,
     QueryIterable,
+    aiter_threaded,
     create_new_database,
     insert_from_dict,
+    insert_many_from_dicts,
     query_conditions,
-    read_sql_generator,
+    query_select,
+    remove_none_values_from_dict,
 )
 from .datatypes import HitRecord, MarkerRecord, ParametricRecord, SetType, StatusRecord
 from .types import SizedIterable
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 RecordType = Union[HitRecord, MarkerRecord, ParametricRecord, StatusRecord]
 
+# columns of HitRecord (same order and conversions as HitRecord.from_sql)
+_HIT_COLUMNS = (
+    ColumnSpec("time", "Time"),
+    ColumnSpec("channel", "Chan", integer=True),
+    ColumnSpec("param_id", "ParamID", integer=True),
+    ColumnSpec("amplitude", "Amp", divisor=1e6),
+    ColumnSpec("duration", "Dur", divisor=1e6),
+    ColumnSpec("energy", "Eny"),
+    ColumnSpec("rms", "RMS", divisor=1e6),
+    ColumnSpec("set_id", "SetID", integer=True),
+    ColumnSpec("status", "Status", integer=True),
+    ColumnSpec("threshold", "Thr", divisor=1e6),
+    ColumnSpec("rise_time", "RiseT", divisor=1e6),
+    ColumnSpec("signal_strength", "SS"),
+    ColumnSpec("counts", "Counts", integer=True),
+    ColumnSpec("trai", "TRAI", integer=True),
+    ColumnSpec("cascade_hits", "CHits", integer=True),
+    ColumnSpec("cascade_counts", "CCnt", integer=True),
+    ColumnSpec("cascade_energy", "CEny"),
+    ColumnSpec("cascade_signal_strength", "CSS"),
+)
+
+# columns of StatusRecord (same order and conversions as StatusRecord.from_sql)
+_STATUS_COLUMNS = (
+    ColumnSpec("time", "Time"),
+    ColumnSpec("channel", "Chan", integer=True),
+    ColumnSpec("param_id", "ParamID", integer=True),
+    ColumnSpec("energy", "Eny"),
+    ColumnSpec("rms", "RMS", divisor=1e6),
+    ColumnSpec("set_id", "SetID", integer=True),
+    ColumnSpec("status", "Status", integer=True),
+    ColumnSpec("threshold", "Thr", divisor=1e6),
+    ColumnSpec("signal_strength", "SS"),
+)
+
+
+def _field_columns(columns: Sequence[ColumnSpec]) -> Dict[str, Sequence[str]]:
+    return {spec.field: (spec.sql_column,) for spec in columns}
+
+
+def _get_max_time(database: "PriDatabase") -> float:
+    con = database.connection()
+    cur = con.execute("SELECT Time FROM view_ae_data ORDER BY SetID DESC LIMIT 1")
+    try:
+        return cur.fetchone()[0]  # None is not subscriptable -> TypeError
+    except TypeError:
+        return 0
+
+
+def _validate_monotonic_time(time: float, max_time: float):
+    if time + 1e-9 < max_time:  # threshold of 1 ns to ignore rounding errors
+        raise ValueError(
+            (
+                f"Time column has to be monotonic increasing. "
+                f"Time of current / last row: {time} / {max_time} s"
+            )
+        )
 
-def check_monotonic_time(func):
-    def get_max_time(database: "PriDatabase"):
-        con = database.connection()
-        cur = con.execute("SELECT Time FROM view_ae_data ORDER BY SetID DESC LIMIT 1")
-        try:
-            return cur.fetchone()[0]  # None is not subscriptable -> TypeError
-        except TypeError:
-            return 0
 
+def check_monotonic_time(func):
     @wraps(func)
     def wrapper(self: "PriDatabase", record: RecordType, *args, **kwargs):
-        max_time = get_max_time(self)
-        if record.time + 1e-9 < max_time:  # threshold of 1 ns to ignore rounding errors
-            raise ValueError(
-                (
-                    f"Time column has to be monotonic increasing. "
-                    f"Time of current / last row: {record.time} / {max_time} s"
-                )
-            )
+        _validate_monotonic_time(record.time, _get_max_time(self))
         return func(self, record, *args, **kwargs)
 
     return wrapper
@@ -47,6 +113,9 @@ def check_monotonic_time(func):
 class PriDatabase(Database):
     """IO wrapper for pridb database file."""
 
+    _time_index_column = "SetID"
+    _default_indexes = (("Chan", "SetID"),)
+
     def __init__(self, filename: str, mode: str = "ro"):
         """
         Open pridb database file.
@@ -88,18 +157,48 @@ class PriDatabase(Database):
         """
         Read hits to Pandas DataFrame.
 
+        The hits are read column-wise in batches without creating `HitRecord` objects.
+
         Args:
             **kwargs: Arguments passed to `iread_hits`
 
         Returns:
             Pandas DataFrame with hit data
         """
-        return iter_to_dataframe(
-            self.iread_hits(**kwargs),
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        return query_to_dataframe(
+            connection_wrapper.connection(),
+            self._query_hits(**kwargs),
+            _HIT_COLUMNS,
             desc="Hits",
             index_column="set_id",
         )
 
+    def read_hits_arrow(self, *, show_progress: bool = True, **kwargs) -> "pa.Table":
+        """
+        Read hits to Apache Arrow table (requires pyarrow).
+
+        The hits are read in record batches directly from the SQLite cursor,
+        missing values are stored as nulls. Columns are named like the fields of `HitRecord`.
+        Hand off to pandas or polars without copying, e.g. with
+        `table.to_pandas(types_mapper=pd.ArrowDtype)` or `polars.from_arrow(table)`.
+
+        Args:
+            show_progress: Show progress bar. Default: `True`
+            **kwargs: Arguments passed to `iread_hits`
+
+        Returns:
+            Arrow table with hits
+        """
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        return query_to_arrow(
+            connection_wrapper.connection(),
+            self._query_hits(**kwargs),
+            _HIT_COLUMNS,
+            show_progress=show_progress,
+            desc="Hits",
+        )
+
     def read_markers(self, **kwargs) -> pd.DataFrame:
         """
         Read marker to Pandas DataFrame.
@@ -146,12 +245,40 @@ class PriDatabase(Database):
         Returns:
             Pandas DataFrame with status data
         """
-        return iter_to_dataframe(
-            self.iread_status(**kwargs),
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        return query_to_dataframe(
+            connection_wrapper.connection(),
+            self._query_status(**kwargs),
+            _STATUS_COLUMNS,
             desc="Status",
             index_column="set_id",
         )
 
+    def read_status_arrow(self, *, show_progress: bool = True, **kwargs) -> "pa.Table":
+        """
+        Read status data to Apache Arrow table (requires pyarrow).
+
+        The status records are read in record batches directly from the SQLite cursor,
+        missing values are stored as nulls. Columns are named like the fields of `StatusRecord`.
+        Hand off to pandas or polars without copying, e.g. with
+        `table.to_pandas(types_mapper=pd.ArrowDtype)` or `polars.from_arrow(table)`.
+
+        Args:
+            show_progress: Show progress bar. Default: `True`
+            **kwargs: Arguments passed to `iread_status`
+
+        Returns:
+            Arrow table with status data
+        """
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        return query_to_arrow(
+            connection_wrapper.connection(),
+            self._query_status(**kwargs),
+            _STATUS_COLUMNS,
+            show_progress=show_progress,
+            desc="Status",
+        )
+
     def read(self, **kwargs) -> pd.DataFrame:
         """
         Read all data set types (hits, markers, parametric data, status data)
@@ -198,6 +325,63 @@ class PriDatabase(Database):
             .rename_axis(df_hits.index.name)
         )
 
+    def _get_set_id_range_from_time_range(
+        self, time_start: Optional[float], time_stop: Optional[float]
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Use binary search or time index to find indexes (SetID) of a given time range.
+
+        The Time column of ae_data is monotonic increasing with the SetID (see
+        `check_monotonic_time`). The SetID range narrows down the (not indexed) time conditions.
+        The time range is widened by one tick of the timebase to compensate rounding errors of the
+        view's time conversion, exact time conditions have to be applied in the query.
+        """
+        set_id_min, set_id_max = self._main_index_range()
+        if set_id_min is None:  # empty database
+            return None, None
+
+        set_id_start = None
+        set_id_stop = None
+        if time_start is not None:
+            set_id_start = self._search_time(time_start * self._timebase - 1, lower_bound=True)
+            if set_id_start is None:  # all records before time_start -> empty range
+                set_id_start = set_id_max + 1
+        if time_stop is not None:
+            set_id_stop = self._search_time(time_stop * self._timebase + 1, lower_bound=False)
+            if set_id_stop is None:  # all records after time_stop -> empty range
+                set_id_stop = set_id_min - 1
+        return set_id_start, set_id_stop
+
+    def _query_hits(
+        self,
+        *,
+        channel: Union[int, Sequence[int], None] = None,
+        time_start: Optional[float] = None,
+        time_stop: Optional[float] = None,
+        set_id: Union[int, Sequence[int], None] = None,
+        query_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> str:
+        """Build query for hits, see `iread_hits`."""
+        set_id_start, set_id_stop = self._get_set_id_range_from_time_range(time_start, time_stop)
+        select = query_select(_field_columns(_HIT_COLUMNS), columns, required=["set_id"])
+        # nested query to fix ambiguous column name error with query_filter
+        return f"""
+        SELECT {select} FROM (
+            SELECT vae.*, ae.ParamID
+            FROM view_ae_data vae
+            LEFT JOIN ae_data ae ON vae.SetID == ae.SetID
+        )
+        """ + query_conditions(
+            equal={"SetType": 2},
+            isin={"Chan": channel, "SetID": set_id},
+            greater_equal={"SetID": set_id_start, "Time": time_start},
+            less={"Time": time_stop},
+            # < condition already met in binary search, use <= here for found indice range
+            less_equal={"SetID": set_id_stop},
+            custom_filter=query_filter,
+        )
+
     def iread_hits(
         self,
         *,
@@ -206,6 +390,7 @@ class PriDatabase(Database):
         time_stop: Optional[float] = None,
         set_id: Union[None, int, Sequence[int]] = None,
         query_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> SizedIterable[HitRecord]:
         """
         Stream hits with returned iterable.
@@ -218,28 +403,24 @@ class PriDatabase(Database):
             set_id: Read by SetID
             query_filter: Optional query filter provided as SQL clause,
                 e.g. "Amp > 5000 AND RiseT < 1000"
+            columns: Read only given fields of `HitRecord`, e.g. ["time", "channel", "amplitude"].
+                Other fields are `None`. Read all fields if `None`
 
         Returns:
             Sized iterable to sequential read hits
         """
-        # nested query to fix ambiguous column name error with query_filter
-        query = """
-        SELECT * FROM (
-            SELECT vae.*, ae.ParamID
-            FROM view_ae_data vae
-            LEFT JOIN ae_data ae ON vae.SetID == ae.SetID
-        )
-        """ + query_conditions(
-            equal={"SetType": 2},
-            isin={"Chan": channel, "SetID": set_id},
-            greater_equal={"Time": time_start},
-            less={"Time": time_stop},
-            custom_filter=query_filter,
+        query = self._query_hits(
+            channel=channel,
+            time_start=time_start,
+            time_stop=time_stop,
+            set_id=set_id,
+            query_filter=query_filter,
+            columns=columns,
         )
         return QueryIterable(
             self._connection_wrapper.get_readonly_connection(),
             query,
-            HitRecord.from_sql,
+            row_factory=HitRecord.sql_row_factory,
         )
 
     def iread_markers(
@@ -263,19 +444,22 @@ class PriDatabase(Database):
         Returns:
             Sized iterable to sequential read markers
         """
+        set_id_start, set_id_stop = self._get_set_id_range_from_time_range(time_start, time_stop)
         query = """
         SELECT SetID, Time, SetType, Number, Data
         FROM view_ae_markers vae
         """ + query_conditions(
             isin={"SetID": set_id},
-            greater_equal={"Time": time_start},
+            greater_equal={"SetID": set_id_start, "Time": time_start},
             less={"Time": time_stop},
+            # < condition already met in binary search, use <= here for found indice range
+            less_equal={"SetID": set_id_stop},
             custom_filter=query_filter,
         )
         return QueryIterable(
             self._connection_wrapper.get_readonly_connection(),
             query,
-            MarkerRecord.from_sql,
+            row_factory=MarkerRecord.sql_row_factory,
         )
 
     def iread_parametric(
@@ -299,6 +483,7 @@ class PriDatabase(Database):
         Returns:
             Sized iterable to sequential read parametric data
         """
+        set_id_start, set_id_stop = self._get_set_id_range_from_time_range(time_start, time_stop)
         # nested query to fix ambiguous column name error with query_filter
         query = """
         SELECT * FROM (
@@ -309,14 +494,46 @@ class PriDatabase(Database):
         """ + query_conditions(
             equal={"SetType": 1},
             isin={"SetID": set_id},
-            greater_equal={"Time": time_start},
+            greater_equal={"SetID": set_id_start, "Time": time_start},
             less={"Time": time_stop},
+            # < condition already met in binary search, use <= here for found indice range
+            less_equal={"SetID": set_id_stop},
             custom_filter=query_filter,
         )
         return QueryIterable(
             self._connection_wrapper.get_readonly_connection(),
             query,
-            ParametricRecord.from_sql,
+            row_factory=ParametricRecord.sql_row_factory,
+        )
+
+    def _query_status(
+        self,
+        *,
+        channel: Union[int, Sequence[int], None] = None,
+        time_start: Optional[float] = None,
+        time_stop: Optional[float] = None,
+        set_id: Union[int, Sequence[int], None] = None,
+        query_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> str:
+        """Build query for status data, see `iread_status`."""
+        set_id_start, set_id_stop = self._get_set_id_range_from_time_range(time_start, time_stop)
+        select = query_select(_field_columns(_STATUS_COLUMNS), columns, required=["set_id"])
+        # nested query to fix ambiguous column name error with query_filter
+        return f"""
+        SELECT {select} FROM (
+            SELECT vae.*, ae.ParamID
+            FROM view_ae_data vae
+            LEFT JOIN ae_data ae ON vae.SetID == ae.SetID
+        )
+        """ + query_conditions(
+            equal={"SetType": 3},
+            isin={"Chan": channel, "SetID": set_id},
+            greater_equal={"SetID": set_id_start, "Time": time_start},
+            less={"Time": time_stop},
+            # < condition already met in binary search, use <= here for found indice range
+            less_equal={"SetID": set_id_stop},
+            custom_filter=query_filter,
         )
 
     def iread_status(
@@ -327,6 +544,7 @@ class PriDatabase(Database):
         time_stop: Optional[float] = None,
         set_id: Union[None, int, Sequence[int]] = None,
         query_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> SizedIterable[StatusRecord]:
         """
         Stream status data with returned iterable.
@@ -339,35 +557,125 @@ class PriDatabase(Database):
             set_id: Read by SetID
             query_filter: Optional query filter provided as SQL clause,
                 e.g. "RMS < 300 OR RMS > 500"
+            columns: Read only given fields of `StatusRecord`, e.g. ["time", "channel", "rms"].
+                Other fields are `None`. Read all fields if `None`
 
         Returns:
             Sized iterable to sequential read status data
         """
-        # nested query to fix ambiguous column name error with query_filter
-        query = """
-        SELECT * FROM (
-            SELECT vae.*, ae.ParamID
-            FROM view_ae_data vae
-            LEFT JOIN ae_data ae ON vae.SetID == ae.SetID
-        )
-        """ + query_conditions(
-            equal={"SetType": 3},
-            isin={"Chan": channel, "SetID": set_id},
-            greater_equal={"Time": time_start},
-            less={"Time": time_stop},
-            custom_filter=query_filter,
+        query = self._query_status(
+            channel=channel,
+            time_start=time_start,
+            time_stop=time_stop,
+            set_id=set_id,
+            query_filter=query_filter,
+            columns=columns,
         )
         return QueryIterable(
             self._connection_wrapper.get_readonly_connection(),
             query,
-            StatusRecord.from_sql,
+            row_factory=StatusRecord.sql_row_factory,
         )
 
+    def airead_hits(self, *, batch_size: int = 1000, **kwargs) -> AsyncIterator[HitRecord]:
+        """
+        Stream hits asynchronously.
+
+        Async version of `iread_hits`, records are read in batches on a worker thread.
+
+        Args:
+            batch_size: Number of records read by the worker thread at once
+            **kwargs: Arguments of `iread_hits`
+
+        Returns:
+            Async iterable of hit records
+        """
+        return aiter_threaded(self.iread_hits(**kwargs), batch_size)
+
+    def airead_markers(self, *, batch_size: int = 1000, **kwargs) -> AsyncIterator[MarkerRecord]:
+        """
+        Stream markers asynchronously.
+
+        Async version of `iread_markers`, records are read in batches on a worker thread.
+
+        Args:
+            batch_size: Number of records read by the worker thread at once
+            **kwargs: Arguments of `iread_markers`
+
+        Returns:
+            Async iterable of marker records
+        """
+        return aiter_threaded(self.iread_markers(**kwargs), batch_size)
+
+    def airead_parametric(
+        self, *, batch_size: int = 1000, **kwargs
+    ) -> AsyncIterator[ParametricRecord]:
+        """
+        Stream parametric data asynchronously.
+
+        Async version of `iread_parametric`, records are read in batches on a worker thread.
+
+        Args:
+            batch_size: Number of records read by the worker thread at once
+            **kwargs: Arguments of `iread_parametric`
+
+        Returns:
+            Async iterable of parametric records
+        """
+        return aiter_threaded(self.iread_parametric(**kwargs), batch_size)
+
+    def airead_status(self, *, batch_size: int = 1000, **kwargs) -> AsyncIterator[StatusRecord]:
+        """
+        Stream status data asynchronously.
+
+        Async version of `iread_status`, records are read in batches on a worker thread.
+
+        Args:
+            batch_size: Number of records read by the worker thread at once
+            **kwargs: Arguments of `iread_status`
+
+        Returns:
+            Async iterable of status records
+        """
+        return aiter_threaded(self.iread_status(**kwargs), batch_size)
+
+    def _listen_query(self, query_filter: Optional[str], buffer_size: int) -> str:
+        return f"""
+        SELECT * FROM (
+            SELECT vae.*, ae.ParamID
+            FROM view_ae_data vae
+            LEFT JOIN ae_data ae ON vae.SetID == ae.SetID
+            WHERE vae.SetID > ?
+        ) {query_conditions(custom_filter=query_filter)} LIMIT {buffer_size}
+        """
+
+    def _listen_row_factory(self, columns: ColumnIndex) -> Callable[[Tuple], Optional[RecordType]]:
+        create: Dict[int, Callable[[Tuple], RecordType]] = {
+            1: ParametricRecord.sql_row_factory(columns),
+            2: HitRecord.sql_row_factory(columns),
+            3: StatusRecord.sql_row_factory(columns),
+        }
+        index_set_type = columns["SetType"]
+        index_set_id = columns["SetID"]
+
+        def convert(row: Tuple) -> Optional[RecordType]:
+            set_type = row[index_set_type]
+            if set_type in create:
+                return create[set_type](row)
+            if set_type in (4, 5, 6):
+                return next(iter(self.iread_markers(set_id=row[index_set_id])), None)
+            return None
+
+        return convert
+
     def listen(
         self,
         existing: bool = False,
         wait: bool = False,
         query_filter: Optional[str] = None,
+        *,
+        min_interval: float = 0.01,
+        max_interval: float = 0.1,
     ) -> Iterable[Union[HitRecord, MarkerRecord, ParametricRecord, StatusRecord]]:
         """
         Listen to database changes and return new records.
@@ -378,37 +686,101 @@ class PriDatabase(Database):
                 Otherwise the function returns after all records are read.
             query_filter: Optional query filter provided as SQL clause,
                 e.g. "Time >= 100 AND Chan == 2"
+            min_interval: Minimum polling interval in seconds.
+                The database is only queried again if changes were detected.
+            max_interval: Maximum polling interval in seconds (adaptive backoff)
 
         Yields:
             New hit/marker/parametric/status data records
         """
         max_buffer_size = 1000
-        query = f"""
-        SELECT * FROM (
-            SELECT vae.*, ae.ParamID
-            FROM view_ae_data vae
-            LEFT JOIN ae_data ae ON vae.SetID == ae.SetID
-            WHERE vae.SetID > ?
-        ) {query_conditions(custom_filter=query_filter)} LIMIT {max_buffer_size}
-        """
-        last_set_id = 0 if existing else self._main_index_range()[1]
-        while True:
-            # buffer rows to allow in-between write transactions
-            rows = list(read_sql_generator(self.connection(), query, last_set_id))
-            for row in rows:
-                if row["SetType"] == 1:
-                    yield ParametricRecord.from_sql(row)
-                elif row["SetType"] == 2:
-                    yield HitRecord.from_sql(row)
-                elif row["SetType"] == 3:
-                    yield StatusRecord.from_sql(row)
-                elif row["SetType"] in (4, 5, 6):
-                    yield from self.iread_markers(set_id=row["SetID"])
-                last_set_id = row["SetID"]
-            if len(rows) == 0:
-                if not wait and self._file_status() == 0:  # no writer active
-                    break
-                sleep(0.1)  # wait 100 ms until next read
+        last_set_id = 0 if existing else self._main_index_range()[1] or 0
+        records: Iterator[RecordType] = self._listen_records(
+            self._listen_query(query_filter, max_buffer_size),
+            "SetID",
+            last_set_id,
+            self._listen_row_factory,
+            buffer_size=max_buffer_size,
+            wait=wait,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        yield from records
+
+    async def alisten(
+        self,
+        existing: bool = False,
+        wait: bool = False,
+        query_filter: Optional[str] = None,
+        *,
+        min_interval: float = 0.01,
+        max_interval: float = 0.1,
+    ) -> AsyncIterator[Union[HitRecord, MarkerRecord, ParametricRecord, StatusRecord]]:
+        """
+        Listen to database changes and return new records asynchronously.
+
+        Async version of `listen`. Records are read in batches on worker threads without
+        blocking the event loop.
+
+        Example:
+            >>> async for record in pridb.alisten(wait=True):
+            ...     print(record)
+
+        Args:
+            existing: Return already existing records
+            wait: Wait for new records even if no acquisition (writer) is active.
+                Otherwise the function returns after all records are read.
+            query_filter: Optional query filter provided as SQL clause,
+                e.g. "Time >= 100 AND Chan == 2"
+            min_interval: Minimum polling interval in seconds.
+                The database is only queried again if changes were detected.
+            max_interval: Maximum polling interval in seconds (adaptive backoff)
+
+        Yields:
+            New hit/marker/parametric/status data records
+        """
+        max_buffer_size = 1000
+        last_set_id = 0 if existing else self._main_index_range()[1] or 0
+        records: AsyncIterator[RecordType] = self._alisten_records(
+            self._listen_query(query_filter, max_buffer_size),
+            "SetID",
+            last_set_id,
+            self._listen_row_factory,
+            buffer_size=max_buffer_size,
+            wait=wait,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        async for record in records:
+            yield record
+
+    def _hit_to_row(self, hit: HitRecord) -> Dict[str, Any]:
+        """Convert hit record to row dict of ae_data."""
+        parameter = self._parameter(hit.param_id)
+        return {
+            "SetType": 2,
+            "Time": int(hit.time * self._timebase),
+            "Chan": int(hit.channel),
+            "Status": int(hit.status),
+            "ParamID": int(hit.param_id),
+            "Thr": (
+                int(hit.threshold * 1e6 / parameter["ADC_µV"])
+                if hit.threshold is not None
+                else None
+            ),
+            "Amp": int(hit.amplitude * 1e6 / parameter["ADC_µV"]),
+            "RiseT": (int(hit.rise_time * self._timebase) if hit.rise_time is not None else None),
+            "Dur": int(hit.duration * self._timebase),
+            "Eny": int(hit.energy / parameter["ADC_TE"]),
+            "SS": (
+                int(hit.signal_strength / parameter["ADC_SS"])
+                if hit.signal_strength is not None and "ADC_SS" in parameter
+                else None
+            ),
+            "RMS": int(hit.rms * 1e6 / parameter["ADC_µV"] / 0.0065536),
+            "Counts": int(hit.counts) if hit.counts is not None else None,
+            "TRAI": int(hit.trai) if hit.trai is not None else None,
+        }
 
     @require_write_access
     @check_monotonic_time
@@ -424,38 +796,154 @@ class PriDatabase(Database):
         Returns:
             Index (SetID) of inserted row
         """
-        parameter = self._parameter(hit.param_id)
         with self.connection() as con:  # commit/rollback transaction
-            return insert_from_dict(
-                con,
-                self._table_main,
-                {
-                    "SetType": 2,
-                    "Time": int(hit.time * self._timebase),
-                    "Chan": int(hit.channel),
-                    "Status": hit.status,
-                    "ParamID": int(hit.param_id),
-                    "Thr": (
-                        int(hit.threshold * 1e6 / parameter["ADC_µV"])
-                        if hit.threshold is not None
-                        else None
-                    ),
-                    "Amp": int(hit.amplitude * 1e6 / parameter["ADC_µV"]),
-                    "RiseT": (
-                        int(hit.rise_time * self._timebase) if hit.rise_time is not None else None
-                    ),
-                    "Dur": int(hit.duration * self._timebase),
-                    "Eny": int(hit.energy / parameter["ADC_TE"]),
-                    "SS": (
-                        int(hit.signal_strength / parameter["ADC_SS"])
-                        if hit.signal_strength is not None and "ADC_SS" in parameter
-                        else None
-                    ),
-                    "RMS": int(hit.rms * 1e6 / parameter["ADC_µV"] / 0.0065536),
-                    "Counts": int(hit.counts) if hit.counts is not None else None,
-                    "TRAI": int(hit.trai) if hit.trai is not None else None,
-                },
-            )
+            return insert_from_dict(con, self._table_main, self._hit_to_row(hit))
+
+    @require_write_access
+    def write_hits(self, hits: Union[Iterable[HitRecord], pd.DataFrame]) -> int:
+        """
+        Write multiple hits to pridb within a single transaction.
+
+        The monotonic time order is checked in memory before the hits are inserted
+        (all or nothing). Much faster than multiple calls of `write_hit`.
+
+        Caution: `HitRecord.set_id` is ignored and automatically incremented.
+
+        Args:
+            hits: Hit data sets or DataFrame with columns named like the fields of `HitRecord`,
+                e.g. returned by `read_hits`
+
+        Returns:
+            Number of inserted rows
+
+        Raises:
+            ValueError: If the time of the hits is not monotonic increasing
+        """
+        if isinstance(hits, pd.DataFrame):
+            hits = iter_from_dataframe(hits, HitRecord)
+
+        max_time = _get_max_time(self)
+
+        def rows():
+            nonlocal max_time
+            for hit in hits:
+                _validate_monotonic_time(hit.time, max_time)
+                max_time = max(max_time, hit.time)
+                yield self._hit_to_row(hit)
+
+        with self.connection() as con:  # commit/rollback transaction
+            count = insert_many_from_dicts(con, self._table_main, rows())
+        self._update_globalinfo()
+        return count
+
+    def _marker_to_row(self, marker: MarkerRecord) -> Dict[str, Any]:
+        """Convert marker record to row dict of ae_data."""
+        return {
+            "SetType": int(marker.set_type),
+            "Time": int(marker.time * self._timebase),
+        }
+
+    @staticmethod
+    def _marker_to_markers_row(marker: MarkerRecord, set_id: int) -> Dict[str, Any]:
+        """Convert marker record to row dict of ae_markers."""
+        return {
+            "SetID": int(set_id),
+            "Number": (int(marker.number) if marker.number is not None else None),
+            "Data": marker.data,
+        }
+
+    def _status_to_row(self, status: StatusRecord) -> Dict[str, Any]:
+        """Convert status record to row dict of ae_data."""
+        parameter = self._parameter(status.param_id)
+        return {
+            "SetType": 3,
+            "Time": int(status.time * self._timebase),
+            "Chan": int(status.channel),
+            "Status": 0,
+            "ParamID": int(status.param_id),
+            "Thr": (
+                int(status.threshold * 1e6 / parameter["ADC_µV"])
+                if status.threshold is not None
+                else None
+            ),
+            "Eny": int(status.energy / parameter["ADC_TE"]),
+            "SS": (
+                int(status.signal_strength / parameter["ADC_SS"])
+                if status.signal_strength is not None and "ADC_SS" in parameter
+                else None
+            ),
+            "RMS": int(status.rms * 1e6 / parameter["ADC_µV"] / 0.0065536),
+        }
+
+    def _parametric_to_row(self, parametric: ParametricRecord) -> Dict[str, Any]:
+        """Convert parametric record to row dict of ae_data."""
+        parameter = self._parameter(parametric.param_id)
+
+        def try_convert(value: Optional[int], conv_id: str):
+            """Try to scale with conversion parameter 'PAx_mV', otherwise scale = 1."""
+            return int(value / parameter.get(conv_id, 1)) if value is not None else None
+
+        return {
+            "SetType": 1,
+            "Time": int(parametric.time * self._timebase),
+            "Status": 0,
+            "ParamID": int(parametric.param_id),
+            "PCTD": (int(parametric.pctd) if parametric.pctd is not None else None),
+            "PCTA": (int(parametric.pcta) if parametric.pcta is not None else None),
+            "PA0": try_convert(parametric.pa0, "PA0_mV"),
+            "PA1": try_convert(parametric.pa1, "PA1_mV"),
+            "PA2": try_convert(parametric.pa2, "PA2_mV"),
+            "PA3": try_convert(parametric.pa3, "PA3_mV"),
+            "PA4": try_convert(parametric.pa4, "PA4_mV"),
+            "PA5": try_convert(parametric.pa5, "PA5_mV"),
+            "PA6": try_convert(parametric.pa6, "PA6_mV"),
+            "PA7": try_convert(parametric.pa7, "PA7_mV"),
+        }
+
+    def _write_batch(self, records: Sequence[RecordType]):
+        """
+        Write hit, marker, parametric and status records within a single transaction.
+
+        Consecutive records of the same type are inserted in bulk (executemany).
+        """
+        converters: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+            HitRecord: self._hit_to_row,
+            MarkerRecord: self._marker_to_row,
+            StatusRecord: self._status_to_row,
+            ParametricRecord: self._parametric_to_row,
+        }
+        max_time = _get_max_time(self)
+        with self.connection() as con:  # commit/rollback transaction
+            for record_type, group in groupby(records, key=type):
+                try:
+                    to_row = converters[record_type]
+                except KeyError:
+                    raise ValueError(f"Invalid record type {record_type}") from None
+                group_records = list(group)
+                for record in group_records:
+                    _validate_monotonic_time(record.time, max_time)
+                    max_time = max(max_time, record.time)
+                rows = [to_row(record) for record in group_records]
+                if record_type is not HitRecord:
+                    # optional columns (e.g. PA0-PA7) might not exist, same as insert_from_dict
+                    rows = [remove_none_values_from_dict(row) for row in rows]
+                for _, rows_same_columns in groupby(rows, key=lambda row: tuple(row.keys())):
+                    insert_many_from_dicts(con, self._table_main, rows_same_columns)
+                if record_type is MarkerRecord:
+                    # SetIDs of the inserted rows are consecutive (write lock of transaction)
+                    set_id_last = con.execute("SELECT last_insert_rowid()").fetchone()[0]
+                    set_id_first = set_id_last - len(group_records) + 1
+                    insert_many_from_dicts(
+                        con,
+                        "ae_markers",
+                        (
+                            self._marker_to_markers_row(marker, set_id)
+                            for set_id, marker in enumerate(
+                                cast(List[MarkerRecord], group_records), start=set_id_first
+                            )
+                        ),
+                    )
+        self._update_globalinfo()
 
     @require_write_access
     @check_monotonic_time
@@ -472,23 +960,8 @@ class PriDatabase(Database):
             Index (SetID) of inserted row
         """
         with self.connection() as con:  # commit/rollback transaction
-            set_id = insert_from_dict(
-                con,
-                self._table_main,
-                {
-                    "SetType": int(marker.set_type),
-                    "Time": int(marker.time * self._timebase),
-                },
-            )
-            insert_from_dict(
-                con,
-                "ae_markers",
-                {
-                    "SetID": int(set_id),
-                    "Number": (int(marker.number) if marker.number is not None else None),
-                    "Data": marker.data,
-                },
-            )
+            set_id = insert_from_dict(con, self._table_main, self._marker_to_row(marker))
+            insert_from_dict(con, "ae_markers", self._marker_to_markers_row(marker, set_id))
             return set_id
 
     @require_write_access
@@ -505,31 +978,8 @@ class PriDatabase(Database):
         Returns:
             Index (SetID) of inserted row
         """
-        parameter = self._parameter(status.param_id)
         with self.connection() as con:  # commit/rollback transaction
-            return insert_from_dict(
-                con,
-                self._table_main,
-                {
-                    "SetType": 3,
-                    "Time": int(status.time * self._timebase),
-                    "Chan": int(status.channel),
-                    "Status": 0,
-                    "ParamID": int(status.param_id),
-                    "Thr": (
-                        int(status.threshold * 1e6 / parameter["ADC_µV"])
-                        if status.threshold is not None
-                        else None
-                    ),
-                    "Eny": int(status.energy / parameter["ADC_TE"]),
-                    "SS": (
-                        int(status.signal_strength / parameter["ADC_SS"])
-                        if status.signal_strength is not None and "ADC_SS" in parameter
-                        else None
-                    ),
-                    "RMS": int(status.rms * 1e6 / parameter["ADC_µV"] / 0.0065536),
-                },
-            )
+            return insert_from_dict(con, self._table_main, self._status_to_row(status))
 
     @require_write_access
     @check_monotonic_time
@@ -545,30 +995,5 @@ class PriDatabase(Database):
         Returns:
             Index (SetID) of inserted row
         """
-        parameter = self._parameter(parametric.param_id)
-
-        def try_convert(value: Optional[int], conv_id: str):
-            """Try to scale with conversion parameter 'PAx_mV', otherwise scale = 1."""
-            return int(value / parameter.get(conv_id, 1)) if value is not None else None
-
         with self.connection() as con:  # commit/rollback transaction
-            return insert_from_dict(
-                con,
-                self._table_main,
-                {
-                    "SetType": 1,
-                    "Time": int(parametric.time * self._timebase),
-                    "Status": 0,
-                    "ParamID": int(parametric.param_id),
-                    "PCTD": (int(parametric.pctd) if parametric.pctd is not None else None),
-                    "PCTA": (int(parametric.pcta) if parametric.pcta is not None else None),
-                    "PA0": try_convert(parametric.pa0, "PA0_mV"),
-                    "PA1": try_convert(parametric.pa1, "PA1_mV"),
-                    "PA2": try_convert(parametric.pa2, "PA2_mV"),
-                    "PA3": try_convert(parametric.pa3, "PA3_mV"),
-                    "PA4": try_convert(parametric.pa4, "PA4_mV"),
-                    "PA5": try_convert(parametric.pa5, "PA5_mV"),
-                    "PA6": try_convert(parametric.pa6, "PA6_mV"),
-                    "PA7": try_convert(parametric.pa7, "PA7_mV"),
-                },
-            )
+            return insert_from_dict(con, self._table_main, self._parametric_to_row(parametric))
@@ -1,27 +1,140 @@
+import json
 from functools import lru_cache, partial
-from itertools import chain
+from itertools import chain, islice
 from pathlib import Path
-from time import sleep
-from typing import Iterable, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+from ._arrow import blobs_to_arrow_array, empty_arrow_table, import_pyarrow, query_to_arrow
 from ._database import Database, require_write_access
-from ._dataframe import iter_to_dataframe
+from ._dataframe import ColumnSpec, iter_from_dataframe, iter_to_dataframe
 from ._sql import (
+    ColumnIndex,
     QueryIterable,
+    aiter_threaded,
     create_new_database,
     insert_from_dict,
+    insert_many_from_dicts,
     query_conditions,
-    read_sql_generator,
-    sql_binary_search,
+    query_select,
+    read_sql_rows,
+    sql_column_values,
+    sql_row_getter,
 )
-from .compression import encode_data_blob
-from .datatypes import TraRecord
+from .compression import decode_data_blob, encode_data_blob
+from .datatypes import ContinuousWaveChunk, TimeAxis, TraBatch, TraRecord
 from .types import SizedIterable
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# columns of TraRecord (see TraRecord.from_sql)
+_TRA_FIELD_COLUMNS = {
+    "time": ("Time",),
+    "channel": ("Chan",),
+    "param_id": ("ParamID",),
+    "pretrigger": ("Pretrigger",),
+    "threshold": ("Thr",),
+    "samplerate": ("SampleRate",),
+    "samples": ("Samples",),
+    "data": ("Data", "DataFormat", "TR_mV"),
+    "status": ("Status",),
+    "trai": ("TRAI",),
+}
+
+# columns of TraRecord for columnar reads (without data, see TraDatabase.read_arrow)
+_TRA_COLUMNS = (
+    ColumnSpec("time", "Time"),
+    ColumnSpec("channel", "Chan", integer=True),
+    ColumnSpec("param_id", "ParamID", integer=True),
+    ColumnSpec("pretrigger", "Pretrigger", integer=True),
+    ColumnSpec("threshold", "Thr", divisor=1e6),
+    ColumnSpec("samplerate", "SampleRate", integer=True),
+    ColumnSpec("samples", "Samples", integer=True),
+    ColumnSpec("status", "Status", integer=True),
+    ColumnSpec("trai", "TRAI", integer=True),
+)
+
+# columns of TraBatch (see TraDatabase.iread_batches)
+_TRA_BATCH_COLUMNS = (
+    "Time",
+    "Chan",
+    "ParamID",
+    "Pretrigger",
+    "Thr",
+    "SampleRate",
+    "Samples",
+    "Data",
+    "DataFormat",
+    "TR_mV",
+    "Status",
+    "TRAI",
+)
+
+
+class _ContinuousSegment(NamedTuple):
+    """Segment of continuous signal: cropped transient data record or time gap (`tra` = None)."""
+
+    samplerate: int
+    samples: int
+    tra: Optional[TraRecord] = None
+    offset: int = 0  # index of first sample in tra.data
+
+    def data(self) -> np.ndarray:
+        """Cropped data of transient data record."""
+        assert self.tra is not None
+        return self.tra.data[self.offset : self.offset + self.samples]
+
+    def copy_to(self, out: np.ndarray, offset: int = 0, factor_millivolts: Optional[float] = None):
+        """
+        Copy data (starting at given offset) to output array.
+
+        ADC values are converted to volts if `factor_millivolts` is provided.
+        Nothing is copied for time gaps, output arrays are expected to be zero-initialized.
+        """
+        if self.tra is None:
+            return
+        start = self.offset + offset
+        data = self.tra.data[start : start + len(out)]
+        if factor_millivolts is None:
+            out[:] = data
+        else:
+            np.multiply(data, 1e-3 * factor_millivolts, out=out, dtype=np.float32)
+
+
+_NPY_HEADER_SIZE = 128  # fixed size to rewrite the header after streaming the data
+_EXPORT_ZEROS = np.zeros(65536, dtype="<i2")  # block of zeros to write time gaps
+
+
+def _npy_header(samples: int) -> bytes:
+    """Header of .npy file (format version 1.0) for 1D int16 array with fixed header size."""
+    magic = b"\x93NUMPY\x01\x00"
+    header_len = _NPY_HEADER_SIZE - len(magic) - 2
+    header = f"{{'descr': '<i2', 'fortran_order': False, 'shape': ({samples},), }}"
+    return (
+        magic
+        + header_len.to_bytes(2, "little")
+        + header.ljust(header_len - 1).encode("latin1")
+        + b"\n"
+    )
+
 
 @lru_cache(maxsize=32, typed=True)
 def _create_time_vector(samples: int, samplerate: int, pretrigger: int = 0) -> np.ndarray:
@@ -31,6 +144,9 @@ def _create_time_vector(samples: int, samplerate: int, pretrigger: int = 0) -> n
 class TraDatabase(Database):
     """IO wrapper for tradb database file."""
 
+    _time_index_column = "TRAI"
+    _default_indexes = (("Chan", "TRAI"),)
+
     def __init__(
         self,
         filename: str,
@@ -86,11 +202,67 @@ class TraDatabase(Database):
         Returns:
             Pandas DataFrame with transient data
         """
-        return iter_to_dataframe(
+        df = iter_to_dataframe(
             self.iread(**kwargs),
             desc="Tra",
             index_column="trai",
         )
+        # conversion factor is only required to convert raw data of single records
+        return df.drop(columns="factor_millivolts", errors="ignore")
+
+    def read_arrow(self, *, raw: bool = False, show_progress: bool = True, **kwargs) -> "pa.Table":
+        """
+        Read transient data to Apache Arrow table (requires pyarrow).
+
+        The records are read in record batches directly from the SQLite cursor.
+        The signals of each batch are decoded into a single contiguous buffer,
+        column `data` is of type `large_list<float32>` (or `large_list<int16>` if `raw`),
+        followed by column `factor_millivolts` to convert ADC values to millivolts.
+        Hand off to pandas or polars without copying, e.g. with
+        `table.to_pandas(types_mapper=pd.ArrowDtype)` or `polars.from_arrow(table)`.
+
+        Args:
+            raw: Return data as ADC values (int16). Default: `False`
+            show_progress: Show progress bar. Default: `True`
+            **kwargs: Arguments passed to `iread` (except `workers`)
+
+        Returns:
+            Arrow table with transient data
+        """
+
+        def data_columns(columns: ColumnIndex):
+            pa = import_pyarrow()
+            getter = sql_row_getter(columns, ("Data", "DataFormat", "TR_mV"))
+
+            def create(rows: List[Tuple]):
+                values = [getter(row) for row in rows]
+                data_blobs, data_formats, factors_millivolts = (
+                    sql_column_values(values, index) for index in range(3)
+                )
+                if all(data_blob is None for data_blob in data_blobs):  # data not selected
+                    return {}
+                return {
+                    "data": blobs_to_arrow_array(
+                        data_blobs, data_formats, factors_millivolts, raw=raw
+                    ),
+                    "factor_millivolts": pa.array(factors_millivolts, type=pa.float64()),
+                }
+
+            return create
+
+        query = self._query(**kwargs)
+        if query is None:
+            return empty_arrow_table(_TRA_COLUMNS)
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        return query_to_arrow(
+            connection_wrapper.connection(),
+            query,
+            _TRA_COLUMNS,
+            extra_columns=data_columns,
+            show_progress=show_progress,
+            desc="Tra",
+            arraysize=1000,
+        )
 
     def _get_total_time_range(self) -> Tuple[float, float]:
         """Return total time range [min, max] of tradb."""
@@ -110,30 +282,53 @@ class TraDatabase(Database):
     def _get_trai_range_from_time_range(
         self, time_start: Optional[float], time_stop: Optional[float]
     ) -> Tuple[Optional[int], Optional[int]]:
-        """Use binary search to find indexes (TRAI) of a given time range."""
-        con = self.connection()
+        """Use binary search or time index to find indexes (TRAI) of a given time range."""
         trai_start = None
         trai_stop = None
         if time_start is not None:
-            trai_start = sql_binary_search(
-                connection=con,
-                table="tr_data",
-                column_value="Time",
-                column_index="TRAI",
-                fun_compare=lambda t: t >= time_start * self._timebase,  # type: ignore
-                lower_bound=True,  # return lower index of true conditions
-            )
+            trai_start = self._search_time(time_start * self._timebase, lower_bound=True)
         if time_stop is not None:
-            trai_stop = sql_binary_search(
-                connection=con,
-                table="tr_data",
-                column_value="Time",
-                column_index="TRAI",
-                fun_compare=lambda t: t < time_stop * self._timebase,  # type: ignore
-                lower_bound=False,  # return upper index of true conditions
-            )
+            trai_stop = self._search_time(time_stop * self._timebase, lower_bound=False)
         return trai_start, trai_stop
 
+    def _query(
+        self,
+        *,
+        channel: Union[int, Sequence[int], None] = None,
+        time_start: Optional[float] = None,
+        time_stop: Optional[float] = None,
+        trai: Union[int, Sequence[int], None] = None,
+        query_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[str]:
+        """Build query for transient data, see `iread`. Return `None` for empty time ranges."""
+        # check for empty time ranges
+        time_min, time_max = self._get_total_time_range()
+        if time_start is not None and time_start > time_max:
+            return None
+        if time_stop is not None and time_stop < time_min:
+            return None
+        if time_start is not None and time_stop is not None and time_start >= time_stop:
+            return None
+
+        trai_start, trai_stop = self._get_trai_range_from_time_range(time_start, time_stop)
+        select = query_select(_TRA_FIELD_COLUMNS, columns)
+        # nested query to fix ambiguous column name error with query_filter
+        return f"""
+        SELECT {select} FROM (
+            SELECT vtr.*, tr.ParamID
+            FROM view_tr_data vtr
+            LEFT JOIN tr_data tr ON vtr.SetID == tr.SetID
+            ORDER BY TRAI ASC
+        )
+        """ + query_conditions(
+            isin={"Chan": channel, "TRAI": trai},
+            greater_equal={"TRAI": trai_start},
+            # < condition already met in binary search, use <= here for found indice range
+            less_equal={"TRAI": trai_stop},
+            custom_filter=query_filter,
+        )
+
     def iread(
         self,
         *,
@@ -143,6 +338,8 @@ class TraDatabase(Database):
         trai: Union[None, int, Sequence[int]] = None,
         query_filter: Optional[str] = None,
         raw: bool = False,
+        columns: Optional[Sequence[str]] = None,
+        workers: Optional[int] = None,
     ) -> SizedIterable[TraRecord]:
         """
         Stream transient data with returned Iterable.
@@ -156,40 +353,136 @@ class TraDatabase(Database):
             query_filter: Optional query filter provided as SQL clause,
                 e.g. "Pretrigger == 500 AND Samples >= 1024"
             raw: Return data as ADC values (int16). Default: `False`
+            columns: Read only given fields of `TraRecord`, e.g. ["time", "channel", "trai"].
+                Other fields are `None`. Read all fields if `None`.
+                The BLOB column is not fetched if "data" is not selected
+            workers: Number of threads to decode the data BLOBs while fetching the next rows.
+                Recommended for FLAC compressed data. Decode in the reading thread if `None`
 
         Returns:
             Sized iterable to sequential read transient data
         """
-        # check for empty time ranges
-        time_min, time_max = self._get_total_time_range()
-        if time_start is not None and time_start > time_max:
-            return []
-        if time_stop is not None and time_stop < time_min:
-            return []
-        if time_start is not None and time_stop is not None and time_start >= time_stop:
-            return []
-
-        trai_start, trai_stop = self._get_trai_range_from_time_range(time_start, time_stop)
-        # nested query to fix ambiguous column name error with query_filter
-        query = """
-        SELECT * FROM (
-            SELECT vtr.*, tr.ParamID
-            FROM view_tr_data vtr
-            LEFT JOIN tr_data tr ON vtr.SetID == tr.SetID
-            ORDER BY TRAI ASC
-        )
-        """ + query_conditions(
-            isin={"Chan": channel, "TRAI": trai},
-            greater_equal={"TRAI": trai_start},
-            # < condition already met in binary search, use <= here for found indice range
-            less_equal={"TRAI": trai_stop},
-            custom_filter=query_filter,
+        query = self._query(
+            channel=channel,
+            time_start=time_start,
+            time_stop=time_stop,
+            trai=trai,
+            query_filter=query_filter,
+            columns=columns,
         )
+        if query is None:
+            return []
         return QueryIterable(
             self._connection_wrapper.get_readonly_connection(),
             query,
-            partial(TraRecord.from_sql, raw=raw),
+            row_factory=partial(TraRecord.sql_row_factory, raw=raw),
+            workers=workers,
+        )
+
+    def airead(self, *, batch_size: int = 100, **kwargs) -> AsyncIterator[TraRecord]:
+        """
+        Stream transient data asynchronously.
+
+        Async version of `iread`, records are read and decoded in batches on a worker thread.
+
+        Args:
+            batch_size: Number of records read by the worker thread at once
+            **kwargs: Arguments of `iread`
+
+        Returns:
+            Async iterable of transient data records
+        """
+        return aiter_threaded(self.iread(**kwargs), batch_size)
+
+    def iread_batches(
+        self,
+        batch_size: int = 1000,
+        *,
+        channel: Union[int, Sequence[int], None] = None,
+        time_start: Optional[float] = None,
+        time_stop: Optional[float] = None,
+        trai: Union[int, Sequence[int], None] = None,
+        query_filter: Optional[str] = None,
+        raw: bool = False,
+    ) -> Iterator[TraBatch]:
+        """
+        Stream transient data in batches.
+
+        The transient signals of each batch are decoded into a single, preallocated matrix
+        (records x max. samples of the batch). Shorter signals are zero-padded,
+        the number of valid samples per row is given by `TraBatch.samples`.
+
+        Args:
+            batch_size: Maximum number of records per batch
+            channel: None if all channels should be read.
+                Otherwise specify the channel number or a list of channel numbers
+            time_start: Start reading at relative time (in seconds). Start at beginning if `None`
+            time_stop: Stop reading at relative time (in seconds). Read until end if `None`
+            trai: Read data by TRAI (transient recorder index)
+            query_filter: Optional query filter provided as SQL clause,
+                e.g. "Pretrigger == 500 AND Samples >= 1024"
+            raw: Return data as ADC values (int16). Default: `False`
+
+        Yields:
+            Batches of transient data
+        """
+        if batch_size < 1:
+            raise ValueError("Argument batch_size must be >= 1")
+
+        query = self._query(
+            channel=channel,
+            time_start=time_start,
+            time_stop=time_stop,
+            trai=trai,
+            query_filter=query_filter,
+        )
+        if query is None:
+            return
+
+        def column(values: Dict[str, List], name: str, dtype):
+            return np.array(values[name], dtype=dtype)
+
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        columns, rows_iterator = read_sql_rows(
+            connection_wrapper.connection(), query, arraysize=batch_size
         )
+        getter = sql_row_getter(columns, _TRA_BATCH_COLUMNS)
+        while True:
+            rows = [getter(row) for row in islice(rows_iterator, batch_size)]
+            if not rows:
+                break
+            values = {
+                name: sql_column_values(rows, index)
+                for index, name in enumerate(_TRA_BATCH_COLUMNS)
+            }
+
+            samples = column(values, "Samples", np.int64)
+            data = np.zeros(
+                (len(rows), samples.max(initial=0)),
+                dtype=np.int16 if raw else np.float32,
+            )
+            for i, row_data in enumerate(data):
+                decode_data_blob(
+                    values["Data"][i],
+                    values["DataFormat"][i],
+                    values["TR_mV"][i],
+                    raw=raw,
+                    out=row_data,
+                )
+
+            yield TraBatch(
+                time=column(values, "Time", np.float64),
+                channel=column(values, "Chan", np.int64),
+                param_id=column(values, "ParamID", np.int64),
+                pretrigger=column(values, "Pretrigger", np.int64),
+                threshold=column(values, "Thr", np.float64) / 1e6,
+                samplerate=column(values, "SampleRate", np.int64),
+                samples=samples,
+                data=data,
+                status=column(values, "Status", np.int64),
+                trai=column(values, "TRAI", np.int64),
+                raw=raw,
+            )
 
     def read_wave(
         self,
@@ -243,40 +536,28 @@ class TraDatabase(Database):
         )
         return result[0] if result is not None else None
 
-    def read_continuous_wave(  # pylint: disable=too-many-locals
+    def _iread_continuous_segments(
         self,
         channel: int,
-        time_start: Optional[float] = None,
-        time_stop: Optional[float] = None,
+        time_start: Optional[float],
+        time_stop: Optional[float],
         *,
-        time_axis: bool = True,
-        show_progress: bool = True,
-        raw: bool = False,
-    ) -> Union[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, int]]:
+        show_progress: bool,
+        raw: bool,
+        workers: Optional[int],
+    ) -> Iterator[_ContinuousSegment]:
         """
-        Read transient signal of specified channel to a single, continuous array.
+        Read transient signal of specified channel as continuous segments.
 
-        The signal is exactly cropped to the given time range. Time gaps are filled with 0's.
-
-        Args:
-            channel: Channel number to read
-            time_start: Start reading at relative time (in seconds). Start at beginning if `None`
-            time_stop: Stop reading at relative time (in seconds). Read until end if `None`
-            time_axis: Create the correspondig time axis. Default: `True`
-            show_progress: Show progress bar. Default: `True`
-            raw: Return data as ADC values (int16). Default: `False`
-
-        Returns:
-            If `time_axis` is `True`\n
-            - Array with transient signal
-            - Time axis
-
-            If `time_axis` is `False`\n
-            - Array with transient signal
-            - Samplerate
+        Segments are either cropped transient data records or time gaps to fill with zeros.
         """
-        dtype = np.int16 if raw else np.float32
-        iterable = self.iread(channel=channel, time_start=time_start, time_stop=time_stop, raw=raw)
+        iterable = self.iread(
+            channel=channel,
+            time_start=time_start,
+            time_stop=time_stop,
+            raw=raw,
+            workers=workers,
+        )
         iterator = iter(iterable)
         if show_progress:
             iterator = tqdm(iterator, total=len(iterable), desc="Tra")  # ignores previous tra
@@ -301,15 +582,13 @@ class TraDatabase(Database):
             def limit_index(i: int):
                 return min(max(0, i), tra.samples)
 
-            n_start, n_stop = 0, tra.samples
-            if time_start is not None:
-                n_start = limit_index(round((time_start - tra.time) * tra.samplerate))
+            n_start = limit_index(round((time_start - tra.time) * tra.samplerate))
+            n_stop = tra.samples
             if time_stop is not None:
                 n_stop = limit_index(round((time_stop - tra.time) * tra.samplerate))
             return n_start, n_stop
 
         samplerate = 0  # will be initialized with samplerate of first record
-        tra_blocks = [np.empty(0, dtype=dtype)]
         expected_time = time_start
 
         for tra in iterator:
@@ -321,32 +600,308 @@ class TraDatabase(Database):
             # check for gaps in tra stream
             time_gap = tra.time - expected_time
             if time_gap > 1 / tra.samplerate:
-                samples_gap = round(time_gap * tra.samplerate)
-                tra_blocks.append(np.zeros(samples_gap, dtype=dtype))
+                yield _ContinuousSegment(samplerate, round(time_gap * tra.samplerate))
 
             sample_start, sample_stop = slice_range(tra)
-            tra_blocks.append(tra.data[sample_start:sample_stop])
+            yield _ContinuousSegment(samplerate, sample_stop - sample_start, tra, sample_start)
             expected_time = tra.time + sample_stop / tra.samplerate
-            if time_start is not None:
-                # the prepended record might be out of time range -> avoid exceeding zero-padding
-                expected_time = max(expected_time, time_start)
+            # the prepended record might be out of time range -> avoid exceeding zero-padding
+            expected_time = max(expected_time, time_start)
 
         if time_stop is not None and samplerate and abs(expected_time - time_stop) > 1 / samplerate:
             # zero padding at ending
-            samples = round((time_stop - expected_time) * samplerate)
-            tra_blocks.append(np.zeros(samples, dtype=dtype))
+            yield _ContinuousSegment(samplerate, round((time_stop - expected_time) * samplerate))
+
+    def _get_factors_millivolts(self) -> Dict[int, float]:
+        """Get factors from ADC values to millivolts (TR_mV) by parameter ID."""
+        return dict(self.connection().execute("SELECT ID, TR_mV FROM tr_params").fetchall())
+
+    def _get_continuous_wave_size(
+        self, channel: int, time_start: float, time_stop: Optional[float]
+    ) -> Tuple[int, int]:
+        """Estimate samplerate and number of samples of continuous signal without reading it."""
+        _, trai_stop = self._get_trai_range_from_time_range(None, time_stop)
+        query = "SELECT Time, SampleRate, Samples FROM tr_data WHERE Chan == ?"
+        parameters: Tuple[Any, ...] = (channel,)
+        if trai_stop is not None:
+            query += " AND TRAI <= ?"
+            parameters += (trai_stop,)
+        query += " ORDER BY TRAI DESC LIMIT 1"
+        row = self.connection().execute(query, parameters).fetchone()
+        if row is None:
+            return 0, 0
+        time, samplerate, samples = row
+        if time_stop is None:
+            time_stop = time / self._timebase + samples / samplerate
+        return samplerate, max(round((time_stop - time_start) * samplerate), 0)
+
+    def read_continuous_wave(
+        self,
+        channel: int,
+        time_start: Optional[float] = None,
+        time_stop: Optional[float] = None,
+        *,
+        time_axis: bool = True,
+        lazy_time_axis: bool = False,
+        show_progress: bool = True,
+        raw: bool = False,
+        workers: Optional[int] = None,
+    ) -> Union[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, TimeAxis], Tuple[np.ndarray, int]]:
+        """
+        Read transient signal of specified channel to a single, continuous array.
+
+        The signal is exactly cropped to the given time range. Time gaps are filled with 0's.
+        The output array is allocated once and each record is copied (and converted to volts)
+        directly into its slice.
+
+        Args:
+            channel: Channel number to read
+            time_start: Start reading at relative time (in seconds). Start at beginning if `None`
+            time_stop: Stop reading at relative time (in seconds). Read until end if `None`
+            time_axis: Create the correspondig time axis. Default: `True`
+            lazy_time_axis: Return the time axis as `TimeAxis` (computed on access)
+                instead of an array. Default: `False`
+            show_progress: Show progress bar. Default: `True`
+            raw: Return data as ADC values (int16). Default: `False`
+            workers: Number of threads to decode the data BLOBs, see `iread`
+
+        Returns:
+            If `time_axis` is `True`\n
+            - Array with transient signal
+            - Time axis (`TimeAxis` if `lazy_time_axis` is `True`)
+
+            If `time_axis` is `False`\n
+            - Array with transient signal
+            - Samplerate
+        """
+        time_first = self._get_total_time_range()[0] if time_start is None else time_start
+        samplerate, samples = self._get_continuous_wave_size(channel, time_first, time_stop)
+        y = np.zeros(samples, dtype=np.int16 if raw else np.float32)
+        factors = None if raw else self._get_factors_millivolts()
+        position = 0
+
+        for segment in self._iread_continuous_segments(
+            channel,
+            time_start,
+            time_stop,
+            show_progress=show_progress,
+            raw=True,  # convert to volts while copying
+            workers=workers,
+        ):
+            samplerate = segment.samplerate
+            if position + segment.samples > len(y):
+                # size estimation might differ slightly due to rounding
+                y_resized = np.zeros(position + segment.samples, dtype=y.dtype)
+                y_resized[:position] = y[:position]
+                y = y_resized
+            segment.copy_to(
+                y[position : position + segment.samples],
+                factor_millivolts=(
+                    factors[segment.tra.param_id]
+                    if factors is not None and segment.tra is not None
+                    else None
+                ),
+            )
+            position += segment.samples
 
-        y = np.concatenate(tra_blocks)
+        if position < len(y):
+            y = y[:position]
         if time_axis:
-            return y, _create_time_vector(len(y), samplerate) + time_start
+            if lazy_time_axis:
+                return y, TimeAxis(time_first, samplerate, len(y))
+            return y, _create_time_vector(len(y), samplerate) + time_first
         return y, samplerate
 
+    def iread_continuous_wave(
+        self,
+        channel: int,
+        time_start: Optional[float] = None,
+        time_stop: Optional[float] = None,
+        *,
+        chunk_samples: int = 65536,
+        show_progress: bool = True,
+        raw: bool = False,
+        workers: Optional[int] = None,
+    ) -> Iterator[ContinuousWaveChunk]:
+        """
+        Stream transient signal of specified channel in continuous chunks of fixed size.
+
+        Same as `read_continuous_wave` but the signal is returned chunk by chunk with constant
+        memory usage. The signal is exactly cropped to the given time range.
+        Time gaps are filled with 0's.
+
+        Args:
+            channel: Channel number to read
+            time_start: Start reading at relative time (in seconds). Start at beginning if `None`
+            time_stop: Stop reading at relative time (in seconds). Read until end if `None`
+            chunk_samples: Number of samples per chunk. The last chunk might be shorter
+            show_progress: Show progress bar. Default: `True`
+            raw: Return data as ADC values (int16). Default: `False`
+            workers: Number of threads to decode the data BLOBs, see `iread`
+
+        Returns:
+            Iterator of chunks with start time, samplerate and signal
+        """
+        if chunk_samples < 1:
+            raise ValueError("Number of samples per chunk must be greater than 0")
+
+        dtype = np.int16 if raw else np.float32
+        time_first = self._get_total_time_range()[0] if time_start is None else time_start
+        factors = None if raw else self._get_factors_millivolts()
+        samplerate = 0
+        chunk = np.zeros(chunk_samples, dtype=dtype)
+        chunk_start = 0  # sample index of chunk start
+        position = 0  # write position in chunk
+
+        def create_chunk(data: np.ndarray) -> ContinuousWaveChunk:
+            return ContinuousWaveChunk(
+                time=time_first + chunk_start / samplerate,
+                samplerate=samplerate,
+                data=data,
+            )
+
+        for segment in self._iread_continuous_segments(
+            channel,
+            time_start,
+            time_stop,
+            show_progress=show_progress,
+            raw=True,  # convert to volts while copying
+            workers=workers,
+        ):
+            samplerate = segment.samplerate
+            factor_millivolts = (
+                factors[segment.tra.param_id]
+                if factors is not None and segment.tra is not None
+                else None
+            )
+            offset = 0
+            while offset < segment.samples:
+                count = min(chunk_samples - position, segment.samples - offset)
+                segment.copy_to(chunk[position : position + count], offset, factor_millivolts)
+                position += count
+                offset += count
+                if position == chunk_samples:
+                    yield create_chunk(chunk)
+                    chunk = np.zeros(chunk_samples, dtype=dtype)
+                    chunk_start += chunk_samples
+                    position = 0
+
+        if position > 0:
+            yield create_chunk(chunk[:position])
+
+    def export_continuous(
+        self,
+        channel: int,
+        path: Union[str, Path],
+        time_start: Optional[float] = None,
+        time_stop: Optional[float] = None,
+        *,
+        show_progress: bool = True,
+        workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Export continuous transient signal of specified channel to a file of raw ADC values.
+
+        The signal is streamed as int16 ADC values (no conversion to volts) with constant
+        memory usage and written to a NumPy `.npy` file (if the path ends with `.npy`)
+        or a flat binary file of little-endian int16 values.
+        The metadata (e.g. samplerate, start time and factor `TR_mV` to convert the ADC values
+        to millivolts) is written to a JSON sidecar file with the suffix `.json` appended to the
+        path, e.g. `ch1.npy.json`.
+
+        The exported files can be memory-mapped without copying the data:
+
+        >>> y = np.load("ch1.npy", mmap_mode="r")
+        >>> y = np.memmap("ch1.bin", dtype="<i2", mode="r")
+        >>> y_volts = y * 1e-3 * metadata["tr_mV"]
+
+        Args:
+            channel: Channel number to export
+            path: Path of the output file (`.npy` or flat binary)
+            time_start: Start reading at relative time (in seconds). Start at beginning if `None`
+            time_stop: Stop reading at relative time (in seconds). Read until end if `None`
+            show_progress: Show progress bar. Default: `True`
+            workers: Number of threads to decode the data BLOBs, see `iread`
+
+        Returns:
+            Metadata written to the JSON sidecar file
+
+        Raises:
+            ValueError: If no data of the channel is available in the requested time range
+        """
+        path = Path(path)
+        npy = path.suffix.lower() == ".npy"
+        factors = self._get_factors_millivolts()
+        samplerate = 0
+        factor_millivolts = None
+        samples = 0
+
+        with open(path, "wb") as file:
+            if npy:
+                file.write(_npy_header(0))  # placeholder, rewritten with final shape
+            for segment in self._iread_continuous_segments(
+                channel,
+                time_start,
+                time_stop,
+                show_progress=show_progress,
+                raw=True,
+                workers=workers,
+            ):
+                samplerate = segment.samplerate
+                if segment.tra is None:
+                    for offset in range(0, segment.samples, len(_EXPORT_ZEROS)):
+                        file.write(_EXPORT_ZEROS[: segment.samples - offset].tobytes())
+                else:
+                    factor = factors[segment.tra.param_id]
+                    if factor_millivolts is None:
+                        factor_millivolts = factor
+                    if factor != factor_millivolts:
+                        raise RuntimeError("Different TR_mV inside requested time interval")
+                    file.write(segment.data().astype("<i2", copy=False).tobytes())
+                samples += segment.samples
+            if npy:
+                file.seek(0)
+                file.write(_npy_header(samples))
+
+        if samples == 0:
+            path.unlink()  # empty files can not be memory-mapped
+            raise ValueError(f"No transient data of channel {channel} in requested time range")
+
+        metadata = {
+            "channel": channel,
+            "samples": samples,
+            "samplerate": samplerate,
+            "time_start": self._get_total_time_range()[0] if time_start is None else time_start,
+            "tr_mV": factor_millivolts,
+            "dtype": "<i2",
+            "format": "npy" if npy else "binary",
+            "offset": _NPY_HEADER_SIZE if npy else 0,
+            "source": self.filename,
+        }
+        with open(str(path) + ".json", "w", encoding="utf-8") as file:
+            json.dump(metadata, file, indent=4)
+        return metadata
+
+    @staticmethod
+    def _listen_query(query_filter: Optional[str], buffer_size: int) -> str:
+        return f"""
+        SELECT * FROM (
+            SELECT vtr.*, tr.ParamID
+            FROM view_tr_data vtr
+            LEFT JOIN tr_data tr ON vtr.SetID == tr.SetID
+            WHERE vtr.SetID > ?
+        ) {query_conditions(custom_filter=query_filter)} LIMIT {buffer_size}
+        """
+
     def listen(
         self,
         existing: bool = False,
         wait: bool = False,
         query_filter: Optional[str] = None,
         raw: bool = False,
+        *,
+        min_interval: float = 0.01,
+        max_interval: float = 0.1,
     ) -> Iterable[TraRecord]:
         """
         Listen to database changes and return new records.
@@ -358,30 +913,86 @@ class TraDatabase(Database):
             query_filter: Optional query filter provided as SQL clause,
                 e.g. "TRAI >= 100 AND Samples >= 1024"
             raw: Return data as ADC values (int16). Default: `False`
+            min_interval: Minimum polling interval in seconds.
+                The database is only queried again if changes were detected.
+            max_interval: Maximum polling interval in seconds (adaptive backoff)
 
         Yields:
             New transient data records
         """
         max_buffer_size = 100
-        query = f"""
-        SELECT * FROM (
-            SELECT vtr.*, tr.ParamID
-            FROM view_tr_data vtr
-            LEFT JOIN tr_data tr ON vtr.SetID == tr.SetID
-            WHERE vtr.SetID > ?
-        ) {query_conditions(custom_filter=query_filter)} LIMIT {max_buffer_size}
+        last_set_id = 0 if existing else self._main_index_range()[1] or 0
+        yield from self._listen_records(
+            self._listen_query(query_filter, max_buffer_size),
+            "SetID",
+            last_set_id,
+            partial(TraRecord.sql_row_factory, raw=raw),
+            buffer_size=max_buffer_size,
+            wait=wait,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+    async def alisten(
+        self,
+        existing: bool = False,
+        wait: bool = False,
+        query_filter: Optional[str] = None,
+        raw: bool = False,
+        *,
+        min_interval: float = 0.01,
+        max_interval: float = 0.1,
+    ) -> AsyncIterator[TraRecord]:
         """
-        last_set_id = 0 if existing else self._main_index_range()[1]
-        while True:
-            # buffer rows to allow in-between write transactions
-            rows = list(read_sql_generator(self.connection(), query, last_set_id))
-            for row in rows:
-                yield TraRecord.from_sql(row, raw=raw)
-                last_set_id = row["SetID"]
-            if len(rows) == 0:
-                if not wait and self._file_status() == 0:  # no writer active
-                    break
-                sleep(0.1)  # wait 100 ms until next read
+        Listen to database changes and return new records asynchronously.
+
+        Async version of `listen`. Records are read and decoded in batches on worker threads
+        without blocking the event loop.
+
+        Args:
+            existing: Return already existing records
+            wait: Wait for new records even if no acquisition (writer) is active.
+                Otherwise the function returns after all records are read.
+            query_filter: Optional query filter provided as SQL clause,
+                e.g. "TRAI >= 100 AND Samples >= 1024"
+            raw: Return data as ADC values (int16). Default: `False`
+            min_interval: Minimum polling interval in seconds.
+                The database is only queried again if changes were detected.
+            max_interval: Maximum polling interval in seconds (adaptive backoff)
+
+        Yields:
+            New transient data records
+        """
+        max_buffer_size = 100
+        last_set_id = 0 if existing else self._main_index_range()[1] or 0
+        async for record in self._alisten_records(
+            self._listen_query(query_filter, max_buffer_size),
+            "SetID",
+            last_set_id,
+            partial(TraRecord.sql_row_factory, raw=raw),
+            buffer_size=max_buffer_size,
+            wait=wait,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        ):
+            yield record
+
+    def _tra_to_row(self, tra: TraRecord) -> Dict[str, Any]:
+        """Convert transient data record to row dict of tr_data."""
+        parameter = self._parameter(tra.param_id)
+        return {
+            "Time": int(tra.time * self._timebase),
+            "Chan": int(tra.channel),
+            "Status": int(tra.status),
+            "ParamID": int(tra.param_id),
+            "Pretrigger": int(tra.pretrigger),
+            "Thr": int(tra.threshold * 1e6 / parameter["ADC_µV"]),
+            "SampleRate": int(tra.samplerate),
+            "Samples": int(tra.samples),
+            "DataFormat": int(self._data_format),
+            "Data": encode_data_blob(tra.data, self._data_format, parameter["TR_mV"], raw=tra.raw),
+            "TRAI": int(tra.trai) if tra.trai is not None else None,
+        }
 
     @require_write_access
     def write(self, tra: TraRecord) -> int:
@@ -395,22 +1006,34 @@ class TraDatabase(Database):
             Index (SetID) of inserted row
         """
         # self._validate_and_update_time(tra.time)
-        parameter = self._parameter(tra.param_id)
         with self.connection() as con:  # commit/rollback transaction
-            return insert_from_dict(
-                con,
-                self._table_main,
-                {
-                    "Time": int(tra.time * self._timebase),
-                    "Chan": int(tra.channel),
-                    "Status": tra.status,
-                    "ParamID": int(tra.param_id),
-                    "Pretrigger": int(tra.pretrigger),
-                    "Thr": int(tra.threshold * 1e6 / parameter["ADC_µV"]),
-                    "SampleRate": int(tra.samplerate),
-                    "Samples": int(tra.samples),
-                    "DataFormat": int(self._data_format),
-                    "Data": encode_data_blob(tra.data, self._data_format, parameter["TR_mV"]),
-                    "TRAI": int(tra.trai) if tra.trai is not None else None,
-                },
+            return insert_from_dict(con, self._table_main, self._tra_to_row(tra))
+
+    def _open_writer_database(self) -> "TraDatabase":
+        return TraDatabase(self.filename, mode="rw", compression=self._data_format == 2)
+
+    def _write_batch(self, records: Sequence[TraRecord]):
+        self.write_many(records)
+
+    @require_write_access
+    def write_many(self, tras: Union[Iterable[TraRecord], pd.DataFrame]) -> int:
+        """
+        Write multiple transient data sets to tradb within a single transaction.
+
+        Much faster than multiple calls of `write`.
+
+        Args:
+            tras: Transient data sets or DataFrame with columns named like the fields of
+                `TraRecord`, e.g. returned by `read`
+
+        Returns:
+            Number of inserted rows
+        """
+        if isinstance(tras, pd.DataFrame):
+            tras = iter_from_dataframe(tras, TraRecord)
+        with self.connection() as con:  # commit/rollback transaction
+            count = insert_many_from_dicts(
+                con, self._table_main, (self._tra_to_row(tra) for tra in tras)
             )
+        self._update_globalinfo()
+        return count
@@ -1,23 +1,49 @@
+import math
 import sqlite3
+from itertools import groupby
 from pathlib import Path
-from time import sleep
-from typing import Iterable, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
+from ._arrow import query_to_arrow
 from ._database import Database, require_write_access
-from ._dataframe import iter_to_dataframe
+from ._dataframe import ColumnSpec, iter_to_dataframe
 from ._sql import (
+    ColumnIndex,
     QueryIterable,
+    aiter_threaded,
     create_new_database,
+    generate_insert_query,
+    generate_update_query,
     insert_from_dict,
     query_conditions,
-    read_sql_generator,
+    remove_none_values_from_dict,
     update_from_dict,
 )
 from .datatypes import FeatureRecord
 from .types import SizedIterable
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _convert_feature_value(value) -> Optional[float]:
+    try:
+        value = float(value)
+    except (ValueError, TypeError):
+        return None
+    return None if math.isnan(value) else value  # missing values, e.g. NaN cells of DataFrames
+
 
 class TrfDatabase(Database):
     """IO wrapper for trfdb (transient feature) database file."""
@@ -72,11 +98,63 @@ class TrfDatabase(Database):
             index_column="trai",
         )
 
+    def read_arrow(self, *, show_progress: bool = True, **kwargs) -> "pa.Table":
+        """
+        Read features to Apache Arrow table (requires pyarrow).
+
+        The features are read in record batches directly from the SQLite cursor,
+        missing values are stored as nulls. Column `trai` is followed by the features.
+        Hand off to pandas or polars without copying, e.g. with
+        `table.to_pandas(types_mapper=pd.ArrowDtype)` or `polars.from_arrow(table)`.
+
+        Args:
+            show_progress: Show progress bar. Default: `True`
+            **kwargs: Arguments passed to `iread`
+
+        Returns:
+            Arrow table with features
+        """
+        columns = [
+            ColumnSpec("trai", "TRAI", integer=True),
+            *(ColumnSpec(column, column) for column in self.columns() if column != "TRAI"),
+        ]
+        connection_wrapper = self._connection_wrapper.get_readonly_connection()
+        return query_to_arrow(
+            connection_wrapper.connection(),
+            self._query(**kwargs),
+            columns,
+            show_progress=show_progress,
+            desc="Trf",
+        )
+
+    def _query(
+        self,
+        *,
+        trai: Union[int, Sequence[int], None] = None,
+        query_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> str:
+        """Build query for features, see `iread`."""
+        select = "*"
+        if columns is not None:
+            valid_columns = self.columns()
+            invalid_columns = [column for column in columns if column not in valid_columns]
+            if invalid_columns:
+                raise ValueError(f"Invalid column(s) {invalid_columns}, use: {list(valid_columns)}")
+            select = ", ".join(["TRAI", *columns])
+        return f"""
+        SELECT {select} FROM (
+            SELECT * FROM trf_data
+            ORDER BY TRAI ASC
+        )
+        """ + query_conditions(isin={"TRAI": trai}, custom_filter=query_filter)
+
     def iread(
         self,
         *,
         trai: Union[None, int, Sequence[int]] = None,
         query_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> SizedIterable[FeatureRecord]:
         """
         Stream features with returned iterable.
@@ -85,20 +163,48 @@ class TrfDatabase(Database):
             trai: Read data by TRAI (transient recorder index)
             query_filter: Optional query filter provided as SQL clause,
                 e.g. "FFT_CoG >= 150 AND CTP < 20"
+            columns: Read only given features, e.g. ["FFT_CoG", "PA"]. Read all features if `None`
 
         Returns:
             Sized iterable to sequential read features
+
+        Raises:
+            ValueError: If selected columns are unknown
         """
-        query = """
-        SELECT * FROM (
-            SELECT * FROM trf_data
-            ORDER BY TRAI ASC
-        )
-        """ + query_conditions(isin={"TRAI": trai}, custom_filter=query_filter)
         return QueryIterable(
             self._connection_wrapper.get_readonly_connection(),
-            query,
-            FeatureRecord.from_sql,
+            self._query(trai=trai, query_filter=query_filter, columns=columns),
+            row_factory=FeatureRecord.sql_row_factory,
+        )
+
+    def airead(self, *, batch_size: int = 1000, **kwargs) -> AsyncIterator[FeatureRecord]:
+        """
+        Stream features asynchronously.
+
+        Async version of `iread`, records are read in batches on a worker thread.
+
+        Args:
+            batch_size: Number of records read by the worker thread at once
+            **kwargs: Arguments of `iread`
+
+        Returns:
+            Async iterable of feature records
+        """
+        return aiter_threaded(self.iread(**kwargs), batch_size)
+
+    @staticmethod
+    def _listen_query(query_filter: Optional[str], buffer_size: int) -> str:
+        return f"""
+        SELECT * FROM (
+            SELECT rowid, * FROM trf_data
+            WHERE rowid > ?
+        ) {query_conditions(custom_filter=query_filter)} LIMIT {buffer_size}
+        """
+
+    @staticmethod
+    def _listen_row_factory(columns: ColumnIndex) -> Callable[[Tuple], FeatureRecord]:
+        return FeatureRecord.sql_row_factory(
+            {name: index for name, index in columns.items() if name != "rowid"}
         )
 
     def listen(
@@ -106,6 +212,9 @@ class TrfDatabase(Database):
         existing: bool = False,
         wait: bool = False,
         query_filter: Optional[str] = None,
+        *,
+        min_interval: float = 0.01,
+        max_interval: float = 0.1,
     ) -> Iterable[FeatureRecord]:
         """
         Listen to database changes and return new records.
@@ -116,28 +225,67 @@ class TrfDatabase(Database):
                 Otherwise the function returns after all records are read.
             query_filter: Optional query filter provided as SQL clause,
                 e.g. "TRAI >= 100"
+            min_interval: Minimum polling interval in seconds.
+                The database is only queried again if changes were detected.
+            max_interval: Maximum polling interval in seconds (adaptive backoff)
 
         Yields:
             New feature records
         """
         max_buffer_size = 1000
-        query = f"""
-        SELECT * FROM (
-            SELECT rowid, * FROM trf_data
-            WHERE rowid > ?
-        ) {query_conditions(custom_filter=query_filter)} LIMIT {max_buffer_size}
-        """
-        last_rowid = 0 if existing else self._main_index_range()[1]
-        while True:
-            # buffer rows to allow in-between write transactions
-            rows = list(read_sql_generator(self.connection(), query, last_rowid))
-            for row in rows:
-                last_rowid = row.pop("rowid")
-                yield FeatureRecord.from_sql(row)
-            if len(rows) == 0:
-                if not wait and self._file_status() == 0:  # no writer active
-                    break
-                sleep(0.1)  # wait 100 ms until next read
+        last_rowid = 0 if existing else self._main_index_range()[1] or 0
+        yield from self._listen_records(
+            self._listen_query(query_filter, max_buffer_size),
+            "rowid",
+            last_rowid,
+            self._listen_row_factory,
+            buffer_size=max_buffer_size,
+            wait=wait,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+    async def alisten(
+        self,
+        existing: bool = False,
+        wait: bool = False,
+        query_filter: Optional[str] = None,
+        *,
+        min_interval: float = 0.01,
+        max_interval: float = 0.1,
+    ) -> AsyncIterator[FeatureRecord]:
+        """
+        Listen to database changes and return new records asynchronously.
+
+        Async version of `listen`. Records are read in batches on worker threads without
+        blocking the event loop.
+
+        Args:
+            existing: Return already existing records
+            wait: Wait for new records even if no acquisition (writer) is active.
+                Otherwise the function returns after all records are read.
+            query_filter: Optional query filter provided as SQL clause,
+                e.g. "TRAI >= 100"
+            min_interval: Minimum polling interval in seconds.
+                The database is only queried again if changes were detected.
+            max_interval: Maximum polling interval in seconds (adaptive backoff)
+
+        Yields:
+            New feature records
+        """
+        max_buffer_size = 1000
+        last_rowid = 0 if existing else self._main_index_range()[1] or 0
+        async for record in self._alisten_records(
+            self._listen_query(query_filter, max_buffer_size),
+            "rowid",
+            last_rowid,
+            self._listen_row_factory,
+            buffer_size=max_buffer_size,
+            wait=wait,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        ):
+            yield record
 
     @require_write_access
     def write(self, feature_set: FeatureRecord) -> int:
@@ -150,15 +298,10 @@ class TrfDatabase(Database):
         Returns:
             Index (trai) of inserted row
         """
-
-        def convert(value):
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-
         with self.connection() as con:  # commit/rollback transaction
-            row_dict = {key: convert(value) for key, value in feature_set.features.items()}
+            row_dict = {
+                key: _convert_feature_value(value) for key, value in feature_set.features.items()
+            }
             row_dict["TRAI"] = feature_set.trai
             try:
                 try:
@@ -169,3 +312,79 @@ class TrfDatabase(Database):
             except sqlite3.OperationalError:  # missing column(s)
                 self._add_columns(self._table_main, list(row_dict.keys()), "REAL")
                 return self.write(feature_set)  # try again
+
+    def _write_batch(self, records: Sequence[FeatureRecord]):
+        self.write_many(records)
+
+    @require_write_access
+    def write_many(self, feature_sets: Union[Iterable[FeatureRecord], pd.DataFrame]) -> int:
+        """
+        Write multiple feature records to trfdb within a single transaction.
+
+        Existing rows (same TRAI) are updated, missing feature columns are added.
+        Only the given features are written, other features of existing rows are kept.
+        Much faster than multiple calls of `write`.
+
+        Args:
+            feature_sets: Feature sets or DataFrame with features as columns and TRAI as index,
+                e.g. returned by `read`
+
+        Returns:
+            Number of written rows
+        """
+        if isinstance(feature_sets, pd.DataFrame):
+            features = feature_sets.to_dict("records")
+            feature_sets = [
+                FeatureRecord(trai=int(trai), features=features[i])
+                for i, trai in enumerate(feature_sets.index)
+            ]
+
+        rows = [
+            remove_none_values_from_dict(
+                {
+                    "TRAI": int(feature_set.trai),
+                    **{
+                        key: _convert_feature_value(value)
+                        for key, value in feature_set.features.items()
+                    },
+                }
+            )
+            for feature_set in feature_sets
+        ]
+        if not rows:
+            return 0
+
+        columns = tuple(dict.fromkeys(key for row in rows for key in row))
+        self._add_columns(self._table_main, columns, "REAL")
+
+        with self.connection() as con:  # commit/rollback transaction
+            trais = [row["TRAI"] for row in rows]
+            trais_exist = {
+                result[0]
+                for result in con.execute(
+                    f"SELECT TRAI FROM {self._table_main} WHERE TRAI BETWEEN ? AND ?",
+                    (min(trais), max(trais)),
+                )
+            }
+            # rows with the same columns are written with the same statements, missing
+            # features (None/NaN values) are not written and existing values are kept
+            for row_columns, group in groupby(rows, key=lambda row: tuple(row.keys())):
+                rows_insert = []
+                rows_update = []
+                for row in group:
+                    if row["TRAI"] in trais_exist:
+                        rows_update.append(row)
+                    else:
+                        rows_insert.append(row)
+                        trais_exist.add(row["TRAI"])
+                if rows_insert:
+                    con.executemany(
+                        generate_insert_query(self._table_main, row_columns), rows_insert
+                    )
+                if rows_update and len(row_columns) > 1:
+                    con.executemany(
+                        generate_update_query(self._table_main, row_columns, "TRAI"),
+                        rows_update,
+                    )
+        self._update_globalinfo()
+        return len(rows)
@@ -13,14 +13,55 @@ Following popular methods have been proposed in the past to automatically pick t
     aic
     energy_ratio
     modified_energy_ratio
+
+Batch processing
+----------------
+
+Pick arrival times of multiple signals at once, e.g. of the zero-padded (N, samples) matrix of
+`vallenae.io.TraBatch` returned by `vallenae.io.TraDatabase.iread_batches`.
+Only the indexes of the estimated arrival times are returned by default.
+
+.. autosummary::
+    :toctree: timepicker
+
+    hinkley_batch
+    aic_batch
+    energy_ratio_batch
+    modified_energy_ratio_batch
+
+Streaming
+---------
+
+Pick arrival times of continuous signals chunk by chunk with constant memory.
+
+.. autosummary::
+    :toctree: timepicker
+    :nosignatures:
+
+    StreamingHinkley
+    StreamingEnergyRatio
+    StreamingModifiedEnergyRatio
+    PickEvent
 """
 
-import math
 from typing import Tuple
 
 import numpy as np
 
 from .._numba import USE_NUMBA, njit
+from ._kernels import aic_row, energy_ratio_row, hinkley_row
+from .batch import (  # noqa: F401
+    aic_batch,
+    energy_ratio_batch,
+    hinkley_batch,
+    modified_energy_ratio_batch,
+)
+from .streaming import (  # noqa: F401
+    PickEvent,
+    StreamingEnergyRatio,
+    StreamingHinkley,
+    StreamingModifiedEnergyRatio,
+)
 
 
 def _hinkley_numpy(arr: np.ndarray, alpha: int = 5) -> Tuple[np.ndarray, int]:
@@ -33,27 +74,9 @@ def _hinkley_numpy(arr: np.ndarray, alpha: int = 5) -> Tuple[np.ndarray, int]:
 
 @njit
 def _hinkley_numba(arr: np.ndarray, alpha: int = 5) -> Tuple[np.ndarray, int]:
-    n = len(arr)
-    result = np.zeros(n, dtype=np.float32)
-
-    total_energy = 0.0
-    for i in range(n):
-        total_energy += arr[i] ** 2
-
-    negative_trend = total_energy / (alpha * n)
-
-    min_value = math.inf
-    min_index = 0
-
-    partial_energy = 0.0
-    for i in range(n):
-        partial_energy += arr[i] ** 2
-        result[i] = partial_energy - (i * negative_trend)
-        if result[i] < min_value:
-            min_value = result[i]
-            min_index = i
-
-    return result, min_index
+    result = np.zeros(len(arr), dtype=np.float32)
+    index = hinkley_row(arr, alpha, result)
+    return result, max(index, 0)
 
 
 def hinkley(arr: np.ndarray, alpha: int = 5) -> Tuple[np.ndarray, int]:
@@ -90,48 +113,9 @@ def hinkley(arr: np.ndarray, alpha: int = 5) -> Tuple[np.ndarray, int]:
 
 @njit
 def _aic_numba(arr: np.ndarray) -> Tuple[np.ndarray, int]:
-    n = len(arr)
-    result = np.full(n, np.nan, dtype=np.float32)
-    safety_eps = np.finfo(np.float32).tiny
-
-    min_value = math.inf
-    min_index = 0
-
-    l_sum = 0.0
-    r_sum = 0.0
-    l_squaresum = 0.0
-    r_squaresum = 0.0
-
-    for i in range(n):
-        r_sum += arr[i]
-        r_squaresum += arr[i] ** 2
-
-    for i in range(n - 1):
-        l_sum += arr[i]
-        l_squaresum += arr[i] ** 2
-
-        r_sum -= arr[i]
-        r_squaresum -= arr[i] ** 2
-
-        l_len = i + 1
-        r_len = n - i - 1
-
-        l_variance = (1 / l_len) * l_squaresum - ((1 / l_len) * l_sum) ** 2
-        r_variance = (1 / r_len) * r_squaresum - ((1 / r_len) * r_sum) ** 2
-
-        # catch negative and very small values < safety_eps
-        l_variance = max(l_variance, safety_eps)
-        r_variance = max(r_variance, safety_eps)
-
-        result[i] = (i + 1) * math.log(l_variance) / math.log(10) + (n - i - 2) * math.log(
-            r_variance
-        ) / math.log(10)
-
-        if result[i] < min_value:
-            min_value = result[i]
-            min_index = i
-
-    return result, min_index
+    result = np.full(len(arr), np.nan, dtype=np.float32)
+    index = aic_row(arr, result)
+    return result, max(index, 0)
 
 
 def _aic_numpy(arr: np.ndarray) -> Tuple[np.ndarray, int]:
@@ -196,32 +180,9 @@ def aic(arr: np.ndarray) -> Tuple[np.ndarray, int]:
 
 @njit
 def _energy_ratio_numba(arr: np.ndarray, win_len: int = 100) -> Tuple[np.ndarray, int]:
-    n = len(arr)
-    result = np.zeros(n, dtype=np.float32)
-
-    max_value = -math.inf
-    max_index = 0
-
-    l_squaresum = 0.0
-    r_squaresum = 0.0
-
-    for i in range(win_len):
-        l_squaresum += arr[i] ** 2
-
-    for i in range(win_len, win_len + win_len):
-        r_squaresum += arr[i] ** 2
-
-    for i in range(win_len, n - win_len):
-        l_squaresum += arr[i] ** 2
-        r_squaresum += arr[i + win_len] ** 2
-        l_squaresum -= arr[i - win_len] ** 2
-        r_squaresum -= arr[i] ** 2
-        result[i] = r_squaresum / l_squaresum
-        if result[i] > max_value:
-            max_value = result[i]
-            max_index = i
-
-    return result, max_index
+    result = np.zeros(len(arr), dtype=np.float32)
+    index = energy_ratio_row(arr, win_len, False, result)
+    return result, max(index, 0)
 
 
 def _energy_ratio_numpy(arr: np.ndarray, win_len: int = 100) -> Tuple[np.ndarray, int]:
@@ -0,0 +1,152 @@
+"""Shared Numba kernels of the single-signal and batch timepickers."""
+
+import math
+
+import numpy as np
+
+from .._numba import njit
+
+
+@njit
+def hinkley_row(arr: np.ndarray, alpha: int, out: np.ndarray) -> int:
+    """
+    Hinkley criterion of a single signal.
+
+    The detection function is written into `out` (skipped if `out` is empty).
+
+    Returns:
+        Index of the estimated arrival time, -1 for empty signals
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+
+    total_energy = 0.0
+    for i in range(n):
+        total_energy += arr[i] ** 2
+
+    negative_trend = total_energy / (alpha * n)
+    store = len(out) > 0
+
+    min_value = math.inf
+    min_index = 0
+
+    partial_energy = 0.0
+    for i in range(n):
+        partial_energy += arr[i] ** 2
+        value = np.float32(partial_energy - (i * negative_trend))
+        if store:
+            out[i] = value
+        if value < min_value:
+            min_value = float(value)
+            min_index = i
+
+    return min_index
+
+
+@njit
+def aic_row(arr: np.ndarray, out: np.ndarray) -> int:
+    """
+    Akaike Information Criterion (AIC) of a single signal.
+
+    The detection function is written into `out` (skipped if `out` is empty).
+
+    Returns:
+        Index of the estimated arrival time, -1 for signals with less than 2 samples
+    """
+    n = len(arr)
+    if n < 2:
+        return -1
+
+    safety_eps = np.finfo(np.float32).tiny
+    store = len(out) > 0
+
+    min_value = math.inf
+    min_index = 0
+
+    l_sum = 0.0
+    r_sum = 0.0
+    l_squaresum = 0.0
+    r_squaresum = 0.0
+
+    for i in range(n):
+        r_sum += arr[i]
+        r_squaresum += arr[i] ** 2
+
+    for i in range(n - 1):
+        l_sum += arr[i]
+        l_squaresum += arr[i] ** 2
+
+        r_sum -= arr[i]
+        r_squaresum -= arr[i] ** 2
+
+        l_len = i + 1
+        r_len = n - i - 1
+
+        l_variance = (1 / l_len) * l_squaresum - ((1 / l_len) * l_sum) ** 2
+        r_variance = (1 / r_len) * r_squaresum - ((1 / r_len) * r_sum) ** 2
+
+        # catch negative and very small values < safety_eps
+        l_variance = max(l_variance, safety_eps)
+        r_variance = max(r_variance, safety_eps)
+
+        value = np.float32(
+            (i + 1) * math.log(l_variance) / math.log(10)
+            + (n - i - 2) * math.log(r_variance) / math.log(10)
+        )
+        if store:
+            out[i] = value
+        if value < min_value:
+            min_value = float(value)
+            min_index = i
+
+    return min_index
+
+
+@njit
+def energy_ratio_row(arr: np.ndarray, win_len: int, modified: bool, out: np.ndarray) -> int:
+    """
+    (Modified) energy ratio of a single signal.
+
+    The detection function is written into `out` (skipped if `out` is empty).
+
+    Returns:
+        Index of the estimated arrival time, -1 for signals with less than `2 * win_len + 1`
+        samples
+    """
+    n = len(arr)
+    if n <= 2 * win_len:
+        return -1
+
+    store = len(out) > 0
+
+    # modified energy ratio: argmax over zero-initialized detection function
+    max_value = 0.0 if modified else -math.inf
+    max_index = 0
+
+    l_squaresum = 0.0
+    r_squaresum = 0.0
+
+    for i in range(win_len):
+        l_squaresum += arr[i] ** 2
+
+    for i in range(win_len, win_len + win_len):
+        r_squaresum += arr[i] ** 2
+
+    for i in range(win_len, n - win_len):
+        l_squaresum += arr[i] ** 2
+        r_squaresum += arr[i + win_len] ** 2
+        l_squaresum -= arr[i - win_len] ** 2
+        r_squaresum -= arr[i] ** 2
+        value = np.float32(r_squaresum / l_squaresum)
+        if modified:
+            value = np.float32(value * abs(arr[i]))
+            value = value * value
+            value = value * value
+        if store:
+            out[i] = value
+        if value > max_value:
+            max_value = float(value)
+            max_index = i
+
+    return max_index
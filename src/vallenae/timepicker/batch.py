@@ -0,0 +1,281 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .._numba import USE_NUMBA, njit, prange
+from ._kernels import aic_row, energy_ratio_row, hinkley_row
+
+_BatchResult = Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]
+
+
+def _row_lengths(data: np.ndarray, lengths: Optional[np.ndarray]) -> np.ndarray:
+    """Validate input matrix and return number of valid samples per row."""
+    if data.ndim != 2:
+        raise ValueError(f"Input must be a 2D array (N, samples), got {data.ndim}D array")
+    if lengths is None:
+        return np.full(data.shape[0], data.shape[1], dtype=np.intp)
+    lengths = np.asarray(lengths, dtype=np.intp)
+    if lengths.shape != (data.shape[0],):
+        raise ValueError(f"Lengths must be of shape ({data.shape[0]},), got {lengths.shape}")
+    if np.any(lengths < 0) or np.any(lengths > data.shape[1]):
+        raise ValueError(f"Lengths must be within [0, {data.shape[1]}]")
+    return lengths
+
+
+def _valid_mask(data: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    return np.arange(data.shape[1]) < lengths[:, np.newaxis]
+
+
+def _empty_result(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return np.zeros(data.shape, dtype=np.float32), np.full(data.shape[0], -1, dtype=np.intp)
+
+
+def _output_numba(data: np.ndarray, detection_function: bool, fill_value=0) -> np.ndarray:
+    """Detection function matrix or (N, 0) placeholder to skip the allocation."""
+    shape = data.shape if detection_function else (data.shape[0], 0)
+    return np.full(shape, fill_value, dtype=np.float32)
+
+
+def _result(
+    detection_functions: np.ndarray, indices: np.ndarray, detection_function: bool
+) -> _BatchResult:
+    if detection_function:
+        return detection_functions, indices
+    return indices
+
+
+@njit(parallel=True)
+def _hinkley_batch_numba(
+    data: np.ndarray, lengths: np.ndarray, alpha: int, out: np.ndarray
+) -> np.ndarray:
+    indices = np.empty(data.shape[0], dtype=np.intp)
+    for i in prange(data.shape[0]):  # pylint: disable=not-an-iterable
+        indices[i] = hinkley_row(data[i, : lengths[i]], alpha, out[i])
+    return indices
+
+
+def _hinkley_batch_numpy(
+    data: np.ndarray, lengths: np.ndarray, alpha: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_rows, n_samples = data.shape
+    if n_samples == 0:
+        return _empty_result(data)
+    valid = _valid_mask(data, lengths)
+    energy_cum = np.cumsum(np.where(valid, data, 0) ** 2, axis=1, dtype=np.float64)
+    total_energy = energy_cum[np.arange(n_rows), np.maximum(lengths - 1, 0)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        negative_trend = total_energy / (alpha * lengths)
+    result = energy_cum - np.arange(n_samples) * negative_trend[:, np.newaxis]
+    indices = np.argmin(np.where(valid, result, np.inf), axis=1)
+    result = np.where(valid, result, 0).astype(np.float32)
+    return result, np.where(lengths > 0, indices, -1)
+
+
+def hinkley_batch(
+    data: np.ndarray,
+    alpha: int = 5,
+    lengths: Optional[np.ndarray] = None,
+    *,
+    detection_function: bool = False,
+) -> _BatchResult:
+    """
+    Hinkley criterion for arrival time estimation of multiple signals.
+
+    Rows are processed in parallel if Numba is available.
+    See `hinkley` for details.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        alpha: Divisor of the negative trend. Default: 5
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+        detection_function: Return the detection functions (N, samples) as well.
+            Only the indexes are computed by default to save memory
+
+    Returns:
+        - Matrix with computed detection functions (only if `detection_function` is `True`)
+        - Indexes of the estimated arrival times (N,). -1 for empty rows
+    """
+    lengths = _row_lengths(data, lengths)
+    if USE_NUMBA:
+        out = _output_numba(data, detection_function)
+        indices = _hinkley_batch_numba(data, lengths, alpha, out)
+        return _result(out, indices, detection_function)
+    return _result(*_hinkley_batch_numpy(data, lengths, alpha), detection_function)
+
+
+@njit(parallel=True)
+def _aic_batch_numba(data: np.ndarray, lengths: np.ndarray, out: np.ndarray) -> np.ndarray:
+    indices = np.empty(data.shape[0], dtype=np.intp)
+    for i in prange(data.shape[0]):  # pylint: disable=not-an-iterable
+        indices[i] = aic_row(data[i, : lengths[i]], out[i])
+    return indices
+
+
+def _aic_batch_numpy(data: np.ndarray, lengths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    n_rows, n_samples = data.shape
+    if n_samples == 0:
+        return _empty_result(data)
+    safety_eps = np.finfo(np.float32).tiny
+    data = np.where(_valid_mask(data, lengths), data, 0)
+    last = (np.arange(n_rows), np.maximum(lengths - 1, 0))
+
+    l_sum = np.cumsum(data, axis=1, dtype=np.float64)
+    l_squaresum = np.cumsum(data**2, axis=1, dtype=np.float64)
+    r_sum = l_sum[last][:, np.newaxis] - l_sum
+    r_squaresum = l_squaresum[last][:, np.newaxis] - l_squaresum
+
+    index = np.arange(n_samples)
+    l_len = index + 1
+    r_len = lengths[:, np.newaxis] - index - 1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        l_variance = (1 / l_len) * l_squaresum - ((1 / l_len) * l_sum) ** 2
+        r_variance = (1 / r_len) * r_squaresum - ((1 / r_len) * r_sum) ** 2
+
+    # catch negative and very small values < safety_eps
+    np.maximum(l_variance, safety_eps, out=l_variance)
+    np.maximum(r_variance, safety_eps, out=r_variance)
+
+    result = (index + 1) * np.log10(l_variance) + (r_len - 1) * np.log10(r_variance)
+    valid = r_len > 0
+    indices = np.argmin(np.where(valid, result, np.inf), axis=1)
+    result = np.where(valid, result, np.nan).astype(np.float32)
+    return result, np.where(lengths >= 2, indices, -1)
+
+
+def aic_batch(
+    data: np.ndarray,
+    lengths: Optional[np.ndarray] = None,
+    *,
+    detection_function: bool = False,
+) -> _BatchResult:
+    """
+    Akaike Information Criterion (AIC) for arrival time estimation of multiple signals.
+
+    Rows are processed in parallel if Numba is available.
+    See `aic` for details.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+        detection_function: Return the detection functions (N, samples) as well.
+            Only the indexes are computed by default to save memory
+
+    Returns:
+        - Matrix with computed detection functions (only if `detection_function` is `True`)
+        - Indexes of the estimated arrival times (N,). -1 for rows with less than 2 samples
+    """
+    lengths = _row_lengths(data, lengths)
+    if USE_NUMBA:
+        out = _output_numba(data, detection_function, np.nan)
+        indices = _aic_batch_numba(data, lengths, out)
+        return _result(out, indices, detection_function)
+    return _result(*_aic_batch_numpy(data, lengths), detection_function)
+
+
+@njit(parallel=True)
+def _energy_ratio_batch_numba(
+    data: np.ndarray, lengths: np.ndarray, win_len: int, modified: bool, out: np.ndarray
+) -> np.ndarray:
+    indices = np.empty(data.shape[0], dtype=np.intp)
+    for i in prange(data.shape[0]):  # pylint: disable=not-an-iterable
+        indices[i] = energy_ratio_row(data[i, : lengths[i]], win_len, modified, out[i])
+    return indices
+
+
+def _energy_ratio_batch_numpy(
+    data: np.ndarray, lengths: np.ndarray, win_len: int, modified: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_samples = data.shape[1]
+    result = np.zeros(data.shape, dtype=np.float32)
+    if n_samples > 2 * win_len:
+        data = np.where(_valid_mask(data, lengths), data, 0)
+        squaresum_cum = np.cumsum(data**2, axis=1, dtype=np.float64)
+        l_squaresum = squaresum_cum[:, win_len:-win_len] - squaresum_cum[:, : -2 * win_len]
+        r_squaresum = squaresum_cum[:, 2 * win_len :] - squaresum_cum[:, win_len:-win_len]
+        valid = np.arange(win_len, n_samples - win_len) < (lengths - win_len)[:, np.newaxis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[:, win_len:-win_len] = np.where(valid, r_squaresum / l_squaresum, 0)
+        if modified:
+            np.multiply(result, np.abs(data), out=result, casting="unsafe")
+            np.multiply(result, result, out=result)
+            np.multiply(result, result, out=result)
+    indices = np.argmax(result, axis=1)
+    return result, np.where(lengths > 2 * win_len, indices, -1)
+
+
+def _energy_ratio_batch(
+    data: np.ndarray,
+    win_len: int,
+    lengths: Optional[np.ndarray],
+    modified: bool,
+    detection_function: bool,
+) -> _BatchResult:
+    lengths = _row_lengths(data, lengths)
+    if win_len < 1:
+        raise ValueError("Window length must be greater than 0")
+    if USE_NUMBA:
+        out = _output_numba(data, detection_function)
+        indices = _energy_ratio_batch_numba(data, lengths, win_len, modified, out)
+        return _result(out, indices, detection_function)
+    return _result(*_energy_ratio_batch_numpy(data, lengths, win_len, modified), detection_function)
+
+
+def energy_ratio_batch(
+    data: np.ndarray,
+    win_len: int = 100,
+    lengths: Optional[np.ndarray] = None,
+    *,
+    detection_function: bool = False,
+) -> _BatchResult:
+    """
+    Energy ratio for arrival time estimation of multiple signals.
+
+    Rows are processed in parallel if Numba is available.
+    See `energy_ratio` for details.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        win_len: Samples of sliding windows. Default: 100
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+        detection_function: Return the detection functions (N, samples) as well.
+            Only the indexes are computed by default to save memory
+
+    Returns:
+        - Matrix with computed detection functions (only if `detection_function` is `True`)
+        - Indexes of the estimated arrival times (N,).
+          -1 for rows with less than `2 * win_len + 1` samples
+    """
+    return _energy_ratio_batch(data, win_len, lengths, False, detection_function)
+
+
+def modified_energy_ratio_batch(
+    data: np.ndarray,
+    win_len: int = 100,
+    lengths: Optional[np.ndarray] = None,
+    *,
+    detection_function: bool = False,
+) -> _BatchResult:
+    """
+    Modified energy ratio method for arrival time estimation of multiple signals.
+
+    Rows are processed in parallel if Numba is available.
+    See `modified_energy_ratio` for details.
+
+    Args:
+        data: Input matrix (N, samples), e.g. `TraBatch.data`
+        win_len: Samples of sliding windows. Default: 100
+        lengths: Number of valid samples per row (N,), e.g. `TraBatch.samples`.
+            All samples are valid if `None`
+        detection_function: Return the detection functions (N, samples) as well.
+            Only the indexes are computed by default to save memory
+
+    Returns:
+        - Matrix with computed detection functions (only if `detection_function` is `True`)
+        - Indexes of the estimated arrival times (N,).
+          -1 for rows with less than `2 * win_len + 1` samples
+    """
+    return _energy_ratio_batch(data, win_len, lengths, True, detection_function)
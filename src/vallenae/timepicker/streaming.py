@@ -0,0 +1,382 @@
+import math
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from .._numba import njit
+
+
+class PickEvent(NamedTuple):
+    """Pick event of a streaming timepicker."""
+
+    pick: int  #: Sample index of the estimated arrival time (from start of stream)
+    value: float  #: Value of the detection function at `pick`
+    start: int  #: First sample index of the event (detection function above threshold)
+    stop: int  #: Sample index after the last sample of the event
+
+
+# indexes of state arrays of energy ratio kernel
+_ER_L_SQUARESUM = 0
+_ER_R_SQUARESUM = 1
+_ER_MAX_VALUE = 2
+_ER_EVENT_MAX_VALUE = 3
+
+_ER_NEXT_INDEX = 0
+_ER_MAX_INDEX = 1
+_ER_IN_EVENT = 2
+_ER_EVENT_START = 3
+_ER_EVENT_MAX_INDEX = 4
+
+
+@njit
+def _energy_ratio_stream(  # noqa: PLR0915, PLR0917
+    buffer: np.ndarray,
+    buffer_start: int,
+    win_len: int,
+    modified: bool,
+    threshold: float,
+    state: np.ndarray,
+    istate: np.ndarray,
+    events: np.ndarray,
+) -> int:
+    """
+    Compute energy ratio of all complete sliding windows in buffer and detect events.
+
+    The state arrays are updated in-place, events are written as rows
+    (pick index, start, stop, value) into `events`.
+
+    Returns:
+        Number of detected events
+    """
+    buffer_stop = buffer_start + len(buffer)
+    if istate[_ER_NEXT_INDEX] < 0:  # not initialized
+        if buffer_stop < 2 * win_len:
+            return 0
+        l_squaresum = 0.0
+        r_squaresum = 0.0
+        for i in range(win_len):
+            l_squaresum += buffer[i] ** 2
+        for i in range(win_len, win_len + win_len):
+            r_squaresum += buffer[i] ** 2
+        state[_ER_L_SQUARESUM] = l_squaresum
+        state[_ER_R_SQUARESUM] = r_squaresum
+        istate[_ER_NEXT_INDEX] = win_len
+
+    l_squaresum = state[_ER_L_SQUARESUM]
+    r_squaresum = state[_ER_R_SQUARESUM]
+    max_value = state[_ER_MAX_VALUE]
+    max_index = istate[_ER_MAX_INDEX]
+    in_event = istate[_ER_IN_EVENT] != 0
+    event_start = istate[_ER_EVENT_START]
+    event_max_value = state[_ER_EVENT_MAX_VALUE]
+    event_max_index = istate[_ER_EVENT_MAX_INDEX]
+    count = 0
+
+    next_index = istate[_ER_NEXT_INDEX]
+    for i in range(next_index, buffer_stop - win_len):
+        j = i - buffer_start
+        l_squaresum += buffer[j] ** 2
+        r_squaresum += buffer[j + win_len] ** 2
+        l_squaresum -= buffer[j - win_len] ** 2
+        r_squaresum -= buffer[j] ** 2
+        value = np.float32(r_squaresum / l_squaresum)
+        if modified:
+            value = np.float32(value * abs(buffer[j]))
+            value = value * value
+            value = value * value
+
+        if value > max_value:
+            max_value = value
+            max_index = i
+
+        if value >= threshold:
+            if not in_event:
+                in_event = True
+                event_start = i
+                event_max_value = -math.inf
+            if value > event_max_value:
+                event_max_value = value
+                event_max_index = i
+        elif in_event:
+            in_event = False
+            events[count, 0] = event_max_index
+            events[count, 1] = event_start
+            events[count, 2] = i
+            events[count, 3] = event_max_value
+            count += 1
+
+    state[_ER_L_SQUARESUM] = l_squaresum
+    state[_ER_R_SQUARESUM] = r_squaresum
+    state[_ER_MAX_VALUE] = max_value
+    state[_ER_EVENT_MAX_VALUE] = event_max_value
+    istate[_ER_NEXT_INDEX] = max(next_index, buffer_stop - win_len)
+    istate[_ER_MAX_INDEX] = max_index
+    istate[_ER_IN_EVENT] = 1 if in_event else 0
+    istate[_ER_EVENT_START] = event_start
+    istate[_ER_EVENT_MAX_INDEX] = event_max_index
+    return count
+
+
+class _StreamingEnergyRatioBase:
+    _modified = False
+
+    def __init__(self, win_len: int = 100, threshold: Optional[float] = None):
+        if win_len < 1:
+            raise ValueError("Window length must be greater than 0")
+        self._win_len = win_len
+        self._threshold = threshold
+        self.reset()
+
+    def reset(self):
+        """Reset state to start a new stream."""
+        self._buffer = np.empty(0, dtype=np.float32)
+        self._buffer_start = 0
+        self._samples = 0
+        self._state = np.array([0.0, 0.0, 0.0 if self._modified else -math.inf, 0.0])
+        self._istate = np.array([-1, 0, 0, 0, 0], dtype=np.int64)
+
+    @property
+    def samples(self) -> int:
+        """Number of processed samples."""
+        return self._samples
+
+    def process(self, chunk: np.ndarray) -> List[PickEvent]:
+        """
+        Process next chunk of the signal.
+
+        Args:
+            chunk: Next samples of the signal
+
+        Returns:
+            Completed pick events (detection function fell below threshold)
+        """
+        chunk = np.asarray(chunk)
+        if chunk.ndim != 1:
+            raise ValueError(f"Chunk must be a 1D array, got {chunk.ndim}D array")
+        buffer = chunk if len(self._buffer) == 0 else np.concatenate((self._buffer, chunk))
+        self._samples += len(chunk)
+
+        events = np.empty((len(buffer) // 2 + 1, 4), dtype=np.float64)
+        threshold = math.inf if self._threshold is None else self._threshold
+        count = _energy_ratio_stream(
+            buffer,
+            self._buffer_start,
+            self._win_len,
+            self._modified,
+            threshold,
+            self._state,
+            self._istate,
+            events,
+        )
+
+        # keep samples required for the next sliding windows
+        next_index = self._istate[_ER_NEXT_INDEX]
+        if next_index >= 0:
+            keep_start = next_index - self._win_len
+            self._buffer = buffer[keep_start - self._buffer_start :].copy()
+            self._buffer_start = keep_start
+        else:
+            self._buffer = buffer.copy()
+
+        return [
+            PickEvent(pick=int(pick), value=float(value), start=int(start), stop=int(stop))
+            for pick, start, stop, value in events[:count]
+        ]
+
+    def flush(self) -> List[PickEvent]:
+        """
+        Finish stream and reset state.
+
+        Returns:
+            - Pending pick event if the detection function is still above the threshold
+            - Pick event of the whole stream (max value) if no threshold is set
+        """
+        stop = max(self._samples - self._win_len, 0)
+        events = []
+        if self._threshold is None:
+            if self._samples > 0:
+                events.append(
+                    PickEvent(
+                        pick=int(self._istate[_ER_MAX_INDEX]),
+                        value=float(max(self._state[_ER_MAX_VALUE], 0)),
+                        start=0,
+                        stop=self._samples,
+                    )
+                )
+        elif self._istate[_ER_IN_EVENT]:
+            events.append(
+                PickEvent(
+                    pick=int(self._istate[_ER_EVENT_MAX_INDEX]),
+                    value=float(self._state[_ER_EVENT_MAX_VALUE]),
+                    start=int(self._istate[_ER_EVENT_START]),
+                    stop=stop,
+                )
+            )
+        self.reset()
+        return events
+
+
+class StreamingEnergyRatio(_StreamingEnergyRatioBase):
+    """
+    Energy ratio for arrival time estimation of continuous signals.
+
+    The signal is processed chunk by chunk with constant memory. The state of the sliding
+    windows is carried across chunk boundaries, so the detection function equals the
+    detection function of `energy_ratio` applied to the whole signal.
+
+    A pick event is emitted for each section where the detection function exceeds the
+    threshold (pick at max value). Without a threshold, `flush` returns a single pick event
+    with the same index as `energy_ratio`.
+
+    Example:
+        >>> picker = StreamingEnergyRatio(win_len=100, threshold=10)
+        >>> for chunk in chunks:
+        ...     for event in picker.process(chunk):
+        ...         print(event.pick)
+        >>> picker.flush()
+    """
+
+    def __init__(self, win_len: int = 100, threshold: Optional[float] = None):
+        """
+        Args:
+            win_len: Samples of sliding windows. Default: 100
+            threshold: Threshold of the detection function to trigger pick events.
+                Only a single pick of the whole stream is returned by `flush` if `None`
+        """
+        super().__init__(win_len, threshold)
+
+
+class StreamingModifiedEnergyRatio(_StreamingEnergyRatioBase):
+    """
+    Modified energy ratio method for arrival time estimation of continuous signals.
+
+    Streaming version of `modified_energy_ratio`, see `StreamingEnergyRatio` for details.
+    """
+
+    _modified = True
+
+    def __init__(self, win_len: int = 100, threshold: Optional[float] = None):
+        """
+        Args:
+            win_len: Samples of sliding windows. Default: 100
+            threshold: Threshold of the detection function to trigger pick events.
+                Only a single pick of the whole stream is returned by `flush` if `None`
+        """
+        super().__init__(win_len, threshold)
+
+
+@njit
+def _hinkley_hull_update(  # noqa: PLR0917
+    chunk: np.ndarray,
+    offset: int,
+    energy: float,
+    hull_x: np.ndarray,
+    hull_y: np.ndarray,
+    size: int,
+):
+    """Add points (index, partial energy) of chunk to the lower convex hull."""
+    for k in range(len(chunk)):
+        energy += chunk[k] ** 2
+        x = offset + k
+        while size >= 2:
+            dx1 = hull_x[size - 1] - hull_x[size - 2]
+            dy1 = hull_y[size - 1] - hull_y[size - 2]
+            dx2 = x - hull_x[size - 2]
+            dy2 = energy - hull_y[size - 2]
+            if dx1 * dy2 - dy1 * dx2 > 0:
+                break
+            size -= 1  # last point is not below the line to the new point
+        hull_x[size] = x
+        hull_y[size] = energy
+        size += 1
+    return energy, size
+
+
+class StreamingHinkley:
+    """
+    Hinkley criterion for arrival time estimation of continuous signals.
+
+    The negative trend of the Hinkley criterion depends on the total energy of the signal,
+    so the pick is only known at the end of the stream (`flush`).
+    Instead of the whole signal, only the lower convex hull of the partial energy is kept
+    (the minimum of the detection function is always on the hull).
+    The hull usually consists of few points, so the memory is nearly constant.
+    The pick equals the pick of `hinkley` applied to the whole signal.
+
+    Use `flush` to pick segments of a continuous signal, e.g. the sections of pick events
+    of `StreamingEnergyRatio`.
+    """
+
+    def __init__(self, alpha: int = 5):
+        """
+        Args:
+            alpha: Divisor of the negative trend. Default: 5
+        """
+        if alpha <= 0:
+            raise ValueError("Alpha must be greater than 0")
+        self._alpha = alpha
+        self.reset()
+
+    def reset(self):
+        """Reset state to start a new stream."""
+        self._samples = 0
+        self._energy = 0.0
+        self._hull_x = np.empty(0, dtype=np.int64)
+        self._hull_y = np.empty(0, dtype=np.float64)
+
+    @property
+    def samples(self) -> int:
+        """Number of processed samples."""
+        return self._samples
+
+    def process(self, chunk: np.ndarray) -> List[PickEvent]:
+        """
+        Process next chunk of the signal.
+
+        Args:
+            chunk: Next samples of the signal
+
+        Returns:
+            Always empty, the pick is returned by `flush`
+        """
+        chunk = np.asarray(chunk)
+        if chunk.ndim != 1:
+            raise ValueError(f"Chunk must be a 1D array, got {chunk.ndim}D array")
+        size = len(self._hull_x)
+        hull_x = np.empty(size + len(chunk), dtype=np.int64)
+        hull_y = np.empty(size + len(chunk), dtype=np.float64)
+        hull_x[:size] = self._hull_x
+        hull_y[:size] = self._hull_y
+        self._energy, size = _hinkley_hull_update(
+            chunk, self._samples, self._energy, hull_x, hull_y, size
+        )
+        self._hull_x = hull_x[:size].copy()
+        self._hull_y = hull_y[:size].copy()
+        self._samples += len(chunk)
+        return []
+
+    def flush(self) -> List[PickEvent]:
+        """
+        Finish stream and reset state.
+
+        Returns:
+            Pick event of the whole stream (min value of the detection function)
+        """
+        events = []
+        if self._samples > 0:
+            negative_trend = self._energy / (self._alpha * self._samples)
+            # slopes of the lower convex hull are increasing,
+            # the minimum is at the first vertex with a following slope >= negative trend
+            slopes = np.diff(self._hull_y) / np.diff(self._hull_x)
+            vertex = int(np.searchsorted(slopes, negative_trend, side="left"))
+            pick = int(self._hull_x[vertex])
+            events.append(
+                PickEvent(
+                    pick=pick,
+                    value=float(self._hull_y[vertex] - pick * negative_trend),
+                    start=0,
+                    stop=self._samples,
+                )
+            )
+        self.reset()
+        return events
@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 from vallenae import features, timepicker
-from vallenae.io import compression
+from vallenae.io import PriDatabase, TraDatabase, TraRecord, compression
+from vallenae.io._dataframe import iter_to_dataframe
+from vallenae.io._sql import sql_binary_search
 
 
 @pytest.fixture()
@@ -10,6 +12,102 @@ def random_array():
     return rng.random(65536)
 
 
+@pytest.fixture(name="large_pridb", scope="module")
+def fixture_large_pridb(tmp_path_factory):
+    filename = tmp_path_factory.mktemp("benchmark") / "large.pridb"
+    hits = 20_000
+    with PriDatabase(filename, mode="rwc") as pridb, pridb.connection() as con:
+        con.execute(
+            "INSERT INTO ae_params (ID, SetupID, Chan, ADC_µV, ADC_TE, ADC_SS) "
+            "VALUES (1, 1, 1, 1, 1, 1)"
+        )
+        con.executemany(
+            "INSERT INTO ae_data (SetType, Time, Chan, Status, ParamID, Thr, Amp, RiseT, "
+            "Dur, Eny, SS, RMS, Counts, TRAI) "
+            "VALUES (2, ?, ?, 0, 1, 100, ?, 10, 100, 1000, 500, 5, 12, ?)",
+            ((i * 1000, i % 4 + 1, 1000 + i % 100, i + 1) for i in range(hits)),
+        )
+    with PriDatabase(filename) as pridb:
+        yield pridb
+
+
+@pytest.mark.benchmark(group="read_hits")
+def test_benchmark_read_hits_iterator(benchmark, large_pridb):
+    benchmark(
+        lambda: iter_to_dataframe(
+            large_pridb.iread_hits(), show_progress=False, index_column="set_id"
+        )
+    )
+
+
+@pytest.mark.benchmark(group="read_hits")
+def test_benchmark_read_hits_columnar(benchmark, large_pridb):
+    benchmark(large_pridb.read_hits)
+
+
+@pytest.fixture(name="clustered_pridb", scope="module")
+def fixture_clustered_pridb(tmp_path_factory):
+    """Hits in clusters of 1000 same timestamps (e.g. cascade hits, calibration pulses)."""
+    filename = tmp_path_factory.mktemp("benchmark") / "clustered.pridb"
+    hits = 20_000
+    with PriDatabase(filename, mode="rwc") as pridb, pridb.connection() as con:
+        con.execute(
+            "INSERT INTO ae_params (ID, SetupID, Chan, ADC_µV, ADC_TE, ADC_SS) "
+            "VALUES (1, 1, 1, 1, 1, 1)"
+        )
+        con.executemany(
+            "INSERT INTO ae_data (SetType, Time, Chan, Status, ParamID, Amp, Dur, Eny) "
+            "VALUES (2, ?, ?, 0, 1, 1000, 100, 1000)",
+            (((i // 1000) * 1000, i % 4 + 1) for i in range(hits)),
+        )
+    with PriDatabase(filename) as pridb:
+        yield pridb
+
+
+@pytest.mark.benchmark(group="binary_search")
+@pytest.mark.parametrize("lower_bound", [True, False])
+def test_benchmark_binary_search_same_values(benchmark, clustered_pridb, lower_bound):
+    con = clustered_pridb.connection()
+    result = benchmark(
+        lambda: sql_binary_search(
+            con, "ae_data", "Time", "SetID", lambda t: t >= 10_000, lower_bound=lower_bound
+        )
+    )
+    assert result == (10_001 if lower_bound else 11_000)  # bounds of the cluster
+
+
+@pytest.fixture(name="flac_tradb", scope="module")
+def fixture_flac_tradb(tmp_path_factory):
+    filename = tmp_path_factory.mktemp("benchmark") / "flac.tradb"
+    rng = np.random.default_rng(42)
+    with TraDatabase(filename, mode="rwc", compression=True) as tradb:
+        tradb.connection().execute(
+            "INSERT INTO tr_params (ID, SetupID, Chan, ADC_µV, TR_mV) VALUES (1, 1, 1, 1, 1)"
+        )
+        for trai in range(1, 201):
+            tradb.write(
+                TraRecord(
+                    time=trai,
+                    channel=1,
+                    param_id=1,
+                    pretrigger=0,
+                    threshold=0,
+                    samplerate=1_000_000,
+                    samples=65536,
+                    data=rng.normal(scale=0.1, size=65536).astype(np.float32),
+                    trai=trai,
+                )
+            )
+    with TraDatabase(filename) as tradb:
+        yield tradb
+
+
+@pytest.mark.benchmark(group="iread_flac")
+@pytest.mark.parametrize("workers", [None, 4])
+def test_benchmark_iread_flac(benchmark, flac_tradb, workers):
+    benchmark(lambda: list(flac_tradb.iread(workers=workers)))
+
+
 @pytest.mark.benchmark(group="features")
 @pytest.mark.parametrize(
     "function",
@@ -34,6 +132,54 @@ def test_benchmark_features(benchmark, random_array, function):
     benchmark(function, random_array)
 
 
+@pytest.mark.benchmark(group="features_all")
+def test_benchmark_features_separate(benchmark, random_array):
+    def compute(y):
+        index_peak = features.peak_amplitude_index(y)
+        first_crossing = features.first_threshold_crossing(y, 0.5)
+        features.rise_time(y, 0.5, 1_000_000, first_crossing, index_peak)
+        features.energy(y, 1_000_000)
+        features.signal_strength(y, 1_000_000)
+        features.counts(y, 0.5)
+        features.rms(y)
+
+    benchmark(compute, random_array)
+
+
+@pytest.mark.benchmark(group="features_all")
+def test_benchmark_features_compute_all(benchmark, random_array):
+    benchmark(features.compute_all, random_array, 0.5, 1_000_000)
+
+
+@pytest.fixture(name="random_matrix")
+def fixture_random_matrix():
+    rng = np.random.default_rng(42)
+    return rng.normal(size=(10_000, 256)).astype(np.float32)
+
+
+@pytest.mark.benchmark(group="features_batch")
+def test_benchmark_features_loop(benchmark, random_matrix):
+    def compute():
+        for row in random_matrix:
+            features.peak_amplitude(row)
+            features.energy(row, 1_000_000)
+            features.counts(row, 0.5)
+            features.rms(row)
+
+    benchmark(compute)
+
+
+@pytest.mark.benchmark(group="features_batch")
+def test_benchmark_features_batch(benchmark, random_matrix):
+    def compute():
+        features.peak_amplitude_batch(random_matrix)
+        features.energy_batch(random_matrix, 1_000_000)
+        features.counts_batch(random_matrix, 0.5)
+        features.rms_batch(random_matrix)
+
+    benchmark(compute)
+
+
 @pytest.mark.benchmark(group="timepicker")
 @pytest.mark.parametrize(
     "function",
@@ -54,3 +200,17 @@ def test_benchmark_timepicker(benchmark, random_array, function):
 @pytest.mark.parametrize("data_format", [0, 2])
 def test_benchmark_encode(benchmark, random_array, data_format):
     benchmark(compression.encode_data_blob, random_array, data_format, 0.1)
+
+
+@pytest.mark.benchmark(group="timepicker_batch")
+def test_benchmark_timepicker_loop(benchmark, random_matrix):
+    def compute():
+        for row in random_matrix:
+            timepicker.hinkley(row)
+
+    benchmark(compute)
+
+
+@pytest.mark.benchmark(group="timepicker_batch")
+def test_benchmark_timepicker_batch(benchmark, random_matrix):
+    benchmark(timepicker.hinkley_batch, random_matrix)
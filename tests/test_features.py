@@ -4,18 +4,30 @@ from typing import Optional, Tuple
 
 import numpy as np
 import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from vallenae.features import acoustic_emission, batch
 from vallenae.features import (
+    HitFeatures,
     amplitude_to_db,
+    compute_all,
     counts,
+    counts_batch,
     db_to_amplitude,
     energy,
+    energy_batch,
     first_threshold_crossing,
+    first_threshold_crossing_batch,
     is_above_threshold,
     peak_amplitude,
+    peak_amplitude_batch,
     peak_amplitude_index,
+    peak_amplitude_index_batch,
     rise_time,
+    rise_time_batch,
     rms,
+    rms_batch,
     signal_strength,
+    signal_strength_batch,
 )
 
 LEN: int = 100
@@ -27,6 +39,17 @@ def fixture_random_array():
     return np.random.rand(LEN)
 
 
+@pytest.fixture(name="random_batch", scope="module")
+def fixture_random_batch():
+    """Random signals (with random padding), lengths and thresholds."""
+    rows = 20
+    data = np.random.randn(rows, LEN).astype(np.float32)
+    lengths = np.random.randint(1, LEN + 1, size=rows)
+    lengths[0] = LEN
+    thresholds = np.random.rand(rows) * 2
+    return data, lengths, thresholds
+
+
 def test_db_conversion():
     # 0 dB(AE) = 1 µV
     assert amplitude_to_db(1e-6) == 0
@@ -153,3 +176,113 @@ def test_rms(random_array):
         return math.sqrt(np.sum(data**2) / len(data))
 
     assert rms(random_array) == pytest.approx(naive(random_array))
+
+
+def test_batch_invalid_input(random_batch):
+    data, lengths, _ = random_batch
+    with pytest.raises(ValueError):
+        peak_amplitude_batch(data[0])
+    with pytest.raises(ValueError):
+        peak_amplitude_batch(data, lengths[:-1])
+    with pytest.raises(ValueError):
+        energy_batch(data, 1, np.full(len(data), LEN + 1))
+
+
+def test_batch_empty():
+    data = np.zeros((3, 0), dtype=np.float32)
+    assert peak_amplitude_batch(data).tolist() == [0, 0, 0]
+    assert first_threshold_crossing_batch(data, 1).tolist() == [-1, -1, -1]
+    assert counts_batch(data, 1).tolist() == [0, 0, 0]
+    assert energy_batch(data, 1).tolist() == [0, 0, 0]
+
+
+@pytest.mark.parametrize("with_lengths", [False, True])
+def test_batch(random_batch, with_lengths: bool):
+    data, lengths, thresholds = random_batch
+    samplerates = np.full(len(data), 1_000_000)
+    if not with_lengths:
+        lengths_arg = None
+        lengths = np.full(len(data), LEN)
+    else:
+        lengths_arg = lengths
+
+    rows = [data[i, :n] for i, n in enumerate(lengths)]
+
+    def expected(func, *args):
+        return [func(row, *[arg[i] for arg in args]) for i, row in enumerate(rows)]
+
+    assert_allclose(peak_amplitude_batch(data, lengths_arg), expected(peak_amplitude))
+    assert_array_equal(
+        peak_amplitude_index_batch(data, lengths_arg), expected(peak_amplitude_index)
+    )
+    assert_array_equal(
+        first_threshold_crossing_batch(data, thresholds, lengths_arg),
+        [-1 if i is None else i for i in expected(first_threshold_crossing, thresholds)],
+    )
+    assert_allclose(
+        rise_time_batch(data, thresholds, samplerates, lengths_arg),
+        expected(rise_time, thresholds, samplerates),
+    )
+    assert_allclose(
+        energy_batch(data, samplerates, lengths_arg),
+        expected(energy, samplerates),
+        rtol=1e-5,
+    )
+    assert_allclose(
+        signal_strength_batch(data, samplerates, lengths_arg),
+        expected(signal_strength, samplerates),
+        rtol=1e-5,
+    )
+    assert_array_equal(counts_batch(data, thresholds, lengths_arg), expected(counts, thresholds))
+    assert_allclose(rms_batch(data, lengths_arg), expected(rms), rtol=1e-5)
+
+    # scalar threshold and samplerate
+    assert_array_equal(counts_batch(data, 0.5, lengths_arg), [counts(row, 0.5) for row in rows])
+    assert_allclose(
+        energy_batch(data, 1000, lengths_arg), [energy(row, 1000) for row in rows], rtol=1e-5
+    )
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+@pytest.mark.parametrize("with_lengths", [False, True])
+def test_batch_int16(monkeypatch, use_numba: bool, with_lengths: bool):
+    monkeypatch.setattr(batch, "USE_NUMBA", use_numba)
+    # raw ADC values, squares overflow in int16
+    data = np.random.randint(-32768, 32768, size=(5, LEN)).astype(np.int16)
+    data[0, 0] = -32768
+    lengths = np.random.randint(1, LEN + 1, size=5) if with_lengths else np.full(5, LEN)
+    lengths_arg = lengths if with_lengths else None
+    rows = [data[i, :n].astype(np.float64) for i, n in enumerate(lengths)]
+
+    assert_allclose(
+        energy_batch(data, 1000, lengths_arg), [energy(row, 1000) for row in rows], rtol=1e-10
+    )
+    assert_allclose(
+        signal_strength_batch(data, 1000, lengths_arg),
+        [signal_strength(row, 1000) for row in rows],
+        rtol=1e-10,
+    )
+    assert_allclose(rms_batch(data, lengths_arg), [rms(row) for row in rows], rtol=1e-10)
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+@pytest.mark.parametrize("threshold", [0.1, 0.5, 10])
+def test_compute_all(monkeypatch, random_array, use_numba: bool, threshold: float):
+    monkeypatch.setattr(acoustic_emission, "USE_NUMBA", use_numba)
+    samplerate = 1_000_000
+    data = random_array - 0.5
+    result = compute_all(data, threshold, samplerate)
+    assert isinstance(result, HitFeatures)
+    assert result.peak_amplitude == pytest.approx(peak_amplitude(data))
+    assert result.peak_amplitude_index == peak_amplitude_index(data)
+    assert result.first_threshold_crossing == first_threshold_crossing(data, threshold)
+    assert result.rise_time == pytest.approx(rise_time(data, threshold, samplerate))
+    assert result.energy == pytest.approx(energy(data, samplerate))
+    assert result.signal_strength == pytest.approx(signal_strength(data, samplerate))
+    assert result.counts == counts(data, threshold)
+    assert result.rms == pytest.approx(rms(data))
+
+
+def test_compute_all_empty():
+    with pytest.raises(ValueError):
+        compute_all(np.zeros(0), 1, 1)
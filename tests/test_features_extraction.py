@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import Dict
+
+import pytest
+import vallenae as vae
+from vallenae.features import extraction
+from vallenae.io import TraRecord
+
+STEEL_PLATE_DIR = Path(__file__).resolve().parent / "../examples/steel_plate"
+SAMPLE_TRADB = STEEL_PLATE_DIR / "sample.tradb"
+
+
+def peak_amplitude(tra: TraRecord) -> Dict[str, float]:
+    return {"PA": vae.features.peak_amplitude(tra.data)}
+
+
+def energy_and_counts(tra: TraRecord) -> Dict[str, float]:
+    return {
+        "Energy": vae.features.energy(tra.data, tra.samplerate),
+        "Counts": vae.features.counts(tra.data, tra.threshold),
+    }
+
+
+def expected_features() -> Dict[int, Dict[str, float]]:
+    with vae.io.TraDatabase(SAMPLE_TRADB) as tradb:
+        return {
+            tra.trai: {**peak_amplitude(tra), **energy_and_counts(tra)}
+            for tra in tradb.iread()
+        }
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_extract_features(tmp_path, workers, chunk_size):
+    trfdb_path = tmp_path / "features.trfdb"
+    result = vae.features.extract_features(
+        SAMPLE_TRADB,
+        trfdb_path,
+        [peak_amplitude, energy_and_counts],
+        workers=workers,
+        chunk_size=chunk_size,
+        show_progress=False,
+    )
+    expected = expected_features()
+    assert result.records == len(expected)
+    assert result.workers == max(workers, 1)
+    assert result.records_per_second > 0
+
+    with vae.io.TrfDatabase(trfdb_path) as trfdb:
+        features = {record.trai: record.features for record in trfdb.iread()}
+    assert features.keys() == expected.keys()
+    for trai, values in expected.items():
+        assert features[trai] == pytest.approx(values)
+
+
+def test_extract_features_serial_no_worker_state(tmp_path):
+    vae.features.extract_features(
+        SAMPLE_TRADB,
+        tmp_path / "features.trfdb",
+        [peak_amplitude],
+        workers=0,
+        show_progress=False,
+    )
+    assert extraction._worker_tradb is None  # no leaked connection in main process
+
+
+def test_extract_features_query_filter(tmp_path):
+    trfdb_path = tmp_path / "features.trfdb"
+    result = vae.features.extract_features(
+        SAMPLE_TRADB,
+        trfdb_path,
+        [peak_amplitude],
+        workers=0,
+        query_filter="Chan == 1",
+        show_progress=False,
+    )
+    with vae.io.TraDatabase(SAMPLE_TRADB) as tradb:
+        trais = [tra.trai for tra in tradb.iread(channel=1)]
+    with vae.io.TrfDatabase(trfdb_path) as trfdb:
+        assert sorted(record.trai for record in trfdb.iread()) == trais
+    assert result.records == len(trais)
+
+
+def test_extract_features_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        vae.features.extract_features(SAMPLE_TRADB, tmp_path / "features.trfdb", [])
+    with pytest.raises(ValueError):
+        vae.features.extract_features(
+            SAMPLE_TRADB, tmp_path / "features.trfdb", [peak_amplitude], chunk_size=0
+        )
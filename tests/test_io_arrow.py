@@ -0,0 +1,135 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import vallenae as vae
+from numpy.testing import assert_allclose, assert_array_equal
+from vallenae.io import StatusRecord
+from vallenae.io._arrow import import_pyarrow, query_to_arrow
+from vallenae.io._dataframe import ColumnSpec
+
+STEEL_PLATE_DIR = Path(__file__).resolve().parent / "../examples/steel_plate"
+SAMPLE_PRIDB = STEEL_PLATE_DIR / "sample.pridb"
+SAMPLE_TRADB = STEEL_PLATE_DIR / "sample.tradb"
+SAMPLE_TRFDB = STEEL_PLATE_DIR / "sample.trfdb"
+
+
+@pytest.fixture(name="memory_abc")
+def fixture_memory_abc():
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE abc (id INTEGER PRIMARY KEY, a INT, b REAL, c INT, d REAL)")
+    for i in range(10):
+        con.execute(
+            "INSERT INTO abc (id, a, b, c) VALUES (?, ?, ?, ?)",
+            (i, i, i * 1e6, i if i % 2 else None),
+        )
+    yield con
+    con.close()
+
+
+def test_import_pyarrow_missing(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)  # import raises ImportError
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        import_pyarrow()
+
+
+@pytest.mark.parametrize("arraysize", [1, 3, 100])
+def test_query_to_arrow(memory_abc, arraysize):
+    pa = pytest.importorskip("pyarrow")
+    columns = [
+        ColumnSpec("a", "a", integer=True),
+        ColumnSpec("b", "b", divisor=1e6),
+        ColumnSpec("c", "c", integer=True),
+        ColumnSpec("d", "d"),
+        ColumnSpec("x", "x"),  # missing in result set
+    ]
+    table = query_to_arrow(
+        memory_abc, "SELECT * FROM abc", columns, show_progress=False, arraysize=arraysize
+    )
+    assert table.column_names == ["a", "b", "c"]  # empty column d dropped
+    assert table.schema.field("a").type == pa.int64()
+    assert table.schema.field("b").type == pa.float64()
+    assert table.num_rows == 10
+    assert table.column("a").to_pylist() == list(range(10))
+    assert table.column("b").to_pylist() == [float(i) for i in range(10)]
+    assert table.column("c").null_count == 5
+    assert table.column("c").to_pylist() == [i if i % 2 else None for i in range(10)]
+
+    table = query_to_arrow(
+        memory_abc, "SELECT * FROM abc WHERE a > 100", columns, show_progress=False
+    )
+    assert table.num_rows == 0
+    assert table.column_names == ["a", "b", "c", "d"]
+
+
+def test_pridb_read_hits_arrow():
+    pytest.importorskip("pyarrow")
+    with vae.io.PriDatabase(SAMPLE_PRIDB) as pridb:
+        df = pridb.read_hits()
+        table = pridb.read_hits_arrow()
+        df_arrow = table.to_pandas().set_index("set_id")
+        assert list(df_arrow.columns) == list(df.columns)
+        for column in df.columns:
+            assert_allclose(df_arrow[column].to_numpy(float), df[column].to_numpy(float))
+
+        table = pridb.read_hits_arrow(channel=1, columns=["time", "amplitude"])
+        assert table.column_names == ["time", "amplitude", "set_id"]
+        assert table.num_rows == len(pridb.read_hits(channel=1))
+
+
+def test_pridb_read_status_arrow(tmp_path):
+    pytest.importorskip("pyarrow")
+    with vae.io.PriDatabase(tmp_path / "test.pridb", mode="rwc") as pridb:
+        pridb.connection().execute(
+            "INSERT INTO ae_params (ID, SetupID, Chan, ADC_µV, ADC_TE, ADC_SS) "
+            "VALUES (1, 1, 1, 1, 1, 1)"
+        )
+        pridb.write_status(StatusRecord(time=1, channel=1, param_id=1, energy=1, rms=1))
+        pridb.write_status(
+            StatusRecord(time=2, channel=2, param_id=1, energy=2, rms=2, threshold=10)
+        )
+        df = pridb.read_status()
+        table = pridb.read_status_arrow()
+        assert table.num_rows == len(df) == 2
+        assert table.column("channel").to_pylist() == [1, 2]
+        assert table.column("threshold").null_count == 1
+        assert_allclose(table.column("rms").to_numpy(), df["rms"].to_numpy())
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_tradb_read_arrow(raw):
+    pa = pytest.importorskip("pyarrow")
+    with vae.io.TraDatabase(SAMPLE_TRADB) as tradb:
+        tras = list(tradb.iread(raw=raw))
+        table = tradb.read_arrow(raw=raw)
+        assert table.num_rows == len(tras)
+        assert table.schema.field("data").type == pa.large_list(pa.int16() if raw else pa.float32())
+        for i, tra in enumerate(tras):
+            assert table.column("trai")[i].as_py() == tra.trai
+            assert_array_equal(table.column("data")[i].values.to_numpy(), tra.data)
+        assert table.column("factor_millivolts").to_pylist() == [
+            tra.factor_millivolts for tra in tras
+        ]
+
+        table = tradb.read_arrow(columns=["time", "channel"])
+        assert table.column_names == ["time", "channel"]
+
+        table = tradb.read_arrow(time_start=1000)
+        assert table.num_rows == 0
+
+
+def test_trfdb_read_arrow():
+    pytest.importorskip("pyarrow")
+    with vae.io.TrfDatabase(SAMPLE_TRFDB) as trfdb:
+        df = trfdb.read()
+        table = trfdb.read_arrow()
+        df_arrow = table.to_pandas().set_index("trai")
+        assert list(df_arrow.columns) == list(df.columns)
+        assert_allclose(df_arrow.to_numpy(float), df.to_numpy(float))
+
+        table = trfdb.read_arrow(trai=[1, 2], columns=["FFT_CoG"])
+        assert table.column_names == ["trai", "FFT_CoG"]
+        assert table.column("trai").to_pylist() == [1, 2]
+        assert np.isfinite(table.column("FFT_CoG").to_numpy()).all()
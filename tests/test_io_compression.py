@@ -75,3 +75,18 @@ def test_decode_encode_blob_to_blob(data_format: int, factor_millivolts: float,
     data_blob_2 = encode_data_blob(data_decoded, data_format, factor_millivolts, raw=raw)
 
     assert data_blob == data_blob_2
+
+
+@pytest.mark.parametrize("raw", [False, True])
+@pytest.mark.parametrize("data_format", [0, 2])
+def test_decode_out(data_format: int, raw: bool):
+    data_int16 = np.arange(-100, 100, dtype=np.int16)
+    data_blob = encode_data_blob(data_int16, data_format, 1, raw=True)
+    data_expected = decode_data_blob(data_blob, data_format, 1, raw=raw)
+
+    out = np.zeros(300, dtype=np.int16 if raw else np.float32)
+    data_decoded = decode_data_blob(data_blob, data_format, 1, raw=raw, out=out)
+    assert np.shares_memory(data_decoded, out)
+    assert_array_equal(data_decoded, data_expected)
+    assert_array_equal(out[: len(data_int16)], data_expected)
+    assert np.all(out[len(data_int16) :] == 0)
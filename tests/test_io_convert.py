@@ -0,0 +1,129 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+import vallenae as vae
+from vallenae.convert import main
+
+STEEL_PLATE_DIR = Path(__file__).resolve().parent / "../examples/steel_plate"
+SAMPLE_PRIDB = STEEL_PLATE_DIR / "sample.pridb"
+SAMPLE_TRADB = STEEL_PLATE_DIR / "sample.tradb"
+SAMPLE_TRFDB = STEEL_PLATE_DIR / "sample.trfdb"
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+
+def read_dataset(path, file_format="parquet"):
+    return ds.dataset(path, format=file_format, partitioning="hive").to_table()
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_convert_pridb(tmp_path, file_format):
+    result = vae.io.convert_to_dataset(
+        SAMPLE_PRIDB, tmp_path, file_format=file_format, time_bucket=1, show_progress=False
+    )
+    with vae.io.PriDatabase(SAMPLE_PRIDB) as pridb:
+        hits = pridb.read_hits()
+        assert result.records == {"hits": len(hits), "status": 0}
+        assert result.last_index == pridb._main_index_range()[1]
+
+    table = read_dataset(tmp_path / "hits", file_format).sort_by("set_id")
+    assert table.column("set_id").to_pylist() == list(hits.index)
+    assert table.column("channel").to_pylist() == list(hits["channel"])
+    assert table.column("amplitude").to_pylist() == pytest.approx(list(hits["amplitude"]))
+    assert table.column("time_bucket").to_pylist() == [int(t) for t in hits["time"]]
+    assert (tmp_path / "hits" / "channel=1" / "time_bucket=3").is_dir()
+
+
+def test_convert_tradb(tmp_path):
+    result = vae.io.convert_to_dataset(SAMPLE_TRADB, tmp_path, show_progress=False)
+    with vae.io.TraDatabase(SAMPLE_TRADB) as tradb:
+        tras = list(tradb.iread(raw=True))
+    assert result.records == {"tra": len(tras)}
+    assert result.last_index == tras[-1].trai
+
+    table = read_dataset(tmp_path / "tra").sort_by("trai")
+    assert table.schema.field("data").type == pa.large_list(pa.int16())
+    assert table.column("data").to_pylist() == [tra.data.tolist() for tra in tras]
+
+
+def test_convert_trfdb(tmp_path):
+    result = vae.io.convert_to_dataset(SAMPLE_TRFDB, tmp_path, show_progress=False)
+    with vae.io.TrfDatabase(SAMPLE_TRFDB) as trfdb:
+        df = trfdb.read()
+    assert result.records == {"features": len(df)}
+    table = read_dataset(tmp_path / "features").sort_by("trai")
+    assert table.column("trai").to_pylist() == list(df.index)
+
+
+def test_convert_resume(tmp_path):
+    filename = tmp_path / "growing.pridb"
+    shutil.copy(SAMPLE_PRIDB, filename)
+    output = tmp_path / "output"
+
+    result = vae.io.convert_to_dataset(filename, output, chunk_size=2, show_progress=False)
+    hits = result.records["hits"]
+    assert hits > 0
+
+    # nothing to do
+    result = vae.io.convert_to_dataset(filename, output, chunk_size=2, show_progress=False)
+    assert result.records["hits"] == 0
+
+    with vae.io.PriDatabase(filename, mode="rw") as pridb:
+        hit = next(iter(pridb.iread_hits()))
+        pridb.write_hit(hit._replace(set_id=None, time=200))
+    result = vae.io.convert_to_dataset(filename, output, chunk_size=2, show_progress=False)
+    assert result.records["hits"] == 1
+    assert read_dataset(output / "hits").num_rows == hits + 1
+
+    # other database
+    with pytest.raises(ValueError):
+        vae.io.convert_to_dataset(SAMPLE_PRIDB, output, show_progress=False)
+
+
+def test_convert_empty_column(tmp_path):
+    filename = tmp_path / "nulls.pridb"
+    shutil.copy(SAMPLE_PRIDB, filename)
+    with vae.io.PriDatabase(filename, mode="rw") as pridb:
+        pridb.connection().execute("UPDATE ae_data SET TRAI = NULL WHERE Chan == 1")
+        pridb.connection().commit()
+        hits = pridb.read_hits()
+    output = tmp_path / "output"
+
+    # chunks with channel 1 hits only have no values in column trai
+    vae.io.convert_to_dataset(filename, output, chunk_size=1, show_progress=False)
+    table = read_dataset(output / "hits").sort_by("set_id")
+    assert table.schema.field("trai").type == pa.int64()
+    assert table.column("trai").to_pylist() == [
+        None if channel == 1 else trai
+        for channel, trai in hits[["channel", "trai"]].itertuples(index=False)
+    ]
+    state = json.loads((output / "_vallenae_convert.json").read_text("utf-8"))
+    assert set(state["schemas"]) == {"hits", "status"}
+
+    # schema is kept by resumed conversions
+    with vae.io.PriDatabase(filename, mode="rw") as pridb:
+        hit = next(iter(pridb.iread_hits(channel=1)))
+        pridb.write_hit(hit._replace(set_id=None, time=200, trai=None))
+    result = vae.io.convert_to_dataset(filename, output, chunk_size=1, show_progress=False)
+    assert result.records["hits"] == 1
+    table = read_dataset(output / "hits")
+    assert table.num_rows == len(hits) + 1
+    assert "trai" in table.column_names
+
+
+def test_convert_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        vae.io.convert_to_dataset(tmp_path / "test.db", tmp_path)
+    with pytest.raises(ValueError):
+        vae.io.convert_to_dataset(SAMPLE_PRIDB, tmp_path, file_format="csv")
+    with pytest.raises(ValueError):
+        vae.io.convert_to_dataset(SAMPLE_PRIDB, tmp_path, time_bucket=0)
+
+
+def test_convert_main(tmp_path):
+    assert main([str(SAMPLE_PRIDB), str(SAMPLE_TRFDB), "-o", str(tmp_path), "-q"]) == 0
+    assert read_dataset(tmp_path / "sample_pridb" / "hits").num_rows > 0
+    assert read_dataset(tmp_path / "sample_trfdb" / "features").num_rows > 0
@@ -1,9 +1,10 @@
 import pickle
+import shutil
 import sqlite3
 from pathlib import Path
 
 import pytest
-from vallenae.io import PriDatabase
+from vallenae.io import PriDatabase, TraDatabase
 from vallenae.io._database import Database
 
 STEEL_PLATE_DIR = Path(__file__).resolve().parent / "../examples/steel_plate"
@@ -230,6 +231,48 @@ def test_write_fieldinfo(empty_pridb):
         empty_pridb.write_fieldinfo("NotAColumn", {"Unit": "[Hz]"})
 
 
+def test_ensure_indexes(tmp_path):
+    filename = tmp_path / "sample.tradb"
+    shutil.copy(TRADB_FILE_PATH, filename)
+
+    with TraDatabase(TRADB_FILE_PATH) as tradb, pytest.raises(ValueError):
+        tradb.ensure_indexes()  # read-only
+
+    with TraDatabase(filename, mode="rw") as tradb:
+        assert tradb.indexes() == {"idx_TRAI"}
+        (report,) = tradb.ensure_indexes()
+        assert report.name == "idx_vallenae_Chan_TRAI"
+        assert report.columns == ("Chan", "TRAI")
+        assert report.created
+        assert "idx_vallenae_Chan_TRAI" not in " ".join(report.plan_before)
+        assert "idx_vallenae_Chan_TRAI" in " ".join(report.plan_after)
+        assert tradb.indexes() == {"idx_TRAI", "idx_vallenae_Chan_TRAI"}
+
+        # used by reads
+        query = tradb._query(channel=1)
+        assert "idx_vallenae_Chan_TRAI" in " ".join(tradb._query_plan(query))
+
+        (report,) = tradb.ensure_indexes([("Chan", "TRAI")])
+        assert not report.created
+        assert report.plan_before == report.plan_after
+
+        with pytest.raises(ValueError):
+            tradb.ensure_indexes([("NotAColumn",)])
+        with pytest.raises(ValueError):
+            tradb.ensure_indexes([()])
+
+        assert tradb.drop_indexes() == ["idx_vallenae_Chan_TRAI"]
+        assert tradb.indexes() == {"idx_TRAI"}
+        assert tradb.drop_indexes() == []
+
+
+def test_ensure_indexes_pridb(empty_pridb):
+    (report,) = empty_pridb.ensure_indexes([("Chan",)])
+    assert report.name == "idx_vallenae_Chan"
+    assert report.created
+    assert "idx_vallenae_Chan" in " ".join(report.plan_after)
+
+
 def test_pickle(sample_pridb):
     pkl = pickle.dumps(sample_pridb)
     pridb_unpickled = pickle.loads(pkl)
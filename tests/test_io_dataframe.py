@@ -1,6 +1,23 @@
+import sqlite3
+
+import numpy as np
 import pandas as pd
+import pytest
 from numpy import dtype
-from vallenae.io._dataframe import _convert_to_nullable_types
+from vallenae.io._dataframe import ColumnSpec, _convert_to_nullable_types, query_to_dataframe
+
+
+@pytest.fixture(name="memory_abc")
+def fixture_memory_abc():
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE abc (id INTEGER PRIMARY KEY, a INT, b REAL, c INT, d REAL)")
+    for i in range(10):
+        con.execute(
+            "INSERT INTO abc (id, a, b, c) VALUES (?, ?, ?, ?)",
+            (i, i, i * 1e6, i if i % 2 else None),
+        )
+    yield con
+    con.close()
 
 
 def test_convert_to_nullable_types():
@@ -30,3 +47,48 @@ def test_convert_to_nullable_types():
         dtype("float64"),
         dtype("bool"),
     ]
+
+
+@pytest.mark.parametrize("arraysize", [1, 3, 100])
+def test_query_to_dataframe(memory_abc, arraysize):
+    columns = (
+        ColumnSpec("a", "a", integer=True),
+        ColumnSpec("b", "b", divisor=1e6),
+        ColumnSpec("c", "c", integer=True),
+        ColumnSpec("d", "d"),
+        ColumnSpec("missing", "missing"),
+        ColumnSpec("id", "id", integer=True),
+    )
+    df = query_to_dataframe(
+        memory_abc,
+        "SELECT * FROM abc",
+        columns,
+        show_progress=False,
+        index_column="id",
+        arraysize=arraysize,
+    )
+
+    assert len(df) == 10
+    assert df.index.name == "id"
+    assert list(df.index) == list(range(10))
+    # empty columns "d" and "missing" are dropped
+    assert dict(df.dtypes) == {
+        "a": pd.Int64Dtype(),
+        "b": dtype("float64"),
+        "c": dtype("float64"),  # integers with missing values
+    }
+    assert list(df["a"]) == list(range(10))
+    assert list(df["b"]) == [float(i) for i in range(10)]
+    assert np.isnan(df["c"][0])
+    assert df["c"][1] == 1
+
+
+def test_query_to_dataframe_empty(memory_abc):
+    df = query_to_dataframe(
+        memory_abc,
+        "SELECT * FROM abc WHERE a < 0",
+        (ColumnSpec("a", "a", integer=True),),
+        show_progress=False,
+    )
+    assert df.empty
+    assert list(df.columns) == []
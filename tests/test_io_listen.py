@@ -0,0 +1,181 @@
+from itertools import islice
+from pathlib import Path
+from threading import Thread
+from time import sleep
+
+import numpy as np
+import pytest
+import vallenae as vae
+from vallenae.io import FeatureRecord, HitRecord, JoinedRecord, TraRecord
+from vallenae.io._listen import _Source
+
+STEEL_PLATE_DIR = Path(__file__).resolve().parent / "../examples/steel_plate"
+SAMPLE_PRIDB = STEEL_PLATE_DIR / "sample.pridb"
+SAMPLE_TRADB = STEEL_PLATE_DIR / "sample.tradb"
+SAMPLE_TRFDB = STEEL_PLATE_DIR / "sample.trfdb"
+
+
+@pytest.fixture(name="fresh_databases")
+def fixture_fresh_databases(tmp_path):
+    pridb = vae.io.PriDatabase(tmp_path / "test.pridb", mode="rwc")
+    tradb = vae.io.TraDatabase(tmp_path / "test.tradb", mode="rwc")
+    trfdb = vae.io.TrfDatabase(tmp_path / "test.trfdb", mode="rwc")
+    with pridb.connection() as con:
+        con.execute(
+            """
+            INSERT INTO ae_params (ID, SetupID, Chan, ADC_µV, ADC_TE, ADC_SS)
+            VALUES (1, 1, 1, 1, 1, 1)
+            """
+        )
+    with tradb.connection() as con:
+        con.execute(
+            """
+            INSERT INTO tr_params (ID, SetupID, Chan, ADC_µV, TR_mV)
+            VALUES (1, 1, 1, 1, 1)
+            """
+        )
+    yield pridb, tradb, trfdb
+    pridb.close()
+    tradb.close()
+    trfdb.close()
+
+
+def generate_hit(time: float, trai: int):
+    return HitRecord(
+        time=time,
+        channel=1,
+        param_id=1,
+        amplitude=1,
+        duration=1,
+        energy=1,
+        rms=1,
+        trai=trai,
+    )
+
+
+def generate_tra(time: float, trai: int):
+    return TraRecord(
+        time=time,
+        channel=1,
+        param_id=1,
+        pretrigger=0,
+        threshold=1,
+        samplerate=1000,
+        samples=10,
+        data=np.zeros(10, dtype=np.float32),
+        trai=trai,
+    )
+
+
+def test_listen_joined_sample():
+    pridb = vae.io.PriDatabase(SAMPLE_PRIDB)
+    tradb = vae.io.TraDatabase(SAMPLE_TRADB)
+    trfdb = vae.io.TrfDatabase(SAMPLE_TRFDB)
+
+    assert list(vae.io.listen_joined(pridb, tradb, trfdb)) == []
+
+    records = list(vae.io.listen_joined(pridb, tradb, trfdb, existing=True))
+    records = sorted(records, key=lambda record: record.hit.set_id)  # ordered by completion
+    assert [record.hit for record in records] == list(pridb.iread_hits())
+    for record in records:
+        assert isinstance(record, JoinedRecord)
+        assert record.tra.trai == record.hit.trai
+        assert record.features.trai == record.hit.trai
+
+
+def test_listen_joined_invalid_arguments():
+    with vae.io.PriDatabase(SAMPLE_PRIDB) as pridb:
+        with pytest.raises(ValueError):
+            next(vae.io.listen_joined(pridb))
+        with vae.io.TraDatabase(SAMPLE_TRADB) as tradb:
+            with pytest.raises(ValueError):
+                next(vae.io.listen_joined(pridb, tradb, timeout=-1))
+            with pytest.raises(ValueError):
+                next(vae.io.listen_joined(pridb, tradb, min_interval=0))
+
+
+def test_listen_joined_missing_parts(fresh_databases):
+    pridb, tradb, trfdb = fresh_databases
+    pridb.write_hits([generate_hit(1, 1), generate_hit(2, 0), generate_hit(3, 3)])
+    tradb.write_many([generate_tra(1, 1), generate_tra(3, 3), generate_tra(4, 4)])
+    trfdb.write_many([FeatureRecord(trai=1, features={"A": 1})])
+
+    records = list(vae.io.listen_joined(pridb, tradb, trfdb, existing=True))
+    assert [record.hit.time for record in records] == [2, 1, 3]  # hit without TRAI first
+    assert records[0].tra is None
+    assert records[0].features is None
+    assert records[1].tra.trai == 1
+    assert records[1].features.features == {"A": 1}
+    assert records[2].tra.trai == 3
+    assert records[2].features is None  # missing, transient data of TRAI 4 is discarded
+
+    records = list(vae.io.listen_joined(pridb, tradb, existing=True))
+    assert [record.hit.time for record in records] == [2, 1, 3]
+    assert all(record.features is None for record in records)
+
+
+def test_listen_joined_bounded(fresh_databases, monkeypatch):
+    pridb, tradb, trfdb = fresh_databases
+    count = 200
+    pridb.write_hits([generate_hit(trai, trai) for trai in range(1, count + 1)])
+    tradb.write_many([generate_tra(trai, trai) for trai in range(1, count + 1)])
+    trfdb.write_many(
+        [FeatureRecord(trai=trai, features={"A": trai}) for trai in range(1, count + 1)]
+    )
+
+    batch_sizes = []
+    fetch = _Source.fetch
+
+    def fetch_spy(self):
+        records, more = fetch(self)
+        batch_sizes.append(len(records))
+        return records, more
+
+    monkeypatch.setattr(_Source, "fetch", fetch_spy)
+
+    # read batch by batch, interleaved by TRAI
+    listener = vae.io.listen_joined(pridb, tradb, trfdb, existing=True, max_pending=10)
+    first = next(listener)
+    assert first.hit.trai == 1
+    assert sum(batch_sizes) <= 30
+
+    records = [first, *listener]
+    assert [record.hit.trai for record in records] == list(range(1, count + 1))
+    assert all(record.tra is not None and record.features is not None for record in records)
+    assert max(batch_sizes) == 10
+
+
+def test_listen_joined_wait(fresh_databases):
+    pridb, tradb, trfdb = fresh_databases
+
+    def write_delayed():
+        for trai in range(1, 6):
+            sleep(0.01)
+            tradb.write(generate_tra(trai, trai))
+            trfdb.write(FeatureRecord(trai=trai, features={"A": trai}))
+            pridb.write_hit(generate_hit(trai, trai))
+
+    def listen():
+        records.extend(islice(listener, 5))
+
+    # listen with read-only connections in separate thread
+    listener = vae.io.listen_joined(
+        vae.io.PriDatabase(pridb.filename),
+        vae.io.TraDatabase(tradb.filename),
+        vae.io.TrfDatabase(trfdb.filename),
+        existing=True,
+        wait=True,
+        timeout=0.05,
+        min_interval=0.001,
+        max_interval=0.01,
+    )
+    records = []
+    thread = Thread(target=listen, daemon=True)
+    thread.start()
+    write_delayed()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+    assert [record.hit.trai for record in records] == [1, 2, 3, 4, 5]
+    assert [record.tra.trai for record in records] == [1, 2, 3, 4, 5]
+    assert [record.features.features["A"] for record in records] == [1, 2, 3, 4, 5]
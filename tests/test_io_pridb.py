@@ -1,10 +1,17 @@
+import asyncio
+import subprocess
+import sys
 from pathlib import Path
+from threading import Thread
+from time import sleep
 
 import pytest
 import vallenae as vae
 from numpy import dtype, float64, int64
 from pandas import Int64Dtype
+from pandas.testing import assert_frame_equal
 from vallenae.io import HitRecord, MarkerRecord, ParametricRecord, SetType, StatusRecord
+from vallenae.io._dataframe import iter_to_dataframe
 
 STEEL_PLATE_DIR = Path(__file__).resolve().parent / "../examples/steel_plate"
 PRIDB_FILE_PATH = STEEL_PLATE_DIR / "sample.pridb"
@@ -114,6 +121,18 @@ PARAMETRIC_EXPECTED = [
 ]
 
 
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(async_iterable):
+    return [item async for item in async_iterable]
+
+
 @pytest.fixture(name="sample_pridb")
 def fixture_sample_pridb() -> vae.io.PriDatabase:
     pridb = vae.io.PriDatabase(PRIDB_FILE_PATH)
@@ -219,6 +238,40 @@ def test_iread_hits(sample_pridb):
         assert hit.cascade_signal_strength == pytest.approx(hit_expected.cascade_signal_strength)
 
 
+def test_hit_record_from_sql():
+    row = {
+        "SetID": 1,
+        "Time": 2.5,
+        "Chan": 3,
+        "Status": 4,
+        "ParamID": 5,
+        "Amp": 1000,
+        "Dur": 200,
+        "Eny": 1.5,
+        "RMS": 10,
+        "TRAI": 6,
+    }
+    hit = HitRecord.from_sql(row)
+    assert hit == HitRecord(
+        set_id=1,
+        time=2.5,
+        channel=3,
+        status=4,
+        param_id=5,
+        amplitude=1e-3,
+        duration=2e-4,
+        energy=1.5,
+        rms=1e-5,
+        trai=6,
+    )
+    columns = {name: index for index, name in enumerate(row)}
+    assert HitRecord.sql_row_factory(columns)(tuple(row.values())) == hit
+
+    del row["Amp"]
+    with pytest.raises(KeyError):
+        HitRecord.from_sql(row)
+
+
 def test_iread_hits_query_filter(sample_pridb):
     hits = list(sample_pridb.iread_hits(query_filter="SetID >= 12"))
     assert len(hits) == 2
@@ -251,6 +304,107 @@ def test_read_hits(sample_pridb):
     }
 
 
+def test_read_hits_equals_iread_hits(sample_pridb):
+    df_expected = iter_to_dataframe(sample_pridb.iread_hits(), index_column="set_id")
+    assert_frame_equal(sample_pridb.read_hits(), df_expected)
+    assert_frame_equal(
+        sample_pridb.read_hits(channel=[1, 3]),
+        iter_to_dataframe(sample_pridb.iread_hits(channel=[1, 3]), index_column="set_id"),
+    )
+
+
+def test_iread_hits_columns(sample_pridb):
+    hits = list(sample_pridb.iread_hits(columns=["time", "channel", "amplitude"]))
+    hits_all = list(sample_pridb.iread_hits())
+    assert len(hits) == len(hits_all)
+    for i, hit in enumerate(hits):
+        hit_all = hits_all[i]
+        assert hit.set_id == hit_all.set_id
+        assert hit.time == hit_all.time
+        assert hit.channel == hit_all.channel
+        assert hit.amplitude == hit_all.amplitude
+        assert hit.duration is None
+        assert hit.energy is None
+        assert hit.trai is None
+
+    with pytest.raises(ValueError):
+        sample_pridb.iread_hits(columns=["time", "invalid"])
+
+
+def test_read_hits_columns(sample_pridb):
+    df = sample_pridb.read_hits(columns=["time", "channel", "amplitude"])
+    assert df.index.name == "set_id"
+    assert list(df.columns) == ["time", "channel", "amplitude"]
+    assert_frame_equal(df, sample_pridb.read_hits()[["time", "channel", "amplitude"]])
+
+
+def test_read_status_columns(fresh_pridb):
+    fresh_pridb.write_status(StatusRecord(time=1, channel=1, param_id=1, energy=1, rms=1))
+    df = fresh_pridb.read_status(columns=["time", "channel"])
+    assert df.index.name == "set_id"
+    assert list(df.columns) == ["time", "channel"]
+    assert_frame_equal(df, fresh_pridb.read_status()[["time", "channel"]])
+
+
+@pytest.mark.parametrize(
+    ("time_start", "time_stop"),
+    [
+        (None, None),
+        (3.9927747, None),
+        (None, 3.9928129),
+        (3.99, 3.9928143),
+        (3.9928143, 3.9928143),
+        (0, 1),
+        (10, None),
+        (None, -1),
+    ],
+)
+def test_iread_time_range(sample_pridb, time_start, time_stop):
+    def in_range(record):
+        if time_start is not None and record.time < time_start:
+            return False
+        return not (time_stop is not None and record.time >= time_stop)
+
+    for iread in (
+        sample_pridb.iread_hits,
+        sample_pridb.iread_markers,
+        sample_pridb.iread_parametric,
+        sample_pridb.iread_status,
+    ):
+        expected = [record for record in iread() if in_range(record)]
+        assert list(iread(time_start=time_start, time_stop=time_stop)) == expected
+
+
+def test_iread_time_range_same_timestamps(fresh_pridb):
+    times = [0.0, 1.0, 1.0, 1.0, 2.0, 2.0, 3.0]
+    for channel, time in enumerate(times, start=1):
+        fresh_pridb.write_status(
+            StatusRecord(time=time, channel=channel, param_id=1, energy=1, rms=1)
+        )
+
+    def channels(**kwargs):
+        return [status.channel for status in fresh_pridb.iread_status(**kwargs)]
+
+    assert channels(time_start=1.0) == [2, 3, 4, 5, 6, 7]
+    assert channels(time_start=1.5, time_stop=3.0) == [5, 6]
+    assert channels(time_stop=2.0) == [1, 2, 3, 4]
+    assert channels(time_start=2.0, time_stop=2.0) == []
+    assert channels(time_start=4.0) == []
+
+
+def test_read_empty_time_range(fresh_pridb):
+    assert list(fresh_pridb.iread_hits(time_start=1, time_stop=2)) == []
+
+
+def test_read_status_equals_iread_status(fresh_pridb):
+    for time in range(10):
+        fresh_pridb.write_status(
+            StatusRecord(time=time, channel=1, param_id=1, energy=1, rms=1, threshold=1)
+        )
+    df_expected = iter_to_dataframe(fresh_pridb.iread_status(), index_column="set_id")
+    assert_frame_equal(fresh_pridb.read_status(), df_expected)
+
+
 def test_iread_parametric(sample_pridb):
     records = list(sample_pridb.iread_parametric())
     assert len(records) == len(PARAMETRIC_EXPECTED)
@@ -341,6 +495,82 @@ def test_write_readonly(sample_pridb):
         )
 
 
+def test_listen_wait(fresh_pridb):
+    def generate_hit(time: float):
+        return HitRecord(time=time, channel=1, param_id=1, amplitude=1, duration=1, energy=1, rms=1)
+
+    def write_delayed():
+        for i in range(5):
+            sleep(0.01)
+            writer.write(generate_hit(i))
+
+    fresh_pridb.connection().commit()
+    with vae.io.PriDatabase(fresh_pridb.filename) as pridb_listen:
+        listener = pridb_listen.listen(wait=True, min_interval=0.001, max_interval=0.01)
+        with fresh_pridb.background_writer(flush_interval=0) as writer:
+            thread = Thread(target=write_delayed)
+            thread.start()
+            records = [next(listener) for _ in range(5)]
+            thread.join()
+    assert [record.time for record in records] == [0, 1, 2, 3, 4]
+
+
+def test_alisten(sample_pridb):
+    assert run_async(collect(sample_pridb.alisten())) == []
+    assert run_async(collect(sample_pridb.alisten(existing=True))) == list(
+        sample_pridb.listen(existing=True)
+    )
+
+
+def test_alisten_wait(fresh_pridb):
+    def generate_hit(time: float):
+        return HitRecord(time=time, channel=1, param_id=1, amplitude=1, duration=1, energy=1, rms=1)
+
+    async def listen_and_write():
+        records = []
+
+        async def listen():
+            async for record in pridb_listen.alisten(wait=True, min_interval=0.001):
+                records.append(record)
+                if len(records) == 5:
+                    break
+
+        async def write():
+            for i in range(5):
+                await asyncio.sleep(0.01)
+                fresh_pridb.write_hit(generate_hit(i))
+
+        await asyncio.wait_for(asyncio.gather(listen(), write()), timeout=10)
+        return records
+
+    fresh_pridb.connection().commit()
+    with vae.io.PriDatabase(fresh_pridb.filename) as pridb_listen:
+        records = run_async(listen_and_write())
+    assert [record.time for record in records] == [0, 1, 2, 3, 4]
+
+
+def test_airead(sample_pridb):
+    assert run_async(collect(sample_pridb.airead_hits(batch_size=3))) == list(
+        sample_pridb.iread_hits()
+    )
+    assert run_async(collect(sample_pridb.airead_markers(batch_size=3))) == list(
+        sample_pridb.iread_markers()
+    )
+    assert run_async(collect(sample_pridb.airead_parametric())) == list(
+        sample_pridb.iread_parametric()
+    )
+    assert run_async(collect(sample_pridb.airead_status(channel=1))) == list(
+        sample_pridb.iread_status(channel=1)
+    )
+
+
+def test_listen_invalid_interval(sample_pridb):
+    with pytest.raises(ValueError):
+        next(sample_pridb.listen(min_interval=0))
+    with pytest.raises(ValueError):
+        next(sample_pridb.listen(min_interval=0.1, max_interval=0.01))
+
+
 def test_write_hit(fresh_pridb):
     new_hit = HitRecord(
         time=5,
@@ -379,6 +609,165 @@ def test_write_hit(fresh_pridb):
     assert hit_read.cascade_signal_strength == new_hit.cascade_signal_strength
 
 
+def test_write_hits(fresh_pridb):
+    hits = [
+        HitRecord(
+            time=time,
+            channel=1,
+            param_id=1,
+            threshold=111,
+            amplitude=22222,
+            duration=11111,
+            energy=12345678,
+            rms=5,
+            counts=1987 if time % 2 else None,
+        )
+        for time in (1, 2, 2, 3)
+    ]
+
+    assert fresh_pridb.write_hits(hits) == 4
+    assert fresh_pridb.rows() == 4
+    assert fresh_pridb.globalinfo()["ValidSets"] == 4
+
+    hits_read = list(fresh_pridb.iread_hits())
+    assert [hit.set_id for hit in hits_read] == [1, 2, 3, 4]
+    for i, hit_read in enumerate(hits_read):
+        hit = hits[i]
+        assert hit_read.time == hit.time
+        assert hit_read.amplitude == hit.amplitude
+        assert hit_read.counts == hit.counts
+
+    # write dataframe
+    df = fresh_pridb.read_hits()
+    df["time"] += 10
+    assert fresh_pridb.write_hits(df) == 4
+    assert fresh_pridb.rows() == 8
+    assert_frame_equal(
+        fresh_pridb.read_hits(set_id=[5, 6, 7, 8]).reset_index(drop=True),
+        df.reset_index(drop=True),
+    )
+
+    assert fresh_pridb.write_hits([]) == 0
+
+
+def test_write_hits_monotonic_time(fresh_pridb):
+    def generate_hit(time: float):
+        return HitRecord(time=time, channel=1, param_id=1, amplitude=1, duration=1, energy=1, rms=1)
+
+    fresh_pridb.write_hit(generate_hit(1.0))
+    with pytest.raises(ValueError):
+        fresh_pridb.write_hits([generate_hit(0.5), generate_hit(2.0)])
+    with pytest.raises(ValueError):
+        fresh_pridb.write_hits([generate_hit(2.0), generate_hit(1.5)])
+    assert fresh_pridb.rows() == 1  # all or nothing
+
+    fresh_pridb.write_hits([generate_hit(1.0), generate_hit(2.0)])
+    assert fresh_pridb.rows() == 3
+
+
+def test_background_writer(fresh_pridb):
+    hits = [
+        HitRecord(time=i, channel=1, param_id=1, amplitude=1, duration=1, energy=1, rms=1)
+        for i in range(100)
+    ]
+    marker = MarkerRecord(time=100, set_type=SetType.LABEL, data="label", number=1)
+
+    with fresh_pridb.background_writer(batch_size=30, queue_size=10) as writer:
+        for hit in hits[:50]:
+            writer.write(hit)
+        writer.flush()
+        assert writer.pending == 0
+        assert writer.written == 50
+        assert fresh_pridb.rows() == 50
+
+        for hit in hits[50:]:
+            writer.write(hit)
+        writer.write(marker)
+
+    assert writer.written == 101
+    assert fresh_pridb.rows() == 101
+    assert [hit.time for hit in fresh_pridb.iread_hits()] == list(range(100))
+    assert fresh_pridb.read_markers()["data"].tolist() == ["label"]
+
+    with pytest.raises(RuntimeError):
+        writer.write(hits[0])  # closed
+
+
+def test_background_writer_not_closed(fresh_pridb):
+    filename = fresh_pridb.filename
+    fresh_pridb.close()
+    script = f"""
+import vallenae as vae
+from vallenae.io import HitRecord
+
+pridb = vae.io.PriDatabase({filename!r}, mode="rw")
+writer = pridb.background_writer(flush_interval=10)
+for i in range(100):
+    writer.write(
+        HitRecord(time=i, channel=1, param_id=1, amplitude=1, duration=1, energy=1, rms=1)
+    )
+"""
+    # queued records are written at interpreter exit
+    subprocess.run([sys.executable, "-c", script], check=True)
+    with vae.io.PriDatabase(filename) as pridb:
+        assert pridb.rows() == 100
+
+
+def test_background_writer_error(fresh_pridb):
+    def generate_hit(time: float):
+        return HitRecord(time=time, channel=1, param_id=1, amplitude=1, duration=1, energy=1, rms=1)
+
+    writer = fresh_pridb.background_writer()
+    writer.write(generate_hit(1))
+    writer.write(generate_hit(0))  # not monotonic
+    with pytest.raises(RuntimeError) as e:
+        writer.flush()
+    assert isinstance(e.value.__cause__, ValueError)
+    with pytest.raises(RuntimeError):
+        writer.write(generate_hit(2))
+    with pytest.raises(RuntimeError):
+        writer.close()
+    assert fresh_pridb.rows() == 0
+
+
+def test_write_batch(fresh_pridb):
+    def generate_hit(time: float):
+        return HitRecord(time=time, channel=1, param_id=1, amplitude=1, duration=1, energy=1, rms=1)
+
+    def generate_marker(time: float, data: str):
+        return MarkerRecord(time=time, set_type=SetType.LABEL, number=1, data=data)
+
+    status = StatusRecord(time=3, channel=1, param_id=1, threshold=100, energy=1, rms=1)
+    parametric = ParametricRecord(time=4, param_id=1, pctd=11, pcta=22)
+    records = [
+        generate_hit(1),
+        generate_marker(2, "a"),
+        generate_marker(2, "b"),
+        status,
+        parametric,
+        generate_hit(5),
+        generate_marker(6, "c"),
+    ]
+
+    with pytest.raises(ValueError):
+        fresh_pridb._write_batch([*records, generate_hit(0)])  # not monotonic
+    assert fresh_pridb.rows() == 0  # all or nothing
+
+    fresh_pridb._write_batch(records)
+    assert fresh_pridb.rows() == 7
+    markers = fresh_pridb.read_markers()
+    assert markers.index.tolist() == [2, 3, 7]
+    assert markers["data"].tolist() == ["a", "b", "c"]
+    assert fresh_pridb.read_hits().index.tolist() == [1, 6]
+    assert next(iter(fresh_pridb.iread_status())).set_id == 4
+    assert next(iter(fresh_pridb.iread_parametric())).pctd == 11
+
+
+def test_background_writer_readonly(sample_pridb):
+    with pytest.raises(ValueError):
+        sample_pridb.background_writer()
+
+
 def test_write_marker(fresh_pridb):
     new_marker = MarkerRecord(
         time=11.11,
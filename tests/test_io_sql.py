@@ -1,19 +1,27 @@
+import asyncio
 import pickle
 import sqlite3
 from math import sin
+from time import sleep
 
 import pytest
 from vallenae.io._sql import (
+    ChangeDetector,
     ConnectionWrapper,
     QueryIterable,
+    aiter_threaded,
     count_sql_results,
     create_uri,
     generate_insert_query,
     generate_update_query,
     insert_from_dict,
+    insert_many_from_dicts,
+    map_threaded,
     query_conditions,
     read_sql_generator,
+    read_sql_rows,
     sql_binary_search,
+    sql_row_getter,
     update_from_dict,
 )
 
@@ -59,6 +67,26 @@ def get_row_by_id(connection, table, row_id):
     return dict(zip(columns, values))
 
 
+def test_change_detector(temp_database):
+    con_reader = sqlite3.connect(temp_database)
+    con_writer = sqlite3.connect(temp_database)
+    detector = ChangeDetector(con_reader, temp_database)
+    assert not detector.changed()
+    assert not detector.wait(0.001, 0.01, timeout=0.05)
+
+    with con_writer:
+        con_writer.execute("INSERT INTO abc (a, b, c) VALUES (0, 0, 0)")
+    assert detector.changed()
+    assert not detector.changed()
+
+    with con_writer:
+        con_writer.execute("INSERT INTO abc (a, b, c) VALUES (0, 0, 0)")
+    assert detector.wait(0.001, 0.01, timeout=1)
+
+    con_reader.close()
+    con_writer.close()
+
+
 def test_create_uri():
     assert create_uri("test.pridb", mode="ro") == "file:test.pridb?mode=ro"
     assert create_uri("test.pridb", mode="rw") == "file:test.pridb?mode=rw"
@@ -182,6 +210,29 @@ def test_read_sql_generator_parameter(memory_abc):
     assert len(records) == 5
 
 
+@pytest.mark.parametrize("arraysize", [1, 3, 1000])
+def test_read_sql_rows(memory_abc, arraysize):
+    columns, rows = read_sql_rows(memory_abc, "SELECT * FROM abc", arraysize=arraysize)
+    assert columns == {"a": 0, "b": 1, "c": 2}
+    assert list(rows) == [(i, 10 + i, 20 + i) for i in range(10)]
+
+    columns, rows = read_sql_rows(memory_abc, "SELECT c, a FROM abc WHERE a >= ?", 5)
+    assert columns == {"c": 0, "a": 1}
+    assert len(list(rows)) == 5
+
+
+def test_sql_row_getter():
+    columns = {"a": 0, "b": 1, "c": 2}
+    row = (1, 2, 3)
+    assert sql_row_getter(columns, ())(row) == ()
+    assert sql_row_getter(columns, ("b",))(row) == (2,)
+    assert sql_row_getter(columns, ("c", "a"))(row) == (3, 1)
+    assert sql_row_getter(columns, ("x",), optional=("x",))(row) == (None,)
+    assert sql_row_getter(columns, ("c", "x", "a"), optional=("x",))(row) == (3, None, 1)
+    with pytest.raises(KeyError):
+        sql_row_getter(columns, ("a", "x"))
+
+
 def test_sql_binary_search():
     con = sqlite3.connect(":memory:")
     con.execute("CREATE TABLE squares (id INTEGER PRIMARY KEY, value REAL)")
@@ -233,6 +284,37 @@ def test_sql_binary_search():
     con.close()
 
 
+def test_sql_binary_search_same_values():
+    con = sqlite3.connect(":memory:")
+    con.execute("CREATE TABLE clusters (id INTEGER PRIMARY KEY, value INT)")
+    # clusters of 100 same values
+    con.executemany(
+        "INSERT INTO clusters (id, value) VALUES (?, ?)",
+        ((i, i // 100) for i in range(1000)),
+    )
+
+    queries = []
+    con.set_trace_callback(queries.append)
+
+    def search(fun_compare, lower_bound):
+        queries.clear()
+        result = sql_binary_search(
+            con, "clusters", "value", "id", fun_compare, lower_bound=lower_bound
+        )
+        # no linear search: number of queries independent of the cluster size
+        assert len(queries) < 50
+        return result
+
+    assert search(lambda x: x >= 3, lower_bound=True) == 300
+    assert search(lambda x: x < 3, lower_bound=False) == 299
+    # bound of same values from the found boundary
+    assert search(lambda x: x >= 3, lower_bound=False) == 399
+    assert search(lambda x: x < 3, lower_bound=True) == 200
+    assert search(lambda x: x > 9, lower_bound=True) is None
+
+    con.close()
+
+
 def test_query_iterable(temp_database):
     # simple conversion function dict to tuple
     def dict_to_type_func(row_dict):
@@ -248,6 +330,65 @@ def test_query_iterable(temp_database):
         assert row == (index, 10 + index, 20 + index)
 
 
+@pytest.mark.parametrize("workers", [1, 2, 8])
+@pytest.mark.parametrize("prefetch", [None, 1, 100])
+@pytest.mark.parametrize("batch_size", [1, 3, 100])
+def test_map_threaded(workers, prefetch, batch_size):
+    def square_slow(x):
+        sleep(0.001 * (x % 3))  # random order of completion
+        return x**2
+
+    result = list(
+        map_threaded(
+            square_slow, range(20), workers=workers, prefetch=prefetch, batch_size=batch_size
+        )
+    )
+    assert result == [x**2 for x in range(20)]
+
+    with pytest.raises(ValueError):
+        list(map_threaded(square_slow, range(20), workers=workers, batch_size=0))
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 10, 100])
+def test_aiter_threaded(batch_size):
+    async def collect():
+        return [item async for item in aiter_threaded(range(10), batch_size)]
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(collect()) == list(range(10))
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_query_iterable_row_factory(temp_database, workers):
+    def row_factory(columns):
+        index_a, index_c = columns["a"], columns["c"]
+        return lambda row: (row[index_a], row[index_c])
+
+    iterable = QueryIterable(
+        ConnectionWrapper(temp_database),
+        "SELECT * FROM abc",
+        row_factory=row_factory,
+        workers=workers,
+    )
+    assert list(iterable) == [(i, 20 + i) for i in range(10)]
+
+    with pytest.raises(ValueError):
+        QueryIterable(ConnectionWrapper(temp_database), "SELECT * FROM abc")
+
+
+def test_query_iterable_workers(temp_database):
+    iterable = QueryIterable(
+        ConnectionWrapper(temp_database),
+        "SELECT * FROM abc",
+        lambda row: row["a"],
+        workers=4,
+    )
+    assert list(iterable) == list(range(10))
+
+
 def test_generate_insert_query():
     assert generate_insert_query("abc", ("a")) == "INSERT INTO abc (a) VALUES (:a)"
     assert (
@@ -272,6 +413,17 @@ def test_insert_from_dict(memory_id_abc):
         insert_from_dict(memory_id_abc, "abc", {"not_existing_column": 111})
 
 
+def test_insert_many_from_dicts(memory_id_abc):
+    rows = ({"id": i, "a": i, "b": 2 * i, "c": None} for i in range(1, 4))
+    assert insert_many_from_dicts(memory_id_abc, "abc", rows) == 3
+    assert get_row_by_id(memory_id_abc, "abc", 3) == {"id": 3, "a": 3, "b": 6, "c": None}
+
+    assert insert_many_from_dicts(memory_id_abc, "abc", []) == 0
+
+    with pytest.raises(sqlite3.OperationalError):
+        insert_many_from_dicts(memory_id_abc, "abc", [{"not_existing_column": 111}])
+
+
 def test_generate_update_query():
     assert generate_update_query("abc", ("a", "b"), "a") == "UPDATE abc SET b = :b WHERE a == :a"
     assert (
@@ -0,0 +1,171 @@
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+import vallenae as vae
+from vallenae.io import StatusRecord, TimeIndex
+from vallenae.io._sql import sql_binary_search
+
+STEEL_PLATE_DIR = Path(__file__).resolve().parent / "../examples/steel_plate"
+SAMPLE_PRIDB = STEEL_PLATE_DIR / "sample.pridb"
+SAMPLE_TRADB = STEEL_PLATE_DIR / "sample.tradb"
+SAMPLE_TRFDB = STEEL_PLATE_DIR / "sample.trfdb"
+
+TIMES = [0, 1, 1, 1, 2, 2, 3, 5, 5, 5, 5, 8]
+
+
+@pytest.fixture(name="database")
+def fixture_database(tmp_path):
+    filename = tmp_path / "test.db"
+    con = sqlite3.connect(filename)
+    con.execute("CREATE TABLE data (SetID INTEGER PRIMARY KEY, Time INT, Chan INT)")
+    con.executemany(
+        "INSERT INTO data (SetID, Time, Chan) VALUES (?, ?, ?)",
+        [(i, time, i % 4) for i, time in enumerate(TIMES, start=1)],
+    )
+    con.commit()
+    yield con, filename
+    con.close()
+
+
+@pytest.mark.parametrize("step", [1, 2, 3, 100])
+def test_find(database, step):
+    con, _ = database
+    index = TimeIndex.build(con, "data", "SetID", step=step)
+    assert len(index) == (len(TIMES) - 1) // step + 1
+
+    for value in [-1, 0, 0.5, 1, 2, 4, 5, 6, 8, 9]:
+        for lower_bound in (True, False):
+            expected = sql_binary_search(
+                con,
+                "data",
+                "Time",
+                "SetID",
+                (lambda t, v=value: t >= v) if lower_bound else (lambda t, v=value: t < v),
+                lower_bound=lower_bound,
+            )
+            find = index.find_first if lower_bound else index.find_last
+            assert find(con, value) == expected
+
+
+def test_update(database):
+    con, _ = database
+    index = TimeIndex.build(con, "data", "SetID", step=5)
+    assert len(index) == 3
+    assert not index.update(con)
+
+    # appended records are found before update
+    con.execute("INSERT INTO data (SetID, Time, Chan) VALUES (13, 10, 1)")
+    con.commit()
+    assert index.find_first(con, 9) == 13
+
+    assert not index.update(con)  # no new checkpoint
+    assert len(index) == 3
+
+    con.executemany(
+        "INSERT INTO data (SetID, Time, Chan) VALUES (?, 11, 1)", [(14,), (15,), (16,)]
+    )
+    con.commit()
+    assert not index.update(con, valid_sets=15)  # records after valid sets are ignored
+    assert index.update(con, valid_sets=16)
+    assert len(index) == 4
+
+    # removed records -> rebuild
+    con.execute("DELETE FROM data WHERE SetID > 12")
+    con.commit()
+    assert index.update(con)
+    assert len(index) == 3
+    assert index.find_first(con, 9) is None
+
+    con.execute("INSERT INTO data (SetID, Time, Chan) VALUES (13, 0, 1)")
+    con.commit()
+    with pytest.raises(ValueError, match="not sorted"):
+        index.update(con)
+
+
+def test_save_load(database, tmp_path):
+    con, filename = database
+    index = TimeIndex.build(con, "data", "SetID", step=2)
+    path = TimeIndex.path(filename)
+    assert path == tmp_path / "test.db.vaeidx"
+    index.save(path)
+
+    index_loaded = TimeIndex.load(path)
+    assert index_loaded.step == 2
+    assert len(index_loaded) == len(index)
+    assert not index_loaded.update(con)
+    assert index_loaded.find_first(con, 2) == 5
+
+    path.write_bytes(b"invalid")
+    with pytest.raises(ValueError, match="Invalid time index file"):
+        TimeIndex.load(path)
+
+
+def test_invalid_step():
+    with pytest.raises(ValueError):
+        TimeIndex("data", "SetID", 0)
+
+
+def test_pridb_time_index(tmp_path):
+    filename = tmp_path / "test.pridb"
+    path = TimeIndex.path(filename)
+
+    def channels(pridb, **kwargs):
+        return [status.channel for status in pridb.iread_status(**kwargs)]
+
+    with vae.io.PriDatabase(filename, mode="rwc") as pridb:
+        pridb.connection().execute(
+            "INSERT INTO ae_params (ID, SetupID, Chan, ADC_µV, ADC_TE, ADC_SS) "
+            "VALUES (1, 1, 1, 1, 1, 1)"
+        )
+        for channel, time in enumerate(TIMES, start=1):
+            pridb.write_status(
+                StatusRecord(time=time, channel=channel, param_id=1, energy=1, rms=1)
+            )
+
+    # ValidSets is updated on close
+    with vae.io.PriDatabase(filename, mode="rw") as pridb:
+        expected = channels(pridb, time_start=1, time_stop=5)
+        assert expected == [2, 3, 4, 5, 6, 7]
+
+        index = pridb.create_time_index(step=2)
+        assert path.exists()
+        assert len(index) == 6
+        assert channels(pridb, time_start=1, time_stop=5) == expected
+
+        # index is only updated and saved if ValidSets changed
+        path.unlink()
+        assert channels(pridb, time_start=9) == []
+        assert not path.exists()
+
+        # records after ValidSets are found without update
+        pridb.create_time_index(step=2)
+        pridb.write_status(StatusRecord(time=10, channel=13, param_id=1, energy=1, rms=1))
+        assert channels(pridb, time_start=9) == [13]
+        assert len(TimeIndex.load(path)) == 6
+
+    # index is used and updated by new instances (read-only)
+    with vae.io.PriDatabase(filename) as pridb:
+        assert pridb._get_time_index() is not None
+        assert channels(pridb, time_start=5, time_stop=9) == [8, 9, 10, 11, 12]
+        assert channels(pridb, time_start=9) == [13]
+    assert len(TimeIndex.load(path)) == 7
+
+
+def test_tradb_time_index(tmp_path):
+    filename = tmp_path / "test.tradb"
+    shutil.copy(SAMPLE_TRADB, filename)
+    with vae.io.TraDatabase(filename) as tradb:
+        expected = [tra.trai for tra in tradb.iread(time_start=3.99278)]
+        tradb.create_time_index(step=1)
+        assert expected
+        assert [tra.trai for tra in tradb.iread(time_start=3.99278)] == expected
+
+
+def test_time_index_not_supported():
+    with (
+        vae.io.TrfDatabase(SAMPLE_TRFDB) as trfdb,
+        pytest.raises(ValueError, match="not supported"),
+    ):
+        trfdb.create_time_index()
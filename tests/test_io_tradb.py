@@ -1,9 +1,12 @@
+import asyncio
+import json
+import pickle
 from pathlib import Path
 
 import numpy as np
 import pytest
 import vallenae as vae
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 from vallenae.io import TraRecord
 from vallenae.io.tradb import _create_time_vector
 
@@ -63,6 +66,18 @@ SIGNAL_TRADB_RAW = DATA_DIR / "signal-raw.tradb"
 SIGNAL_TRADB_FLAC = DATA_DIR / "signal-flac.tradb"
 
 
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(async_iterable):
+    return [item async for item in async_iterable]
+
+
 @pytest.fixture(name="sample_tradb")
 def fixture_sample_tradb() -> vae.io.TraDatabase:
     with vae.io.TraDatabase(SAMPLE_TRADB) as tradb:
@@ -179,11 +194,147 @@ def test_iread_query_filter(sample_tradb):
     assert len(tras) == 1
 
 
+@pytest.mark.parametrize("workers", [1, 4])
+def test_iread_workers(signal_tradb_raw, signal_tradb_flac, workers):
+    for tradb in (signal_tradb_raw, signal_tradb_flac):
+        tras = list(tradb.iread())
+        tras_threaded = list(tradb.iread(workers=workers))
+        assert len(tras_threaded) == len(tras)
+        for i, tra in enumerate(tras):
+            tra_threaded = tras_threaded[i]
+            assert tra_threaded.trai == tra.trai
+            assert_array_equal(tra_threaded.data, tra.data)
+
+
+def test_iread_columns(sample_tradb):
+    tras = list(sample_tradb.iread(columns=["time", "channel", "samples"]))
+    tras_all = list(sample_tradb.iread())
+    assert len(tras) == len(tras_all)
+    for i, tra in enumerate(tras):
+        tra_all = tras_all[i]
+        assert tra.time == tra_all.time
+        assert tra.channel == tra_all.channel
+        assert tra.samples == tra_all.samples
+        assert tra.trai is None
+        assert tra.data is None
+
+    tra = next(iter(sample_tradb.iread(columns=["data"], raw=True)))
+    assert tra.data.dtype == np.int16
+    assert len(tra.data) == tras_all[0].samples
+
+    with pytest.raises(ValueError):
+        sample_tradb.iread(columns=["invalid"])
+
+
+def test_read_columns(sample_tradb):
+    df = sample_tradb.read(columns=["time", "channel", "trai"])
+    assert df.index.name == "trai"
+    assert list(df.columns) == ["time", "channel", "raw"]
+
+
+def test_iread_raw_data(signal_tradb_raw, signal_tradb_flac):
+    for tradb in (signal_tradb_raw, signal_tradb_flac):
+        tras_raw = list(tradb.iread(raw=True))
+        for i, tra in enumerate(tradb.iread()):
+            tra_raw = tras_raw[i]
+            assert tra.factor_millivolts == tra_raw.factor_millivolts
+            assert tra_raw.raw_data is tra_raw.data
+            assert tra_raw.raw_data.dtype == np.int16
+            assert tra.data_volts is tra.data
+            assert tra.data is tra.data  # converted once on first access
+            assert tra_raw.data_volts is tra_raw.data_volts
+            assert_array_equal(tra_raw.data_volts, tra.data)
+            assert tra.raw_data.dtype == np.int16  # stored ADC values
+            assert_array_equal(tra.raw_data, tra_raw.data)
+
+    # modified signals are rounded and clipped to int16 range
+    raw_data_clipped = tra._replace(data=tra.data * 1e6).raw_data
+    assert raw_data_clipped.min() == -32768
+    assert raw_data_clipped.max() == 32767
+
+    tra = next(iter(signal_tradb_raw.iread(columns=["time"], raw=True)))
+    assert tra.raw_data is None
+    assert tra.data_volts is None
+    tra = tra._replace(data=np.zeros(10, dtype=np.int16))
+    with pytest.raises(ValueError):
+        tra.data_volts  # noqa: B018
+
+
+def test_tra_record_tuple(signal_tradb_flac):
+    tra = next(iter(signal_tradb_flac.iread()))
+    # positional unpacking of fields, data in volts
+    *_, data, status, trai, rms, raw = tra
+    assert (status, trai, rms, raw) == (tra.status, tra.trai, tra.rms, False)
+    assert data is tra.data
+    assert data.dtype == np.float32
+    assert tra[7] is tra.data
+    assert tra._asdict()["data"] is tra.data
+
+    tra_copy = pickle.loads(pickle.dumps(tra))
+    assert tra_copy.factor_millivolts == tra.factor_millivolts
+    assert_array_equal(tra_copy.data, tra.data)
+    assert_array_equal(tra_copy.raw_data, tra.raw_data)
+
+    tra_replaced = tra._replace(trai=100)
+    assert tra_replaced.trai == 100
+    assert tra_replaced.data is tra.data
+    assert tra_replaced.raw_data is tra.raw_data
+    assert tra._replace(data=tra.data * 2).factor_millivolts == tra.factor_millivolts
+
+
+@pytest.mark.parametrize("raw", [False, True])
+@pytest.mark.parametrize("batch_size", [1, 3, 10])
+def test_iread_batches(sample_tradb, raw, batch_size):
+    tras = list(sample_tradb.iread(raw=raw))
+    batches = list(sample_tradb.iread_batches(batch_size, raw=raw))
+
+    assert len(batches) == -(-len(tras) // batch_size)  # ceil division
+    assert sum(len(batch.trai) for batch in batches) == len(tras)
+
+    tras_iter = iter(tras)
+    for batch in batches:
+        assert batch.raw == raw
+        assert batch.data.dtype == (np.int16 if raw else np.float32)
+        assert batch.data.shape == (len(batch.trai), max(batch.samples))
+        for i in range(len(batch.trai)):
+            tra = next(tras_iter)
+            assert batch.time[i] == tra.time
+            assert batch.channel[i] == tra.channel
+            assert batch.param_id[i] == tra.param_id
+            assert batch.pretrigger[i] == tra.pretrigger
+            assert batch.threshold[i] == pytest.approx(tra.threshold)
+            assert batch.samplerate[i] == tra.samplerate
+            assert batch.samples[i] == tra.samples
+            assert batch.status[i] == tra.status
+            assert batch.trai[i] == tra.trai
+            assert_array_equal(batch.data[i, : tra.samples], tra.data)
+            assert np.all(batch.data[i, tra.samples :] == 0)  # zero-padded
+
+
+def test_iread_batches_empty(sample_tradb, fresh_tradb):
+    assert list(fresh_tradb.iread_batches()) == []
+    assert list(sample_tradb.iread_batches(time_start=2, time_stop=1)) == []
+    with pytest.raises(ValueError):
+        next(sample_tradb.iread_batches(0))
+
+
 def test_read(sample_tradb):
     df = sample_tradb.read()
 
     assert len(df) == len(TRAS_EXPECTED)
     assert df.index.name == "trai"
+    assert list(df.columns) == [
+        "time",
+        "channel",
+        "param_id",
+        "pretrigger",
+        "threshold",
+        "samplerate",
+        "samples",
+        "data",
+        "status",
+        "raw",
+    ]
 
 
 def test_read_wave_time_axis(sample_tradb):
@@ -215,6 +366,12 @@ def test_read_wave_compare_to_reference_txt(signal_txt, signal_tradb_raw, signal
     assert_allclose(data_txt, data_flac, atol=adc_step, rtol=0)
 
 
+def test_read_continuous_wave_workers(sample_tradb):
+    y, _ = sample_tradb.read_continuous_wave(1, time_axis=False)
+    y_threaded, _ = sample_tradb.read_continuous_wave(1, time_axis=False, workers=2)
+    assert_array_equal(y_threaded, y)
+
+
 @pytest.mark.parametrize("raw", [False, True])
 def test_read_continuous_wave_dtype(sample_tradb, raw):
     y, _ = sample_tradb.read_continuous_wave(1, raw=raw)
@@ -322,6 +479,132 @@ def test_read_continuous_wave(fresh_tradb):
     assert t[0] == pytest.approx(0.0)
 
 
+@pytest.fixture(name="continuous_tradb")
+def fixture_continuous_tradb(fresh_tradb):
+    samplerate = 100
+    # write blocks of 10 samples from t = [0, 1) and t = [2, 3) -> time gap
+    trai = 0
+    for t_start in (0, 2):
+        y = t_start + np.arange(0, 100, dtype=np.float32) / samplerate
+        for data in np.reshape(y, (-1, 10)):
+            trai += 1
+            fresh_tradb.write(
+                TraRecord(
+                    time=data[0],
+                    channel=1,
+                    param_id=1,
+                    pretrigger=0,
+                    threshold=0,
+                    samplerate=samplerate,
+                    samples=10,
+                    data=data,
+                    trai=trai,
+                )
+            )
+    return fresh_tradb
+
+
+@pytest.mark.parametrize(
+    ("time_start", "time_stop"),
+    [(None, None), (2.18, 2.55), (2.13, 2.18), (0.55, 2.4), (-0.1, None), (None, 4)],
+)
+def test_read_continuous_wave_preallocated(continuous_tradb, time_start, time_stop):
+    y, t = continuous_tradb.read_continuous_wave(1, time_start, time_stop, show_progress=False)
+    assert y.base is None  # size estimated correctly, no resize or slicing
+    y_lazy, t_lazy = continuous_tradb.read_continuous_wave(
+        1, time_start, time_stop, lazy_time_axis=True, show_progress=False
+    )
+    assert_array_equal(y_lazy, y)
+    assert isinstance(t_lazy, vae.io.TimeAxis)
+    assert len(t_lazy) == len(t)
+    assert t_lazy.samplerate == 100
+    assert t_lazy[0] == pytest.approx(t[0])
+    assert t_lazy[-1] == pytest.approx(t[-1])
+    assert_array_equal(t_lazy[10:20:3], t[10:20:3])
+    assert_array_equal(np.asarray(t_lazy), t)
+
+
+@pytest.mark.parametrize("chunk_samples", [1, 7, 64, 1000])
+@pytest.mark.parametrize(
+    ("time_start", "time_stop"),
+    [(None, None), (2.18, 2.55), (2.13, 2.18), (0.55, 2.4), (-0.1, None), (None, 4)],
+)
+def test_iread_continuous_wave(continuous_tradb, chunk_samples, time_start, time_stop):
+    y, t = continuous_tradb.read_continuous_wave(1, time_start, time_stop, show_progress=False)
+    chunks = list(
+        continuous_tradb.iread_continuous_wave(
+            1, time_start, time_stop, chunk_samples=chunk_samples, show_progress=False
+        )
+    )
+    assert all(len(chunk.data) == chunk_samples for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1].data) <= chunk_samples
+    assert all(chunk.samplerate == 100 for chunk in chunks)
+    assert all(chunk.data.dtype == np.float32 for chunk in chunks)
+    assert_array_equal(np.concatenate([chunk.data for chunk in chunks]), y)
+    assert [chunk.time for chunk in chunks] == pytest.approx(list(t[::chunk_samples]), abs=1e-5)
+
+
+def test_iread_continuous_wave_raw(continuous_tradb):
+    y, _ = continuous_tradb.read_continuous_wave(1, raw=True, time_axis=False)
+    chunks = list(
+        continuous_tradb.iread_continuous_wave(1, raw=True, chunk_samples=64, show_progress=False)
+    )
+    assert all(chunk.data.dtype == np.int16 for chunk in chunks)
+    assert_array_equal(np.concatenate([chunk.data for chunk in chunks]), y)
+
+
+def test_iread_continuous_wave_empty(fresh_tradb):
+    assert list(fresh_tradb.iread_continuous_wave(1)) == []
+    with pytest.raises(ValueError):
+        next(fresh_tradb.iread_continuous_wave(1, chunk_samples=0))
+
+
+@pytest.mark.parametrize("filename", ["export.npy", "export.bin"])
+@pytest.mark.parametrize(("time_start", "time_stop"), [(None, None), (0.55, 2.4)])
+def test_export_continuous(tmp_path, continuous_tradb, filename, time_start, time_stop):
+    path = tmp_path / filename
+    metadata = continuous_tradb.export_continuous(
+        1, path, time_start, time_stop, show_progress=False
+    )
+    y, t = continuous_tradb.read_continuous_wave(
+        1, time_start, time_stop, raw=True, show_progress=False
+    )
+
+    if path.suffix == ".npy":
+        y_exported = np.load(path, mmap_mode="r")
+        assert isinstance(y_exported, np.memmap)
+        assert metadata["format"] == "npy"
+    else:
+        y_exported = np.memmap(path, dtype="<i2", mode="r")
+        assert metadata["format"] == "binary"
+    assert_array_equal(y_exported, y)
+    assert_array_equal(
+        np.memmap(path, dtype=metadata["dtype"], mode="r", offset=metadata["offset"]), y
+    )
+
+    with open(str(path) + ".json", encoding="utf-8") as file:
+        assert json.load(file) == metadata
+    assert metadata["channel"] == 1
+    assert metadata["samples"] == len(y)
+    assert metadata["samplerate"] == 100
+    assert metadata["time_start"] == pytest.approx(t[0])
+    assert metadata["tr_mV"] == 1
+    y_volts, _ = continuous_tradb.read_continuous_wave(
+        1, time_start, time_stop, time_axis=False, show_progress=False
+    )
+    assert_allclose(y_exported * 1e-3 * metadata["tr_mV"], y_volts, rtol=1e-6)
+
+
+def test_export_continuous_empty(tmp_path, continuous_tradb):
+    # empty channel
+    with pytest.raises(ValueError, match="No transient data"):
+        continuous_tradb.export_continuous(99, tmp_path / "export.npy", show_progress=False)
+    # empty time range
+    with pytest.raises(ValueError, match="No transient data"):
+        continuous_tradb.export_continuous(1, tmp_path / "export.bin", 5, show_progress=False)
+    assert not list(tmp_path.glob("export.*"))
+
+
 def test_listen(sample_tradb):
     assert len(list(sample_tradb.listen())) == 0
     assert len(list(sample_tradb.listen(existing=True))) == 4
@@ -360,3 +643,57 @@ def test_write(fresh_tradb):
 
     fresh_tradb.write(new_tra)
     assert fresh_tradb.rows() == 2  # duplicate TRAI, no exception?
+
+
+def test_write_many(fresh_tradb):
+    def generate_tra(trai):
+        return TraRecord(
+            time=trai,
+            channel=1,
+            param_id=1,
+            pretrigger=0,
+            threshold=1,
+            samplerate=1000,
+            samples=10,
+            data=np.linspace(-1, 1, 10, dtype=np.float32),
+            trai=trai,
+        )
+
+    tras = [generate_tra(trai) for trai in range(1, 11)]
+    assert fresh_tradb.write_many(tras) == 10
+    assert fresh_tradb.rows() == 10
+    assert fresh_tradb.globalinfo()["TRAI"] == 10
+
+    for i, tra_read in enumerate(fresh_tradb.iread()):
+        tra = tras[i]
+        assert tra_read.time == tra.time
+        assert tra_read.trai == tra.trai
+        assert tra_read.threshold == tra.threshold
+        assert_allclose(tra_read.data, tra.data, atol=1e-3)
+
+    # write dataframe
+    df = fresh_tradb.read(trai=[1, 2])
+    df.index += 100
+    assert fresh_tradb.write_many(df) == 2
+    assert [tra.trai for tra in fresh_tradb.iread(trai=[101, 102])] == [101, 102]
+
+    # write raw records
+    tras_raw = list(fresh_tradb.iread(trai=[1, 2], raw=True))
+    assert fresh_tradb.write_many(tra._replace(trai=tra.trai + 200) for tra in tras_raw) == 2
+    tras_read = list(fresh_tradb.iread(trai=[201, 202], raw=True))
+    assert [tra.data.tolist() for tra in tras_read] == [tra.data.tolist() for tra in tras_raw]
+
+
+def test_alisten(sample_tradb):
+    assert run_async(collect(sample_tradb.alisten())) == []
+    records = run_async(collect(sample_tradb.alisten(existing=True, raw=True)))
+    records_expected = list(sample_tradb.listen(existing=True, raw=True))
+    assert [tra.trai for tra in records] == [tra.trai for tra in records_expected]
+    for i, tra in enumerate(records):
+        assert_array_equal(tra.data, records_expected[i].data)
+
+
+def test_airead(sample_tradb):
+    records = run_async(collect(sample_tradb.airead(batch_size=3, channel=[1, 2])))
+    records_expected = list(sample_tradb.iread(channel=[1, 2]))
+    assert [tra.trai for tra in records] == [tra.trai for tra in records_expected]
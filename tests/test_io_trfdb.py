@@ -1,5 +1,9 @@
+import asyncio
+import sqlite3
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 import vallenae as vae
 from vallenae.io import FeatureRecord
@@ -64,6 +68,18 @@ TRFS_EXPECTED = [
 ]
 
 
+def run_async(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(async_iterable):
+    return [item async for item in async_iterable]
+
+
 @pytest.fixture(name="sample_trfdb")
 def fixture_sample_trfdb() -> vae.io.TrfDatabase:
     with vae.io.TrfDatabase(SAMPLE_TRFDB) as trfdb:
@@ -116,6 +132,17 @@ def test_read(sample_trfdb):
     assert df.index.name == "trai"
 
 
+def test_read_columns(sample_trfdb):
+    df = sample_trfdb.read(columns=["FFT_CoG", "PA"])
+
+    assert list(df.columns) == ["FFT_CoG", "PA"]
+    assert len(df) == len(TRFS_EXPECTED)
+    assert df.index.name == "trai"
+
+    with pytest.raises(ValueError, match="Invalid column"):
+        sample_trfdb.read(columns=["PA", "PA FROM trf_data; --"])
+
+
 def test_listen(sample_trfdb):
     assert len(list(sample_trfdb.listen())) == 0
 
@@ -145,3 +172,102 @@ def test_write(fresh_trfdb):
     fresh_trfdb.write(FeatureRecord(trai=1, features={"New": -33.33}))
     assert get_by_trai(0)["New"] is None
     assert get_by_trai(1)["New"] == -33.33
+
+
+def test_write_many(fresh_trfdb):
+    fresh_trfdb.write(FeatureRecord(trai=1, features={"A": 0, "C": 3}))
+
+    count = fresh_trfdb.write_many(
+        [
+            FeatureRecord(trai=1, features={"A": 1, "B": 2}),
+            FeatureRecord(trai=2, features={"A": 11, "B": 22}),
+            FeatureRecord(trai=3, features={"B": "invalid"}),
+        ]
+    )
+    assert count == 3
+    assert fresh_trfdb.rows() == 3
+    assert fresh_trfdb.globalinfo()["ValidSets"] == 3
+
+    records = {record.trai: record.features for record in fresh_trfdb.iread()}
+    assert records[1] == {"A": 1, "C": 3, "B": 2}  # updated, missing columns added
+    assert records[2] == {"A": 11, "C": None, "B": 22}
+    assert records[3] == {"A": None, "C": None, "B": None}
+
+    # write dataframe
+    df = fresh_trfdb.read()
+    df.index += 10
+    assert fresh_trfdb.write_many(df) == 3
+    assert fresh_trfdb.rows() == 6
+
+    assert fresh_trfdb.write_many([]) == 0
+
+
+def test_write_many_partial(fresh_trfdb):
+    fresh_trfdb.write_many(
+        [
+            FeatureRecord(trai=1, features={"A": 1, "B": 2}),
+            FeatureRecord(trai=2, features={"A": 3, "B": 4}),
+        ]
+    )
+    # partial feature sets, mixed columns, new and existing TRAIs
+    fresh_trfdb.write_many(
+        [
+            FeatureRecord(trai=1, features={"C": 5}),
+            FeatureRecord(trai=2, features={"A": 6, "C": None}),
+            FeatureRecord(trai=3, features={"B": 7}),
+            FeatureRecord(trai=3, features={"C": 8}),
+        ]
+    )
+    records = {record.trai: record.features for record in fresh_trfdb.iread()}
+    assert records[1] == {"A": 1, "B": 2, "C": 5}
+    assert records[2] == {"A": 6, "B": 4, "C": None}
+    assert records[3] == {"A": None, "B": 7, "C": 8}
+
+
+def test_write_many_partial_dataframe(fresh_trfdb):
+    fresh_trfdb.write_many(
+        [
+            FeatureRecord(trai=1, features={"A": 1, "B": 2}),
+            FeatureRecord(trai=2, features={"A": 3, "B": 4}),
+        ]
+    )
+    # NaN cells are missing features and must not overwrite existing features
+    df = pd.DataFrame(
+        {"A": [np.nan, 5.0, np.nan], "C": [6.0, np.nan, 7.0]},
+        index=pd.Index([1, 2, 3], name="trai"),
+    )
+    assert fresh_trfdb.write_many(df) == 3
+    records = {record.trai: record.features for record in fresh_trfdb.iread()}
+    assert records[1] == {"A": 1, "B": 2, "C": 6}
+    assert records[2] == {"A": 5, "B": 4, "C": None}
+    assert records[3] == {"A": None, "B": None, "C": 7}
+
+
+def test_write_many_constraint_error(fresh_trfdb):
+    fresh_trfdb.write_many([FeatureRecord(trai=1, features={"A": 1})])
+    fresh_trfdb.connection().execute("CREATE UNIQUE INDEX idx_A ON trf_data (A)")
+    # only conflicts of existing TRAIs are handled, other constraint violations raise
+    with pytest.raises(sqlite3.IntegrityError):
+        fresh_trfdb.write_many(
+            [FeatureRecord(trai=2, features={"A": 2}), FeatureRecord(trai=3, features={"A": 1})]
+        )
+    assert fresh_trfdb.rows() == 1  # rollback
+
+
+def test_background_writer(fresh_trfdb):
+    with fresh_trfdb.background_writer(flush_interval=0) as writer:
+        for trai in range(1, 101):
+            writer.write(FeatureRecord(trai=trai, features={"A": trai}))
+    assert fresh_trfdb.rows() == 100
+    assert fresh_trfdb.read()["A"].tolist() == list(range(1, 101))
+
+
+def test_alisten(sample_trfdb):
+    assert run_async(collect(sample_trfdb.alisten())) == []
+    assert run_async(collect(sample_trfdb.alisten(existing=True))) == list(
+        sample_trfdb.listen(existing=True)
+    )
+
+
+def test_airead(sample_trfdb):
+    assert run_async(collect(sample_trfdb.airead(batch_size=2))) == list(sample_trfdb.iread())
@@ -69,3 +69,148 @@ def test_implementations(waveform, func_numba, func_numpy):
     result_numpy, index_numpy = func_numpy(waveform)
     assert index_numba == index_numpy
     assert_allclose(result_numba, result_numpy, rtol=1e-6, atol=1e-9)
+
+
+BATCH_FUNCTIONS = [
+    (timepicker._hinkley_numba, timepicker._hinkley_numpy, timepicker.hinkley_batch),
+    (timepicker._aic_numba, timepicker._aic_numpy, timepicker.aic_batch),
+    (
+        timepicker._energy_ratio_numba,
+        timepicker._energy_ratio_numpy,
+        timepicker.energy_ratio_batch,
+    ),
+    (
+        timepicker.modified_energy_ratio,
+        timepicker.modified_energy_ratio,
+        timepicker.modified_energy_ratio_batch,
+    ),
+]
+
+
+@pytest.fixture(name="waveform_batch", scope="module")
+def fixture_waveform_batch(waveform) -> np.ndarray:
+    rng = np.random.default_rng(42)
+    noise = rng.normal(scale=1e-6, size=(8, len(waveform))).astype(np.float32)
+    return np.stack([np.roll(waveform, shift) for shift in range(0, 400, 50)]) + noise
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+@pytest.mark.parametrize("functions", BATCH_FUNCTIONS)
+def test_batch(monkeypatch, waveform_batch, use_numba, functions):
+    monkeypatch.setattr(timepicker, "USE_NUMBA", use_numba)
+    monkeypatch.setattr(timepicker.batch, "USE_NUMBA", use_numba)
+    func_numba, func_numpy, func_batch = functions
+    func = func_numba if use_numba else func_numpy
+    expected = [func(row) for row in waveform_batch]
+
+    indices = func_batch(waveform_batch)
+    assert indices.shape == (len(waveform_batch),)
+    assert list(indices) == [index for _, index in expected]
+
+    result, indices = func_batch(waveform_batch, detection_function=True)
+    assert list(indices) == [index for _, index in expected]
+    assert_allclose(result, [result for result, _ in expected], rtol=1e-5)
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+@pytest.mark.parametrize("functions", BATCH_FUNCTIONS)
+def test_batch_lengths(monkeypatch, waveform_batch, use_numba, functions):
+    monkeypatch.setattr(timepicker, "USE_NUMBA", use_numba)
+    monkeypatch.setattr(timepicker.batch, "USE_NUMBA", use_numba)
+    func_numba, func_numpy, func_batch = functions
+    func = func_numba if use_numba else func_numpy
+    lengths = np.array([0, 1, 200, 201, 1000, 2000, 3000, 5000])
+    indices = func_batch(waveform_batch, lengths=lengths)
+    for i, index in enumerate(indices):
+        if index == -1:
+            continue
+        assert index == func(waveform_batch[i, : lengths[i]])[1]
+    assert indices[0] == -1
+    assert all(indices[4:] >= 0)
+
+
+def test_batch_invalid_input(waveform):
+    with pytest.raises(ValueError):
+        timepicker.hinkley_batch(waveform)
+    with pytest.raises(ValueError):
+        timepicker.aic_batch(np.zeros((2, 10)), lengths=[1, 2, 3])
+    with pytest.raises(ValueError):
+        timepicker.energy_ratio_batch(np.zeros((2, 10)), lengths=[1, 11])
+    with pytest.raises(ValueError):
+        timepicker.modified_energy_ratio_batch(np.zeros((2, 10)), win_len=0)
+
+
+def process_chunks(picker, signal: np.ndarray, chunk_size: int):
+    events = []
+    for start in range(0, len(signal), chunk_size):
+        events.extend(picker.process(signal[start : start + chunk_size]))
+    events.extend(picker.flush())
+    return events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1024, 5000])
+@pytest.mark.parametrize(
+    ("func", "picker"),
+    [
+        (timepicker.hinkley, timepicker.StreamingHinkley(alpha=5)),
+        (timepicker.energy_ratio, timepicker.StreamingEnergyRatio(win_len=100)),
+        (timepicker.modified_energy_ratio, timepicker.StreamingModifiedEnergyRatio(win_len=100)),
+    ],
+)
+def test_streaming(waveform, func, picker, chunk_size):
+    result, index = func(waveform)
+    events = process_chunks(picker, waveform, chunk_size)
+    assert len(events) == 1
+    assert events[0].pick == index
+    assert events[0].value == pytest.approx(result[index], rel=1e-5, abs=1e-9)
+    assert events[0].start == 0
+    assert events[0].stop == len(waveform)
+    assert picker.samples == 0  # reset by flush
+
+    # reuse picker
+    assert process_chunks(picker, waveform, chunk_size) == events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 33, 5000])
+@pytest.mark.parametrize(
+    ("func", "picker_class"),
+    [
+        (timepicker.energy_ratio, timepicker.StreamingEnergyRatio),
+        (timepicker.modified_energy_ratio, timepicker.StreamingModifiedEnergyRatio),
+    ],
+)
+def test_streaming_threshold(waveform, func, picker_class, chunk_size):
+    result, _ = func(waveform)
+    threshold = np.percentile(result, 99)
+    picker = picker_class(win_len=100, threshold=threshold)
+    events = process_chunks(picker, waveform, chunk_size)
+    assert len(events) > 0
+
+    above = np.flatnonzero(result >= threshold)
+    assert sum(event.stop - event.start for event in events) == len(above)
+    for event in events:
+        section = result[event.start : event.stop]
+        assert np.all(section >= threshold)
+        assert event.pick == event.start + np.argmax(section)
+        assert event.value == pytest.approx(result[event.pick], rel=1e-5)
+
+
+def test_streaming_pending_event():
+    picker = timepicker.StreamingEnergyRatio(win_len=2, threshold=2)
+    signal = np.array([0.1, 0.1, 0.1, 0.1, 1, 2, 4, 8], dtype=np.float32)
+    assert picker.process(signal) == []
+    events = picker.flush()
+    assert len(events) == 1
+    assert events[0].start == 2
+    assert events[0].stop == 6
+
+
+def test_streaming_invalid_input():
+    with pytest.raises(ValueError):
+        timepicker.StreamingEnergyRatio(win_len=0)
+    with pytest.raises(ValueError):
+        timepicker.StreamingHinkley(alpha=0)
+    with pytest.raises(ValueError):
+        timepicker.StreamingHinkley().process(np.zeros((2, 10)))
+    with pytest.raises(ValueError):
+        timepicker.StreamingModifiedEnergyRatio().process(np.zeros((2, 10)))